@@ -1,22 +1,43 @@
+import sys
+import time
+
+# Start up profile: taken before anything else of this file is imported
+CONFTEST_IMPORT_STARTED = time.perf_counter()
+MODULES_BEFORE_CONFTEST = len(sys.modules)
+
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
 
 import pytest
-from selenium import webdriver
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeServices
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
 
-from tests.data import User
-from pages.login_page import LoginPage
+from constants import base_url_override
+from tests.data import Products, User
+from tool.memory_governor import MemoryGovernor, worker_id
+from tool.retry import FlakeStats, QuarantineLane, RetryPlugin
+from tool.startup import DoctestScope, StartupProfile, process_age
+from tool.visual import visual_checker
+
+# pytester runs the retry engine tests in tests/unit on their own pytest sessions, the fixtures of the
+# asyncio page objects come with pytest_asyncio in their own plugin. Page objects, Selenium and optional
+# features are imported by the hooks and fixtures that use them.
+pytest_plugins = ("pytester", "tool.async_fixtures")
 
 log = logging.getLogger()
 CONFIG = {}
+MEMORY_GOVERNOR_KEY = pytest.StashKey[MemoryGovernor]()
+QUARANTINE_LANE_KEY = pytest.StashKey[QuarantineLane]()
+DOCTEST_SCOPE_KEY = pytest.StashKey[DoctestScope]()
+PREVIOUS_STARTUP_KEY = pytest.StashKey[dict]()
+
+_conftest_import = time.perf_counter() - CONFTEST_IMPORT_STARTED
+_process_age = process_age()
+STARTUP_PROFILE = StartupProfile(
+    interpreter=None if _process_age is None else max(0.0, _process_age - _conftest_import),
+    conftest_import=_conftest_import,
+    modules_imported=len(sys.modules) - MODULES_BEFORE_CONFTEST
+)
 
 # Command line options for pytest
 def pytest_addoption(parser):
@@ -31,7 +52,73 @@ def pytest_addoption(parser):
 
     parser.addoption(
         "--browser", action="store", default="chrome",
-        help="Browser for tests, (e.g., chrome, firefox, edge)"
+        help="Browser for tests, (e.g., chrome, firefox, edge, remote)"
+    )
+
+    parser.addoption(
+        "--remote-url", action="store", default="http://localhost:4444",
+        help="Selenium Grid URL used with --browser remote"
+    )
+
+    parser.addoption(
+        "--remote-browser", action="store", default="chrome",
+        help="Browser requested from the grid with --browser remote, (e.g., chrome, firefox, edge)"
+    )
+
+    parser.addoption(
+        "--remote-pool-size", action="store", type=int, default=4,
+        help="Keep-alive HTTP connections kept open to the grid per browser session"
+    )
+
+    parser.addoption(
+        "--selenium-server-jar", action="store", default=None,
+        help="Start this Selenium server jar in standalone mode on --remote-url as a local stand-in for a grid"
+    )
+
+    parser.addoption(
+        "--lane", action="store", default="main", choices=("main", "quarantine", "all"),
+        help="'main' skips quarantined flaky tests, 'quarantine' runs only them, 'all' runs everything"
+    )
+
+    parser.addoption(
+        "--with-quarantine", action="store_true", default=False,
+        help="Run the quarantine lane in a parallel pytest process, reports go to output/quarantine"
+    )
+
+    parser.addoption(
+        "--visual", action="store_true", default=False,
+        help="Compare visual checkpoints against the baselines"
+    )
+
+    parser.addoption(
+        "--update-baselines", action="store_true", default=False,
+        help="Replace the visual baselines with the screenshots of this run"
+    )
+
+    parser.addoption(
+        "--check-locators", action="store_true", default=False,
+        help="Check and profile every registered locator in the browser against the saved page fixtures"
+    )
+
+    parser.addoption(
+        "--record-impact", action="store_true", default=False,
+        help="Record which page-object methods and locators each test uses, for --changed-since"
+    )
+
+    parser.addoption(
+        "--changed-since", action="store", default=None, metavar="GIT_REF",
+        help="Run only the tests affected by the changes since GIT_REF (full suite when the impact map is stale)"
+    )
+
+    parser.addoption(
+        "--fast-start", action="store_true", default=False,
+        help="Quick local reruns: skip the HTML, Allure and JUnit reports"
+    )
+
+    parser.addoption(
+        "--result-sink", action="store_true", default=False,
+        help="Stream results to results.jsonl next to the HTML report and render the HTML, JUnit and Allure "
+             "reports from it instead of the report plugins"
     )
 
     parser.addoption(
@@ -39,13 +126,38 @@ def pytest_addoption(parser):
         help="Option to run test in headless mode"
     )
 
+    parser.addoption(
+        "--isolation", action="store", default="process", choices=("process", "reuse", "context"),
+        help="Session isolation per test: 'process' starts a new browser for every test, "
+             "'reuse' keeps one browser per worker and wipes cookies/storage between tests, "
+             "'context' opens an isolated browser context (own cookies/storage) in one shared browser"
+    )
+
 # Fixture to load configuration
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     """
     Loads configuration from config.json based on the --env argument and share the global CONFIG dictionary
     :param config:
     :return:
     """
+    STARTUP_PROFILE.start("configure")
+    if config.getoption("--fast-start") or config.getoption("--result-sink"):
+        report_paths = (config.option.htmlpath, config.option.xmlpath, config.option.allure_report_dir)
+        # Runs before the report plugins configure themselves, without a path they stay inactive
+        config.option.htmlpath = None
+        config.option.allure_report_dir = None
+        config.option.xmlpath = None
+        if not config.getoption("--fast-start") and worker_id() == "master":
+            from tool.result_sink import ResultSink
+
+            html_path, junit_path, allure_dir = report_paths
+            results_dir = Path(html_path).parent if html_path else Path(__file__).parent / "output"
+            config.pluginmanager.register(ResultSink(
+                results_dir / "results.jsonl", html_path=html_path, junit_path=junit_path, allure_dir=allure_dir,
+                clean_allure=config.option.clean_alluredir and not config.option.collectonly, suite_name=config.getini("junit_suite_name")
+            ), "result_sink")
+
     env = config.getoption("--env")
     config_path = Path(__file__).parent / "config.json"
     with open(config_path, encoding='utf-8') as config_file:
@@ -62,82 +174,365 @@ def pytest_configure(config):
 
     final_config = {k: v for k, v in config_data.items() if k != 'environments'}
     final_config.update(env_config_data)
+    if base_url_override:
+        final_config['base_url'] = base_url_override
     CONFIG.update(final_config)
 
     # create logs and screenshots path if not existing
     logs_dir = Path(__file__).parent / CONFIG['output_logs']
     logs_dir.mkdir(parents=True, exist_ok=True)
     time_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    new_log_path = logs_dir/ f"test_run_{time_stamp}.log"
+    lane = config.getoption("--lane")
+    lane_suffix = "" if lane == "main" else f"_{lane}"
+    new_log_path = logs_dir/ f"test_run_{time_stamp}{lane_suffix}.log"
     config.option.log_file = str(new_log_path)
 
     screenshot_dir = Path(__file__).parent / CONFIG['output_screenshots']
     screenshot_dir.mkdir(parents=True, exist_ok=True)
 
+    # Memory governor for the long-lived browsers of 'reuse' and 'context' isolation
+    config.stash[MEMORY_GOVERNOR_KEY] = MemoryGovernor(
+        max_tests=CONFIG.get('browser_recycle_after_tests'),
+        max_rss_mb=CONFIG.get('browser_recycle_memory_mb')
+    )
+    memory_dir = lane_output(config, 'output_memory')
+    memory_dir.mkdir(parents=True, exist_ok=True)
+
+    if config.getoption("--browser").lower() == "remote":
+        from tool.remote_grid import RemoteGridPlugin
+
+        remote_grid = RemoteGridPlugin(
+            config.getoption("--remote-url"), lane_output(config, 'output_remote_commands'),
+            pool_size=config.getoption("--remote-pool-size"), server_jar=config.getoption("--selenium-server-jar")
+        )
+        remote_grid.start()
+        config.pluginmanager.register(remote_grid, "remote_grid")
+
+    # Retry failed tests with the env retry settings and keep the flake history for quarantine
+    flake_stats = FlakeStats(
+        Path(__file__).parent / CONFIG['output_flaky_stats'],
+        flaky_rate=CONFIG['quarantine_flaky_rate'],
+        min_runs=CONFIG['quarantine_min_runs']
+    )
+    if lane == "main" and not config.getoption("--with-quarantine"):
+        # Without a quarantine lane next to it, the main lane runs the quarantined tests too, so their history updates
+        lane = "all"
+    config.pluginmanager.register(
+        RetryPlugin(CONFIG['retry_count'], CONFIG['retry_delay'], flake_stats, lane=lane), "retry_engine"
+    )
+
+    browser_name = config.getoption("--browser").lower()
+    if browser_name == "remote":
+        browser_name = config.getoption("--remote-browser").lower()
+    visual_checker.configure(
+        enabled=config.getoption("--visual") or config.getoption("--update-baselines"),
+        update_baselines=config.getoption("--update-baselines"),
+        baseline_dir=Path(__file__).parent / CONFIG['visual_baselines'] / browser_name,
+        diff_dir=Path(__file__).parent / CONFIG['output_visual_diffs'],
+        pixel_tolerance=CONFIG['visual_pixel_tolerance'],
+        max_diff_ratio=CONFIG['visual_max_diff_ratio']
+    )
+
+    if config.getoption("--record-impact"):
+        from tool.impact import ImpactRecorder
+
+        config.pluginmanager.register(
+            ImpactRecorder(Path(__file__).parent / CONFIG['output_impact_map']), "impact_recorder"
+        )
+    if config.getoption("--changed-since"):
+        from tool.impact import ImpactSelector
+
+        config.pluginmanager.register(
+            ImpactSelector(Path(__file__).parent / CONFIG['output_impact_map'], config.getoption("--changed-since")),
+            "impact_selector"
+        )
+
+    # Locator declarations are checked after collection, quick reruns skip it unless they profile
+    if config.getoption("--check-locators") or not config.getoption("--fast-start"):
+        from tool.locator_registry import LocatorCheckPlugin
+        from tool.scenarios import catalog
+
+        profile = config.getoption("--check-locators")
+        config.pluginmanager.register(LocatorCheckPlugin(
+            catalog(Products).values(),
+            fixture_dir=Path(__file__).parent / CONFIG['locator_fixtures'] if profile else None,
+            report_path=Path(__file__).parent / CONFIG['output_locator_profile'],
+            start_browser=lambda: start_browser(config), credentials=User.STANDARD_USER
+        ), "locator_check")
+
+    if config.getoption("doctestmodules"):
+        config.stash[DOCTEST_SCOPE_KEY] = DoctestScope(lane_output(config, 'output_doctest_scope'))
+
+    if worker_id() == "master":
+        # Per worker reports of a previous run must not end up in this run summary
+        for old_report in memory_dir.glob("*.json"):
+            old_report.unlink()
+    STARTUP_PROFILE.stop("configure")
+
+
+def lane_output(config, key):
+    """
+    Path of the CONFIG output `key` for this run. Other lanes than 'main' get their own file or folder
+    (e.g. output/startup_quarantine.json), the quarantine lane runs next to the main run.
+    :param config: pytest config
+    :param key: CONFIG key of an output path
+    :return: Path
+    """
+    path = Path(__file__).parent / CONFIG[key]
+    lane = config.getoption("--lane")
+    if lane == "main":
+        return path
+    return path.with_name(f"{path.stem}_{lane}{path.suffix}")
+
+
+def start_browser(config, enable_bidi=False):
+    """
+    Starts a browser process for the --browser/--headless options
+    :param config: pytest config
+    :param enable_bidi: open a WebDriver BiDi connection
+    :return: WebDriver
+    """
+    from tool.driver_factory import create_driver, create_remote_driver, UnsupportedBrowserError
+
+    browser_name = config.getoption("--browser").lower()
+    headless = config.getoption("--headless")
+    try:
+        if browser_name == "remote":
+            connection = config.pluginmanager.get_plugin("remote_grid").new_connection(
+                timeout=CONFIG['page_load_time_out'] * 6)
+            web_driver = create_remote_driver(connection, config.getoption("--remote-browser").lower(),
+                                              headless=headless, enable_bidi=enable_bidi)
+        else:
+            web_driver = create_driver(browser_name, headless=headless, enable_bidi=enable_bidi)
+    except UnsupportedBrowserError as exc:
+        raise pytest.UsageError(str(exc)) from exc
+
+    # Set a consistent window size for all tests
+    web_driver.maximize_window()
+    web_driver.delete_all_cookies()
+    return web_driver
+
+
+@pytest.fixture(scope="session")
+def browser_host(request):
+    """
+    Long-lived browser of this worker, used with --isolation=reuse and --isolation=context
+    """
+    from tool.browser_host import BrowserHost
+
+    host = BrowserHost(
+        start_browser=lambda enable_bidi: start_browser(request.config, enable_bidi=enable_bidi),
+        isolation=request.config.getoption("--isolation"),
+        governor=request.config.stash[MEMORY_GOVERNOR_KEY],
+        base_url=CONFIG['base_url']
+    )
+
+    yield host
+
+    host.close()
+
+
+@pytest.fixture(scope="function")
+def reuse_host(request):
+    """
+    A browser host in 'reuse' mode whatever --isolation is, for tests of the reset between two tests
+    """
+    from tool.browser_host import BrowserHost
+
+    host = BrowserHost(
+        start_browser=lambda enable_bidi: start_browser(request.config, enable_bidi=enable_bidi),
+        isolation="reuse",
+        governor=MemoryGovernor(),
+        base_url=CONFIG['base_url']
+    )
+
+    yield host
+
+    host.close()
+
 
 @pytest.fixture(scope="function")
 def driver(request):
     browser_name = request.config.getoption("--browser").lower()
     env_name = request.config.getoption("--env").lower()
     headless = request.config.getoption("--headless")
+    isolation = request.config.getoption("--isolation")
     base_url = CONFIG['base_url']
 
     log.info("--"*50)
-    log.info(f"Test environment: {env_name.upper()}, Browser: {browser_name.capitalize()}, Headless: {headless}, URL: {base_url}")
+    log.info(f"Test environment: {env_name.upper()}, Browser: {browser_name.capitalize()}, Headless: {headless}, "
+             f"Isolation: {isolation}, URL: {base_url}")
     log.info("--"*50)
 
-    if browser_name == "chrome":
-        chrome_options = ChromeOptions()
-        driver_path = ChromeDriverManager().install()
-        log.debug(f"ChromeDriver: {driver_path}")
-        services = ChromeServices(executable_path=driver_path)
-
-        chrome_options.add_argument("--no-sandbox")
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # --- Options to Make Automation Less Detectable ---
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        # --- Preferences to Disable Pop-ups and Warnings ---
-        prefs = {
-            "credentials_enable_service": False,
-            "password_manager_enabled": False,
-            "profile.password_manager_leak_detection": False,
-            "devtools.preferences.selfXssWarning": "false",
-            "profile.default_content_setting_values.notifications": 1  # 1=Allow, 2=Block
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
-        web_driver = webdriver.Chrome(service=services, options=chrome_options)
-    elif browser_name == "firefox":
-        firefox_options = FirefoxOptions()
-        if headless:
-            firefox_options.add_argument("--headless")
-        firefox_options.add_argument("--width=1920")
-        firefox_options.add_argument("--height=1080")
-        web_driver = webdriver.Firefox(options=firefox_options)
-    elif browser_name == "edge":
-        edge_options = EdgeOptions()
-        if headless:
-            edge_options.add_argument("--headless")
-        edge_options.add_argument("--window-size=1920,1080")
-        web_driver = webdriver.Edge(options=edge_options)
+    if isolation == "process":
+        web_driver = start_browser(request.config)
     else:
-        raise pytest.UsageError(f"Unsupported browser: '{browser_name}'. "
-                                "Supported browsers: chrome, firefox, edge")
-
-    # Set a consistent window size for all tests
-    web_driver.maximize_window()
-    web_driver.delete_all_cookies()
+        host = request.getfixturevalue("browser_host")
+        web_driver = host.acquire()
 
     yield web_driver
 
     # --- Teardown Phase ---
-    if web_driver is not None:
+    if web_driver is None:
+        return
+    if isolation == "process":
+        request.config.stash[MEMORY_GOVERNOR_KEY].sample(web_driver)
         log.info("Closing browser session...")
         web_driver.quit()
+    else:
+        log.info("Releasing browser session...")
+        host.release(web_driver)
+
+
+@pytest.fixture(scope="function")
+def new_session(request):
+    """
+    Factory for extra independent browser sessions inside one test (e.g. a second user).
+    Each call returns a session with its own cookies and storage, closed at teardown.
+    """
+    from tool.browser_context import BrowserContextError
+
+    sessions = []
+
+    def _new_session():
+        if request.config.getoption("--isolation") == "context":
+            session = request.getfixturevalue("browser_host").new_context()
+        else:
+            session = start_browser(request.config)
+        sessions.append(session)
+        return session
+
+    yield _new_session
+
+    for session in sessions:
+        try:
+            session.quit()
+        except BrowserContextError as e:
+            # The shared browser is gone, releasing the `driver` session recycles it
+            log.error(f"Could not close extra session: {e}")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_collect_file(file_path, parent):
+    """
+    Drops the --doctest-modules collector of modules without doctests, so they are neither imported nor searched
+    """
+    collectors = yield
+    scope = parent.config.stash.get(DOCTEST_SCOPE_KEY, None)
+    if scope is None or file_path.suffix != ".py":
+        return collectors
+    from _pytest.doctest import DoctestModule
+
+    return [collector for collector in collectors
+            if not isinstance(collector, DoctestModule) or scope.has_doctests(file_path)]
+
+
+def pytest_collection(session):
+    STARTUP_PROFILE.start("collection")
+
+
+def pytest_collection_finish(session):
+    STARTUP_PROFILE.collected = len(session.items)
+    STARTUP_PROFILE.stop("collection")
+    STARTUP_PROFILE.start("first_test")
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    if config.getoption("--with-quarantine") and config.getoption("--lane") == "main" and worker_id() == "master":
+        lane = QuarantineLane(config.invocation_params.args, Path(__file__).parent / CONFIG['output_quarantine'])
+        lane.start()
+        config.stash[QUARANTINE_LANE_KEY] = lane
+
+
+def pytest_runtest_logstart():
+    STARTUP_PROFILE.stop("first_test")
+
+
+def pytest_sessionfinish(session):
+    """
+    Keeps the quarantine lane from failing the build, saves the start up profile and doctest scope and
+    writes the memory summary of this worker, the controller collects all of them in the terminal summary
+    """
+    if session.config.getoption("--lane") == "quarantine" and session.exitstatus in (
+            pytest.ExitCode.TESTS_FAILED, pytest.ExitCode.NO_TESTS_COLLECTED):
+        # Quarantined tests are reported but never fail the build
+        session.exitstatus = pytest.ExitCode.OK
+
+    scope = session.config.stash.get(DOCTEST_SCOPE_KEY, None)
+    if scope is not None:
+        scope.save()
+    if worker_id() == "master":
+        previous = STARTUP_PROFILE.write(lane_output(session.config, 'output_startup'))
+        session.config.stash[PREVIOUS_STARTUP_KEY] = previous or {}
+
+    summary = session.config.stash[MEMORY_GOVERNOR_KEY].summary()
+    if not summary["samples"]:
+        return
+    memory_dir = lane_output(session.config, 'output_memory')
+    with open(memory_dir / f"{worker_id()}.json", "w", encoding="utf-8") as memory_file:
+        json.dump(summary, memory_file)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Reports peak and average browser/driver memory per worker, the element cache hit rates and the
+    start up time of the run. Optional features report in the summary of their own plugin.
+    """
+    previous = terminalreporter.config.stash.get(PREVIOUS_STARTUP_KEY, None)
+    if previous is not None:
+        terminalreporter.section("startup")
+        scope = terminalreporter.config.stash.get(DOCTEST_SCOPE_KEY, None)
+        details = {
+            "conftest_import": f"{STARTUP_PROFILE.modules_imported} modules",
+            "collection": f"{STARTUP_PROFILE.collected} items",
+        }
+        if scope is not None:
+            details["collection"] += (f", doctests searched in {scope.scanned + scope.cached - scope.skipped} "
+                                      f"of {scope.scanned + scope.cached} modules ({scope.cached} answers cached)")
+        rows = [(phase, STARTUP_PROFILE.phases.get(phase), previous.get("phases", {}).get(phase))
+                for phase in StartupProfile.PHASES]
+        rows.append(("total", STARTUP_PROFILE.total(), previous.get("total")))
+        for phase, seconds, previous_seconds in rows:
+            if seconds is None:
+                continue
+            delta = "" if previous_seconds is None else f"{(seconds - previous_seconds) * 1000:+7.0f} ms vs last run"
+            line = f"{phase:<16} {seconds * 1000:8.0f} ms  {delta:<22} {details.get(phase, '')}"
+            terminalreporter.write_line(line.rstrip())
+
+    lane = terminalreporter.config.stash.get(QUARANTINE_LANE_KEY, None)
+    if lane is not None:
+        terminalreporter.section("quarantine lane")
+        exit_code = lane.wait()
+        terminalreporter.write_line(f"Quarantine lane finished with exit code {exit_code}, "
+                                    f"reports in {lane.output_dir}")
+
+    # Only runs that imported the page objects have element cache statistics
+    base_page = sys.modules.get("pages.base_page")
+    if base_page is not None and base_page.ELEMENT_CACHE_STATS:
+        terminalreporter.section("element cache")
+        for page_name, counts in sorted(base_page.ELEMENT_CACHE_STATS.items()):
+            lookups = counts["hits"] + counts["misses"]
+            hit_rate = counts["hits"] / lookups if lookups else 0.0
+            terminalreporter.write_line(
+                f"{page_name:<22} {lookups:>6} lookups  hit rate {hit_rate:6.1%}  "
+                f"{counts['stale']} stale, {counts['invalidations']} invalidations"
+            )
+
+    memory_dir = lane_output(terminalreporter.config, 'output_memory')
+    reports = sorted(memory_dir.glob("*.json"))
+    if not reports:
+        return
+    terminalreporter.section("browser memory")
+    for report in reports:
+        with open(report, encoding="utf-8") as memory_file:
+            summary = json.load(memory_file)
+        terminalreporter.write_line(
+            f"{report.stem}: peak {summary['total_peak_mb']} MB "
+            f"(driver {summary['driver_peak_mb']} MB, browser {summary['browser_peak_mb']} MB), "
+            f"avg {summary['total_avg_mb']} MB over {summary['samples']} tests, "
+            f"{summary['recycles']} recycles"
+        )
 
 
 # Function to capture test report and take screenshot on failure
@@ -155,16 +550,22 @@ def pytest_runtest_makereport(item):
 
     if report.when == "call" and report.failed:
         log.error(f"Test '{item.name}' failed. Taking screenshot...")
+        from selenium.webdriver.remote.webdriver import WebDriver
+        from tool.browser_context import IsolatedContext
+
         #get driver instance to capture screenshot
         driver_inst = None
         for fixture_value in item.funcargs.values():
-            if isinstance(fixture_value, WebDriver):
+            if isinstance(fixture_value, (WebDriver, IsolatedContext)):
                 driver_inst = fixture_value
                 break
         if driver_inst:
             try:
                 screenshot_name = f"FAIL_{item.name}"
-                take_screenshot(driver=driver_inst, name=screenshot_name)
+                screenshot_path = take_screenshot(driver=driver_inst, name=screenshot_name)
+                if screenshot_path is not None:
+                    # Artifact reference for the result sink, a property in the JUnit xml
+                    report.user_properties.append(("screenshot", str(screenshot_path)))
             except (IOError, OSError, RuntimeError) as e:
                 log.error(f"Could not take screenshot on failed test '{item.name}': {e}")
 
@@ -173,7 +574,7 @@ def take_screenshot(driver, name: str = None):
     Take screenshot with specific name
     :param driver:
     :param name:
-    :return:
+    :return: screenshot path, None when it could not be taken
     """
     time_stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     file_path = Path(__file__).parent / CONFIG['output_screenshots'] / f"{name}_{time_stamp}.png"
@@ -182,8 +583,10 @@ def take_screenshot(driver, name: str = None):
     try:
         driver.save_screenshot(str(file_path))
         log.info(f"Screenshot captured at: {file_path}")
+        return file_path
     except Exception as e:
         log.error(f"Failed to capture screenshot for '{name}': {e}")
+        return None
 
 # Function for test logger
 @pytest.fixture(scope="function", autouse=True)
@@ -227,6 +630,8 @@ def test_logger(request):
 @pytest.fixture(scope="function")
 def login_page(driver):
     """Provides a LoginPage object for tests."""
+    from pages.login_page import LoginPage
+
     page = LoginPage(driver)
     page.go_to_login_page()
     logging.info("Navigated to login page")  # Log navigation
@@ -239,6 +644,8 @@ def logged_in_page(driver):
     Fixture to ensure a user is logged in before the test.
     Returns an InventoryPage object.
     """
+    from pages.login_page import LoginPage
+
     login_pg = LoginPage(driver)
     login_pg.go_to_login_page()
     # Ensure login method returns InventoryPage
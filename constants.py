@@ -1,5 +1,9 @@
+import os
 
-base_url = "https://www.saucedemo.com/"
+# SAUCEDEMO_BASE_URL points the page objects and conftest's CONFIG['base_url'] at another deployment,
+# e.g. a local stand-in for load runs
+base_url_override = os.environ.get("SAUCEDEMO_BASE_URL")
+base_url = base_url_override or "https://www.saucedemo.com/"
 class Urls:
     LOGIN_URL = base_url
     INVENTORY_URL = base_url + "inventory.html"
@@ -0,0 +1,141 @@
+# pages/aio/base_page.py
+import asyncio
+import logging
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as exp
+
+from pages.base_page import BasePage
+from tool.async_driver import AsyncWait
+from tool.visual import visual_checker
+
+log = logging.getLogger(__name__)
+
+
+def _copy_locators(cls, sync_page):
+    """Takes over the locators of the sync page class and its bases, unless cls declares its own"""
+    declared = set(vars(cls))
+    for owner in reversed(sync_page.__mro__):
+        for name, value in vars(owner).items():
+            if name.isupper() and isinstance(value, tuple) and name not in declared:
+                setattr(cls, name, value)
+
+
+class AsyncBasePage:
+    """
+    asyncio variant of BasePage, driven by a tool.async_driver.AsyncDriver.
+    Subclasses name their sync page class, e.g. `class AsyncLoginPage(AsyncBasePage, sync_page=LoginPage)`,
+    and share its locators so both variants always look for the same elements.
+    """
+
+    def __init_subclass__(cls, sync_page=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if sync_page is not None:
+            _copy_locators(cls, sync_page)
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.wait = AsyncWait(driver, 10)  # Explicit wait with 10-second timeout
+
+    #############################################
+    #   Common Selenium actions
+    #############################################
+    async def go_to_url(self, url):
+        await self.driver.get(url)
+
+    async def get_current_url(self):
+        return await self.driver.current_url()
+
+    async def get_element_text(self, locator):
+        element = await self.wait.until(exp.visibility_of_element_located(locator))
+        return await element.text()
+
+    async def click_element(self, locator):
+        """
+        Waits for an element to be visible, then clickable, and then clicks it.
+        """
+        try:
+            # First, wait for presence
+            await self.wait.until(exp.presence_of_element_located(locator))
+            # Then, wait for clickability
+            element = await self.wait.until(exp.element_to_be_clickable(locator))
+            await element.click()
+            log.info(f"Element {locator} clicked")
+        except Exception as e:
+            log.error(f"Error clicking element with locator {locator}: {e}")
+            raise
+
+    async def type_into_element(self, locator, text):
+        element = await self.wait.until(exp.visibility_of_element_located(locator))
+        await element.clear()
+        await element.send_keys(text)
+        log.info(f"'{text}' entered to element {locator}")
+
+    async def is_element_present(self, locator):
+        try:
+            await self.wait.until(exp.presence_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+
+    async def is_element_visible(self, locator):
+        try:
+            await self.wait.until(exp.visibility_of_element_located(locator))
+            return True
+        except TimeoutException:
+            return False
+
+    async def verify_visual_checkpoint(self, name, locator=None, masks=()):
+        """
+        Compares the page, or the element of `locator`, with its visual baseline. No-op unless --visual is given.
+        :param name: checkpoint name, unique per screen state
+        :param locator: element to capture, whole viewport when None
+        :param masks: locators of regions to ignore, e.g. dates or animations
+        """
+        if not visual_checker.enabled:
+            return None
+        if locator is None:
+            png = await self.driver.get_screenshot_as_png()
+        else:
+            element = await self.wait.until(exp.visibility_of_element_located(locator))
+            png = await element.screenshot_as_png()
+
+        regions = []
+        if masks:
+            # Element rects are in CSS pixels relative to the document, screenshots in device pixels
+            scale, scroll_x, scroll_y = await self.driver.execute_script(
+                "return [window.devicePixelRatio || 1, window.scrollX, window.scrollY];")
+            if locator is None:
+                origin_x, origin_y = scroll_x, scroll_y
+            else:
+                rect = await element.rect()
+                origin_x, origin_y = rect["x"], rect["y"]
+            for mask in masks:
+                for masked in await self.driver.find_elements(*mask):
+                    rect = await masked.rect()
+                    regions.append(((rect["x"] - origin_x) * scale, (rect["y"] - origin_y) * scale,
+                                    rect["width"] * scale, rect["height"] * scale))
+
+        # Image decoding and diffing is CPU bound, keep it off the event loop
+        result = await asyncio.to_thread(visual_checker.check, png, name, regions)
+        assert result.passed, \
+            f"Visual checkpoint '{name}' differs from baseline ({result.diff_ratio:.2%}), see {result.diff_path}"
+        return result
+
+    #############################################
+    #   Common actions shared across pages
+    #############################################
+    async def open_hamburger_menu(self):
+        await self.click_element(self.BURGER_BUTTON)
+        await self.wait.until(exp.visibility_of_element_located(self.BURGER_MENU_CLOSE_BUTTON))
+
+    async def close_hamburger_menu(self):
+        await self.click_element(self.BURGER_MENU_CLOSE_BUTTON)
+        await self.wait.until(exp.invisibility_of_element_located(self.BURGER_MENU_CLOSE_BUTTON))
+
+    async def logout(self):
+        await self.open_hamburger_menu()
+        await self.click_element(self.LOGOUT_LINK_LOCATOR)
+
+
+_copy_locators(AsyncBasePage, BasePage)
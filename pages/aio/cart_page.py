@@ -0,0 +1,36 @@
+# pages/aio/cart_page.py
+from selenium.webdriver.support import expected_conditions as exp
+
+from constants import Urls
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.checkout_page import AsyncCheckoutInfoPage
+from pages.cart_page import CartPage
+from tool.locator_registry import product_locators
+
+class AsyncCartPage(AsyncBasePage, sync_page=CartPage):
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.url = Urls.CART_URL
+
+    async def go_to_cart_page(self):
+        await self.go_to_url(self.url)
+        await self.wait.until(exp.visibility_of_element_located(self.PAGE_TITLE))
+
+    async def get_cart_item_names(self):
+        item_name_elements = await self.driver.find_elements(*self.INVENTORY_ITEM_NAME)
+        return [await elem.text() for elem in item_name_elements]
+
+    async def get_cart_item_count(self):
+        return len(await self.driver.find_elements(*self.CART_ITEM))
+
+    async def remove_product_from_cart(self, product_name):
+        await self.click_element(product_locators(product_name).remove_button)
+
+    async def click_checkout(self):
+        await self.click_element(self.CHECKOUT_BUTTON)
+        return AsyncCheckoutInfoPage(self.driver)
+
+    async def click_continue_shopping(self):
+        await self.click_element(self.CONTINUE_SHOPPING_BUTTON)
+        # This will navigate back to inventory
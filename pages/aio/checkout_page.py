@@ -0,0 +1,88 @@
+# pages/aio/checkout_page.py
+import logging
+
+from constants import Urls
+from pages.aio.base_page import AsyncBasePage
+from pages.checkout_page import CheckoutCompletePage, CheckoutInfoPage, CheckoutOverviewPage
+
+logger = logging.getLogger(__name__)
+
+class AsyncCheckoutInfoPage(AsyncBasePage, sync_page=CheckoutInfoPage):
+
+     def __init__(self, driver):
+         super().__init__(driver)
+         self.url = Urls.CHECKOUT_STEP_ONE_URL
+
+     async def fill_your_information(self, first_name, last_name, zip_code):
+         await self.type_into_element(self.FIRST_NAME_FIELD, first_name)
+         await self.type_into_element(self.LAST_NAME_FIELD, last_name)
+         await self.type_into_element(self.ZIP_POSTAL_CODE_FIELD, zip_code)
+
+     async def click_continue(self):
+         await self.click_element(self.CONTINUE_BUTTON)
+         if await self.get_current_url() == Urls.CHECKOUT_STEP_TWO_URL:
+            return AsyncCheckoutOverviewPage(self.driver)
+         return None # In case of validation error
+
+     async def click_cancel(self):
+        await self.click_element(self.CANCEL_BUTTON)
+        # Returns to inventory page
+
+     async def get_error_message(self):
+        return await self.get_element_text(self.ERROR_MESSAGE_LOCATOR)
+
+     async def is_error_message_visible(self):
+        return await self.is_element_visible(self.ERROR_MESSAGE_LOCATOR)
+
+
+class AsyncCheckoutOverviewPage(AsyncBasePage, sync_page=CheckoutOverviewPage):
+
+     def __init__(self, driver):
+         super().__init__(driver)
+         self.url = Urls.CHECKOUT_STEP_TWO_URL
+
+     async def get_item_total(self):
+        text = await self.get_element_text(self.ITEM_TOTAL_LABEL)
+        return float(text.replace("Item total: $", ""))
+
+     async def get_tax(self):
+         text = await self.get_element_text(self.TAX_LABEL)
+         return float(text.replace("Tax: $", ""))
+
+     async def get_total(self):
+         text = await self.get_element_text(self.TOTAL_LABEL)
+         return float(text.replace("Total: $", ""))
+
+     async def get_item_details(self):
+         item_details = []
+         items = await self.driver.find_elements(*self.CART_ITEM_LABELS)
+         for item in items:
+             name = await (await item.find_element(*self.INVENTORY_ITEM_NAME)).text()
+             price = float((await (await item.find_element(*self.INVENTORY_ITEM_PRICE)).text()).replace('$', ''))
+             logger.info(f"Product name: {name}, price: {price}")
+             item_details.append({"name": name, "price": price})
+         return item_details
+
+     async def click_finish(self):
+         await self.click_element(self.FINISH_BUTTON)
+         return AsyncCheckoutCompletePage(self.driver)
+
+     async def click_cancel(self):
+         await self.click_element(self.CANCEL_BUTTON)
+         # Returns to inventory page
+
+class AsyncCheckoutCompletePage(AsyncBasePage, sync_page=CheckoutCompletePage):
+
+     def __init__(self, driver):
+         super().__init__(driver)
+         self.url = Urls.CHECKOUT_COMPLETE_URL
+
+     async def get_complete_header_text(self):
+        return await self.get_element_text(self.COMPLETE_HEADER)
+
+     async def get_complete_text_message(self):
+        return await self.get_element_text(self.COMPLETE_TEXT)
+
+     async def click_back_home(self):
+        await self.click_element(self.BACK_TO_PRODUCTS_BUTTON)
+        # Returns to inventory page
@@ -0,0 +1,101 @@
+# pages/aio/inventory_page.py
+import asyncio
+import logging
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as exp
+from selenium.webdriver.support.ui import Select
+
+from constants import Urls
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.product_detail_page import AsyncProductDetailPage
+from pages.inventory_page import InventoryPage
+from tool.locator_registry import product_locators
+
+log = logging.getLogger(__name__)
+
+
+class AsyncInventoryPage(AsyncBasePage, sync_page=InventoryPage):
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.url = Urls.INVENTORY_URL
+
+    async def go_to_inventory_page(self):
+        await self.go_to_url(self.url)
+        # Ensure product title is visible before process
+        await self.wait.until(exp.visibility_of_element_located(self.PAGE_TITLE))
+
+    async def get_page_title(self):
+        return await self.get_element_text(self.PAGE_TITLE)
+
+    async def get_burger_items(self):
+        await self.click_element(self.BURGER_BUTTON)
+        items = [await item.text() for item in await self.driver.find_elements(*self.BURGER_ITEMS)]
+        log.info(f"List of actual Burger Menu Items: {items}")
+        return items
+
+    async def sort_products_by(self, sort_option_value):
+        """
+        Sorts products using the dropdown.
+        Possible values: 'az', 'za', 'lohi', 'hilo'
+        """
+        sort_dropdown_element = await self.wait.until(exp.visibility_of_element_located(self.SORT_DROPDOWN))
+        await self.driver.run(lambda: Select(sort_dropdown_element.wrapped_element).select_by_value(sort_option_value))
+
+    async def get_product_names(self):
+        name_elements = await self.wait.until(exp.presence_of_all_elements_located(self.INVENTORY_ITEM_NAME))
+        return [await element.text() for element in name_elements]
+
+    async def get_product_prices(self):
+        price_elements = await self.wait.until(exp.presence_of_all_elements_located(self.INVENTORY_ITEM_PRICE))
+        return [float((await element.text()).replace('$', '')) for element in price_elements]
+
+    async def add_product_to_cart(self, product_name):
+        """
+        Finds and clicks the "Add to cart" button for a given product name.
+        """
+        await self.click_element(product_locators(product_name).add_button)
+
+    async def remove_product_from_cart(self, product_name):
+        await self.click_element(product_locators(product_name).remove_button)
+
+    async def get_product_button_text(self, product_name):
+        for locator in (product_locators(product_name).add_button, product_locators(product_name).remove_button):
+            try:
+                return await (await self.wait.until(exp.visibility_of_element_located(locator))).text()
+            except TimeoutException:
+                continue
+        return None  # No button is visible
+
+    async def click_product_name(self, product_name):
+        """
+        Clicks on the product name link to navigate to the product detail page.
+        """
+        product_name_locator = product_locators(product_name).name_link
+
+        for i in range(3):
+            if await self.is_element_present(product_name_locator):
+                await self.click_element(product_name_locator)
+                break
+            log.info(product_name + f" is not clickable or not present after {i}s")
+            await asyncio.sleep(1)
+
+        return AsyncProductDetailPage(self.driver)
+
+    async def get_cart_count(self):
+        try:
+            cart_badge = await self.wait.until(exp.visibility_of_element_located(self.CART_BADGE_LOCATOR))
+            return int(await cart_badge.text())
+        except TimeoutException:
+            return 0  # Cart is empty
+        except ValueError:
+            return 0  # In case text is not a number
+
+    async def click_cart_icon(self):
+        await self.click_element(self.CART_ICON_LOCATOR)
+
+    async def navigate_to_cart(self):
+        await self.click_element(self.CART_ICON_LOCATOR)
+        return AsyncCartPage(self.driver)
@@ -0,0 +1,48 @@
+# pages/aio/login_page.py
+import logging
+
+from constants import Urls
+from pages.aio.base_page import AsyncBasePage
+from pages.login_page import LoginPage
+
+log = logging.getLogger(__name__)
+
+class AsyncLoginPage(AsyncBasePage, sync_page=LoginPage):
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.url = Urls.LOGIN_URL
+
+    async def go_to_login_page(self):
+        await self.go_to_url(self.url)
+
+    async def enter_username(self, username):
+        await self.type_into_element(self.USERNAME_FIELD, username)
+
+    async def enter_password(self, password):
+        await self.type_into_element(self.PASSWORD_FIELD, password)
+
+    async def click_login_button(self):
+        await self.click_element(self.LOGIN_BUTTON)
+
+    async def login(self, username, password):
+        from pages.aio.inventory_page import AsyncInventoryPage
+        await self.enter_username(username)
+        await self.enter_password(password)
+        await self.click_login_button()
+        if await self.get_current_url() == Urls.INVENTORY_URL:
+            return AsyncInventoryPage(self.driver)
+        return None  # login failed
+
+    async def get_error_message(self):
+        return await self.get_element_text(self.ERROR_MESSAGE_LOCATOR)
+
+    async def verify_error_message(self, expected_message):
+        error_msg = await self.get_error_message()
+        assert error_msg == expected_message, f"Expected error '{expected_message}' but got '{error_msg}'"
+
+    async def verify_on_login_page(self):
+        current_url = await self.get_current_url()
+        assert current_url == self.url, \
+            f"Expected to be on login page ({self.url}), but got {current_url}"
+        assert await self.is_element_visible(self.LOGIN_BUTTON), "Login button not visible on login page."
@@ -0,0 +1,35 @@
+# pages/aio/product_detail_page.py
+from pages.aio.base_page import AsyncBasePage
+from pages.product_detail_page import ProductDetailPage
+
+class AsyncProductDetailPage(AsyncBasePage, sync_page=ProductDetailPage):
+
+    def __init__(self, driver):
+        super().__init__(driver)
+
+    async def get_product_name(self):
+        return await self.get_element_text(self.PRODUCT_NAME)
+
+    async def get_product_description(self):
+        return await self.get_element_text(self.PRODUCT_DESCRIPTION)
+
+    async def get_product_price(self):
+        price_text = await self.get_element_text(self.PRODUCT_PRICE)
+        return float(price_text.replace('$', ''))
+
+    async def click_add_to_cart(self):
+        await self.click_element(self.ADD_TO_CART_BUTTON)
+
+    async def click_remove_from_cart(self):
+        await self.click_element(self.REMOVE_FROM_CART_BUTTON)
+
+    async def click_back_to_products(self):
+        from pages.aio.inventory_page import AsyncInventoryPage
+        await self.click_element(self.BACK_TO_PRODUCTS_BUTTON)
+        return AsyncInventoryPage(self.driver)
+
+    async def is_add_to_cart_button_visible(self):
+        return await self.is_element_visible(self.ADD_TO_CART_BUTTON)
+
+    async def is_remove_from_cart_button_visible(self):
+        return await self.is_element_visible(self.REMOVE_FROM_CART_BUTTON)
@@ -1,17 +1,38 @@
 # pages/base_page.py
+import functools
 import logging
+from collections import Counter, defaultdict
 
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.support import expected_conditions as exp
 from selenium.webdriver.support.ui import WebDriverWait
 
+from tool.visual import visual_checker
+
 log = logging.getLogger(__name__)
 
+# Element cache hits/misses/stale/invalidations per page class, reported in the terminal summary
+ELEMENT_CACHE_STATS = defaultdict(Counter)
+
+
+def mutates_page(method):
+    """
+    Declares that a page-object method changes the DOM, the element cache is dropped after it runs.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_element_cache()
+    return wrapper
+
+
 class BasePage:
     # Common Locators (placed here if used across many pages)
     CART_ICON_LOCATOR = (By.ID, "shopping_cart_container")
-    CART_BADGE_LOCATOR = (By.XPATH, "//span[@class='shopping_cart_badge']")
+    CART_BADGE_LOCATOR = (By.CSS_SELECTOR, "span.shopping_cart_badge")
     BURGER_BUTTON = (By.ID, "react-burger-menu-btn")
     BURGER_ITEMS = (By.CSS_SELECTOR, ".bm-item.menu-item")
     ALL_ITEMS_LINK_LOCATOR = (By.ID, "inventory_sidebar_link")
@@ -20,41 +41,118 @@ class BasePage:
     RESET_APP_STATE_LINK_LOCATOR = (By.ID, "reset_sidebar_link")
     BURGER_MENU_CLOSE_BUTTON = (By.ID, "react-burger-cross-btn")
     INVENTORY_ITEM_NAME = (By.CSS_SELECTOR, ".inventory_item_name")
-    
+    INVENTORY_ITEM_PRICE = (By.CLASS_NAME, "inventory_item_price")
+    PAGE_TITLE = (By.CSS_SELECTOR, ".title")
+    ERROR_MESSAGE_LOCATOR = (By.CSS_SELECTOR, "[data-test='error']")
+    CANCEL_BUTTON = (By.ID, "cancel")
+    BACK_TO_PRODUCTS_BUTTON = (By.ID, "back-to-products")
+
+    # Opt-in per page: reuse the WebElement found for a locator until navigation, a stale element or a mutation
+    CACHE_ELEMENTS = False
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)  # Explicit wait with 10-second timeout
+        self._element_cache = {}
+
+    #############################################
+    #   Element cache
+    #############################################
+    def invalidate_element_cache(self):
+        if self._element_cache:
+            ELEMENT_CACHE_STATS[type(self).__name__]["invalidations"] += 1
+            self._element_cache.clear()
+
+    def _on_element(self, locator, action, clickable=False):
+        """
+        Waits for the element of locator to be visible (clickable with clickable=True) and runs action(element).
+        Pages with CACHE_ELEMENTS keep the element, later calls only wait on its state instead of finding it again.
+        A stale cached element drops the whole cache, the page was re-rendered or left.
+        """
+        # element_to_be_clickable takes a locator or an element, visibility has one condition for each
+        ready = exp.element_to_be_clickable if clickable else exp.visibility_of
+        find = exp.element_to_be_clickable if clickable else exp.visibility_of_element_located
+        if not self.CACHE_ELEMENTS:
+            return action(self.wait.until(find(locator)))
+
+        stats = ELEMENT_CACHE_STATS[type(self).__name__]
+        element = self._element_cache.get(locator)
+        if element is not None:
+            try:
+                result = action(self.wait.until(ready(element)))
+                stats["hits"] += 1
+                return result
+            except StaleElementReferenceException:
+                stats["stale"] += 1
+                self.invalidate_element_cache()
+        stats["misses"] += 1
+        element = self.wait.until(find(locator))
+        self._element_cache[locator] = element
+        return action(element)
+
+    def _on_elements(self, locator, action):
+        """
+        Runs action(elements) on all elements of locator, cached like _on_element. Empty results are not cached.
+        """
+        if not self.CACHE_ELEMENTS:
+            return action(self.driver.find_elements(*locator))
+
+        stats = ELEMENT_CACHE_STATS[type(self).__name__]
+        key = ("all",) + tuple(locator)
+        elements = self._element_cache.get(key)
+        if elements is not None:
+            try:
+                result = action(elements)
+                stats["hits"] += 1
+                return result
+            except StaleElementReferenceException:
+                stats["stale"] += 1
+                self.invalidate_element_cache()
+        stats["misses"] += 1
+        elements = self.driver.find_elements(*locator)
+        if elements:
+            self._element_cache[key] = elements
+        return action(elements)
 
     #############################################
     #   Common Selenium actions
     #############################################
     def go_to_url(self, url):
         self.driver.get(url)
+        self.invalidate_element_cache()
 
     def get_current_url(self):
         return self.driver.current_url
 
     def get_element_text(self, locator):
-        return self.wait.until(exp.visibility_of_element_located(locator)).text
+        return self._on_element(locator, lambda element: element.text)
+
+    def get_elements_text(self, locator):
+        return self._on_elements(locator, lambda elements: [element.text for element in elements])
 
     def click_element(self, locator):
         """
         Waits for an element to be visible, then clickable, and then clicks it.
         """
         try:
-            # First, wait for presence
-            self.wait.until(exp.presence_of_element_located(locator))
+            if locator not in self._element_cache:
+                # First, wait for presence
+                self.wait.until(exp.presence_of_element_located(locator))
             # Then, wait for clickability
-            self.wait.until(exp.element_to_be_clickable(locator)).click()
+            self._on_element(locator, lambda element: element.click(), clickable=True)
             log.info(f"Element {locator} clicked")
         except Exception as e:
             log.error(f"Error clicking element with locator {locator}: {e}")
             raise
+        finally:
+            # A click may navigate or re-render the page
+            self.invalidate_element_cache()
 
     def type_into_element(self, locator, text):
-        element = self.wait.until(exp.visibility_of_element_located(locator))
-        element.clear()
-        element.send_keys(text)
+        def clear_and_type(element):
+            element.clear()
+            element.send_keys(text)
+        self._on_element(locator, clear_and_type)
         log.info(f"'{text}' entered to element {locator}")
 
     def is_element_present(self, locator):
@@ -66,11 +164,42 @@ class BasePage:
 
     def is_element_visible(self, locator):
         try:
-            self.wait.until(exp.visibility_of_element_located(locator))
-            return True
+            return self._on_element(locator, lambda element: True)
         except TimeoutException:
             return False
 
+    def verify_visual_checkpoint(self, name, locator=None, masks=()):
+        """
+        Compares the page, or the element of `locator`, with its visual baseline. No-op unless --visual is given.
+        :param name: checkpoint name, unique per screen state
+        :param locator: element to capture, whole viewport when None
+        :param masks: locators of regions to ignore, e.g. dates or animations
+        """
+        if not visual_checker.enabled:
+            return None
+        if locator is None:
+            png = self.driver.get_screenshot_as_png()
+        else:
+            element = self.wait.until(exp.visibility_of_element_located(locator))
+            png = element.screenshot_as_png
+
+        regions = []
+        if masks:
+            # Element rects are in CSS pixels relative to the document, screenshots in device pixels
+            scale, scroll_x, scroll_y = self.driver.execute_script(
+                "return [window.devicePixelRatio || 1, window.scrollX, window.scrollY];")
+            origin_x, origin_y = (scroll_x, scroll_y) if locator is None else (element.rect["x"], element.rect["y"])
+            for mask in masks:
+                for masked in self.driver.find_elements(*mask):
+                    rect = masked.rect
+                    regions.append(((rect["x"] - origin_x) * scale, (rect["y"] - origin_y) * scale,
+                                    rect["width"] * scale, rect["height"] * scale))
+
+        result = visual_checker.check(png, name, regions)
+        assert result.passed, \
+            f"Visual checkpoint '{name}' differs from baseline ({result.diff_ratio:.2%}), see {result.diff_path}"
+        return result
+
     #############################################
     #   Common actions shared across pages
     #############################################
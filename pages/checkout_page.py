@@ -8,13 +8,14 @@ from pages.base_page import BasePage
 logger = logging.getLogger(__name__)
 
 class CheckoutInfoPage(BasePage):
+     # A failed continue is checked with is_error_message_visible and then read with get_error_message
+     CACHE_ELEMENTS = True
+
      # Locators
      FIRST_NAME_FIELD = (By.ID, "first-name")
      LAST_NAME_FIELD = (By.ID, "last-name")
      ZIP_POSTAL_CODE_FIELD = (By.ID, "postal-code")
      CONTINUE_BUTTON = (By.ID, "continue")
-     CANCEL_BUTTON = (By.ID, "cancel")
-     ERROR_MESSAGE_LOCATOR = (By.CSS_SELECTOR, "[data-test='error']")
 
      def __init__(self, driver):
          super().__init__(driver)
@@ -45,13 +46,11 @@ class CheckoutInfoPage(BasePage):
 class CheckoutOverviewPage(BasePage):
      # Locators
      FINISH_BUTTON = (By.ID, "finish")
-     CANCEL_BUTTON = (By.ID, "cancel")
      ITEM_TOTAL_LABEL = (By.CSS_SELECTOR, ".summary_subtotal_label")
      TAX_LABEL = (By.CSS_SELECTOR, ".summary_tax_label")
      TOTAL_LABEL = (By.CSS_SELECTOR, ".summary_total_label")
      CART_ITEM_LABELS = (By.CSS_SELECTOR, ".cart_item_label")
      CART_QUANTITY = (By.CLASS_NAME, "cart_quantity")
-     INVENTORY_ITEM_PRICE = (By.CLASS_NAME, "inventory_item_price")
 
      def __init__(self, driver):
          super().__init__(driver)
@@ -91,7 +90,6 @@ class CheckoutCompletePage(BasePage):
      # Locators
      COMPLETE_HEADER = (By.CSS_SELECTOR, ".complete-header")
      COMPLETE_TEXT = (By.CSS_SELECTOR, ".complete-text")
-     BACK_HOME_BUTTON = (By.ID, "back-to-products")
 
      def __init__(self, driver):
          super().__init__(driver)
@@ -104,5 +102,5 @@ class CheckoutCompletePage(BasePage):
         return self.get_element_text(self.COMPLETE_TEXT)
 
      def click_back_home(self):
-        self.click_element(self.BACK_HOME_BUTTON)
+        self.click_element(self.BACK_TO_PRODUCTS_BUTTON)
         # Returns to inventory page
\ No newline at end of file
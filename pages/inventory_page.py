@@ -8,21 +8,18 @@ from selenium.webdriver.support import expected_conditions as exp
 from selenium.webdriver.support.ui import Select
 
 from constants import Urls
-from pages.base_page import BasePage
+from pages.base_page import BasePage, mutates_page
 from pages.cart_page import CartPage
 from pages.product_detail_page import ProductDetailPage
+from tool.locator_registry import product_locators
 
 log = logging.getLogger(__name__)
 
 
 class InventoryPage(BasePage):
     # Locators
-    PRODUCT_TITLE_LOCATOR = (By.CSS_SELECTOR, ".title")
     SORT_DROPDOWN = (By.CLASS_NAME, "product_sort_container")
-    PRODUCT_NAMES = (By.CLASS_NAME, "inventory_item_name")
-    PRODUCT_PRICES = (By.CLASS_NAME, "inventory_item_price")
-    ADD_TO_CART_BUTTON_PREFIX = "add-to-cart-"
-    REMOVE_BUTTON_PREFIX = "remove-"
+    # Per-product button and name locators are precomputed in tool.locator_registry
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -31,10 +28,10 @@ class InventoryPage(BasePage):
     def go_to_inventory_page(self):
         self.go_to_url(self.url)
         # Ensure product title is visible before process
-        self.wait.until(exp.visibility_of_element_located(self.PRODUCT_TITLE_LOCATOR))
+        self.wait.until(exp.visibility_of_element_located(self.PAGE_TITLE))
 
     def get_page_title(self):
-        return self.get_element_text(self.PRODUCT_TITLE_LOCATOR)
+        return self.get_element_text(self.PAGE_TITLE)
 
     def get_burger_items(self):
         self.click_element(self.BURGER_BUTTON)
@@ -42,6 +39,7 @@ class InventoryPage(BasePage):
         log.info("List of actual Burger Menu Items: " + items)
         return [item.text for item in items]
 
+    @mutates_page
     def sort_products_by(self, sort_option_value):
         """
         Sorts products using the dropdown.
@@ -52,50 +50,41 @@ class InventoryPage(BasePage):
         select.select_by_value(sort_option_value)
 
     def get_product_names(self):
-        self.wait.until(exp.presence_of_all_elements_located(self.PRODUCT_NAMES))
-        name_elements = self.driver.find_elements(*self.PRODUCT_NAMES)
+        self.wait.until(exp.presence_of_all_elements_located(self.INVENTORY_ITEM_NAME))
+        name_elements = self.driver.find_elements(*self.INVENTORY_ITEM_NAME)
         return [element.text for element in name_elements]
 
     def get_product_prices(self):
-        self.wait.until(exp.presence_of_all_elements_located(self.PRODUCT_PRICES))
-        price_elements = self.driver.find_elements(*self.PRODUCT_PRICES)
+        self.wait.until(exp.presence_of_all_elements_located(self.INVENTORY_ITEM_PRICE))
+        price_elements = self.driver.find_elements(*self.INVENTORY_ITEM_PRICE)
         return [float(element.text.replace('$', '')) for element in price_elements]
 
-    @staticmethod
-    def update_product_button(product_name: str):
-        return product_name.lower().replace(" ", "-").replace("(", "").replace(")", "").replace(".", "")
-
     def add_product_to_cart(self, product_name):
         """
         Finds and clicks the "Add to cart" button for a given product name.
         """
-        button_id_suffix = self.update_product_button(product_name)
-        add_locator = (By.ID, f"{self.ADD_TO_CART_BUTTON_PREFIX}{button_id_suffix}")
-        self.click_element(add_locator)
+        self.click_element(product_locators(product_name).add_button)
 
     def remove_product_from_cart(self, product_name):
-        button_id_suffix = self.update_product_button(product_name)
-        remove_locator = (By.ID, f"{self.REMOVE_BUTTON_PREFIX}{button_id_suffix}")
-        self.click_element(remove_locator)
+        self.click_element(product_locators(product_name).remove_button)
 
     def get_product_button_text(self, product_name):
-        button_id_suffix = self.update_product_button(product_name)
-        add_button_locator = (By.ID, f"{self.ADD_TO_CART_BUTTON_PREFIX}{button_id_suffix}")
-        remove_button_locator = (By.ID, f"{self.REMOVE_BUTTON_PREFIX}{button_id_suffix}")
+        add_button_locator = product_locators(product_name).add_button
+        remove_button_locator = product_locators(product_name).remove_button
 
         try:
             return self.wait.until(exp.visibility_of_element_located(add_button_locator)).text
-        except:
+        except TimeoutException:
             try:
                 return self.wait.until(exp.visibility_of_element_located(remove_button_locator)).text
-            except:
+            except TimeoutException:
                 return None  # No button is visible
 
     def click_product_name(self, product_name):
         """
         Clicks on the product name link to navigate to the product detail page.
         """
-        product_name_locator = (By.XPATH, f"//div[@class='inventory_item_name']/a[contains(text(), '{product_name}')]")
+        product_name_locator = product_locators(product_name).name_link
 
         for i in range(3):
             if self.is_element_present(product_name_locator):
@@ -13,7 +13,6 @@ class LoginPage(BasePage):
     USERNAME_FIELD = (By.ID, "user-name")
     PASSWORD_FIELD = (By.ID, "password")
     LOGIN_BUTTON = (By.ID, "login-button")
-    ERROR_MESSAGE_LOCATOR = (By.CSS_SELECTOR, "[data-test='error']")
 
     def __init__(self, driver):
         super().__init__(driver)
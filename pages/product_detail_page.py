@@ -8,7 +8,6 @@ class ProductDetailPage(BasePage):
     PRODUCT_NAME = (By.CSS_SELECTOR, ".inventory_details_name")
     PRODUCT_DESCRIPTION = (By.CSS_SELECTOR, ".inventory_details_desc")
     PRODUCT_PRICE = (By.CSS_SELECTOR, ".inventory_details_price")
-    BACK_TO_PRODUCTS_BUTTON = (By.ID, "back-to-products")
     ADD_TO_CART_BUTTON = (By.CSS_SELECTOR, ".btn_primary.btn_inventory")
     REMOVE_FROM_CART_BUTTON = (By.CSS_SELECTOR, ".btn_secondary.btn_inventory")
 
@@ -1,12 +1,28 @@
 # tests/test_cart_persistence.py
+import asyncio
 import logging
 
+import pytest
+
 from constants import Urls
 from tests.data import Products, User, CheckoutInfo, ExpectedMessages
+from pages.aio.login_page import AsyncLoginPage
 from pages.login_page import LoginPage
+from tool.scenarios import catalog, scenario_params
 
 log = logging.getLogger(__name__)
 
+# Pairwise user x product x checkout info scenarios. problem_user is left out on purpose,
+# its broken checkout form is covered by dedicated tests, and locked_out_user cannot log in.
+CHECKOUT_SCENARIOS = scenario_params(
+    {
+        "user": catalog(User, include=("STANDARD_USER", "PERFORMANCE_GLITCH_USER")),
+        "product": catalog(Products),
+        "checkout_info": catalog(CheckoutInfo),
+    },
+    pinned=[{"user": "STANDARD_USER", "product": "SAUCE_LABS_BACKPACK", "checkout_info": "STANDARD_USER_INFO"}]
+)
+
 
 class TestE2ECheckOut:
     def test_cart_state_after_logout_and_relogin(self, driver):
@@ -40,6 +56,7 @@ class TestE2ECheckOut:
         inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
         inventory_page.add_product_to_cart(Products.SAUCE_LABS_FLEECE_JACKET)
         assert inventory_page.get_cart_count() == 2, "Incorrect products count"
+        inventory_page.verify_visual_checkpoint("e2e_002_inventory_with_2_products")
 
         log.info("Step 3. Navigate to cart detail and check products on cart")
         cart_page = inventory_page.navigate_to_cart()
@@ -48,6 +65,7 @@ class TestE2ECheckOut:
             f"Selected product {Products.SAUCE_LABS_BACKPACK} not exist on cart"
         assert Products.SAUCE_LABS_FLEECE_JACKET in cart_page.get_cart_item_names(), \
             f"Selected product {Products.SAUCE_LABS_FLEECE_JACKET} not exist on cart"
+        cart_page.verify_visual_checkpoint("e2e_002_cart")
 
         log.info("Step 4. Click checkout to navigate to checkout page")
         checkout_info_page = cart_page.click_checkout()
@@ -71,6 +89,7 @@ class TestE2ECheckOut:
 
         assert items_on_overview[1]["name"] == Products.SAUCE_LABS_FLEECE_JACKET, "Incorrect second product"
         assert items_on_overview[1]["price"] == 49.99
+        checkout_overview_page.verify_visual_checkpoint("e2e_002_overview")
 
         log.info("Step 7. Verify total price with tax info")
         item_total = checkout_overview_page.get_item_total()
@@ -85,6 +104,7 @@ class TestE2ECheckOut:
         assert checkout_complete_page.get_complete_header_text() == ExpectedMessages.THANK_YOU_MESSAGE
         assert checkout_complete_page.get_complete_text_message() == ExpectedMessages.ORDER_DISPATCH_MESSAGE
         assert inventory_page.get_cart_count() == 0
+        checkout_complete_page.verify_visual_checkpoint("e2e_002_complete")
 
     def test_add_and_remove_products_from_inventory_page(self, logged_in_page):
         """E2E-003: Verify add/remove from cart on Inventory Page."""
@@ -134,4 +154,112 @@ class TestE2ECheckOut:
         log.info("Step 4. Verify error message showing and staying Step 1 URL")
         assert checkout_info_page.is_error_message_visible()
         assert checkout_info_page.get_error_message() == ExpectedMessages.ERROR_FIRST_NAME_REQUIRED
-        assert checkout_info_page.get_current_url() == Urls.CHECKOUT_STEP_ONE_URL
\ No newline at end of file
+        assert checkout_info_page.get_current_url() == Urls.CHECKOUT_STEP_ONE_URL
+
+    def test_cart_isolated_between_sessions(self, driver, new_session):
+        """E2E-005: Verify two sessions of the same user keep independent carts."""
+
+        log.info("Step 1. Login with valid credential in two independent sessions")
+        first_login_page = LoginPage(driver)
+        first_login_page.go_to_login_page()
+        first_inventory_page = first_login_page.login(User.STANDARD_USER["username"], User.STANDARD_USER["password"])
+
+        second_login_page = LoginPage(new_session())
+        second_login_page.go_to_login_page()
+        second_inventory_page = second_login_page.login(User.STANDARD_USER["username"], User.STANDARD_USER["password"])
+
+        log.info("Step 2. Add 2 products in the first session and 1 product in the second session")
+        first_inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
+        first_inventory_page.add_product_to_cart(Products.SAUCE_LABS_ONESIE)
+        second_inventory_page.add_product_to_cart(Products.SAUCE_LABS_BIKE_LIGHT)
+
+        log.info("Step 3. Check each session only sees its own cart")
+        assert first_inventory_page.get_cart_count() == 2, "First session cart is affected by the second session"
+        assert second_inventory_page.get_cart_count() == 1, "Second session cart is affected by the first session"
+
+    @pytest.mark.parametrize("user, product, checkout_info", CHECKOUT_SCENARIOS)
+    def test_checkout_scenarios(self, driver, user, product, checkout_info):
+        """E2E-006: Verify checkout of one product for pairwise user/product/checkout info scenarios."""
+
+        log.info(f"Step 1. Login as {user['username']} and add '{product}' to cart")
+        login_page = LoginPage(driver)
+        login_page.go_to_login_page()
+        inventory_page = login_page.login(user["username"], user["password"])
+        assert inventory_page is not None, f"Login failed for {user['username']}"
+        inventory_page.add_product_to_cart(product)
+        assert inventory_page.get_cart_count() == 1, "Incorrect products count"
+
+        log.info("Step 2. Checkout with delivery info and verify product on overview page")
+        checkout_info_page = inventory_page.navigate_to_cart().click_checkout()
+        checkout_info_page.fill_your_information(
+            checkout_info["first_name"], checkout_info["last_name"], checkout_info["zip_code"]
+        )
+        checkout_overview_page = checkout_info_page.click_continue()
+        assert checkout_overview_page is not None, "Could not continue to checkout overview"
+        assert [item["name"] for item in checkout_overview_page.get_item_details()] == [product]
+
+        log.info("Step 3. Finish and verify thank you message")
+        checkout_complete_page = checkout_overview_page.click_finish()
+        assert checkout_complete_page.get_complete_header_text() == ExpectedMessages.THANK_YOU_MESSAGE
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checkout_of_two_users(self, async_driver, async_new_session):
+        """E2E-007: Verify two users checking out at the same time both complete their own order."""
+
+        async def checkout(session, user, product, checkout_info):
+            login_page = AsyncLoginPage(session)
+            await login_page.go_to_login_page()
+            inventory_page = await login_page.login(user["username"], user["password"])
+            assert inventory_page is not None, f"Login failed for {user['username']}"
+            await inventory_page.add_product_to_cart(product)
+            checkout_info_page = await (await inventory_page.navigate_to_cart()).click_checkout()
+            await checkout_info_page.fill_your_information(
+                checkout_info["first_name"], checkout_info["last_name"], checkout_info["zip_code"]
+            )
+            checkout_overview_page = await checkout_info_page.click_continue()
+            assert checkout_overview_page is not None, f"{user['username']} could not continue to checkout overview"
+            items = await checkout_overview_page.get_item_details()
+            checkout_complete_page = await checkout_overview_page.click_finish()
+            return items, await checkout_complete_page.get_complete_header_text()
+
+        log.info("Step 1. Start a second session for the second user")
+        second_session = await async_new_session()
+
+        log.info("Step 2. Checkout one different product per user concurrently")
+        (first_items, first_header), (second_items, second_header) = await asyncio.gather(
+            checkout(async_driver, User.STANDARD_USER, Products.SAUCE_LABS_BACKPACK, CheckoutInfo.STANDARD_USER_INFO),
+            checkout(second_session, User.PERFORMANCE_GLITCH_USER, Products.SAUCE_LABS_ONESIE,
+                     CheckoutInfo.ANOTHER_USER_INFO),
+        )
+
+        log.info("Step 3. Verify each order only has its own product and is completed")
+        assert [item["name"] for item in first_items] == [Products.SAUCE_LABS_BACKPACK]
+        assert [item["name"] for item in second_items] == [Products.SAUCE_LABS_ONESIE]
+        assert first_header == ExpectedMessages.THANK_YOU_MESSAGE
+        assert second_header == ExpectedMessages.THANK_YOU_MESSAGE
+
+    def test_reused_session_starts_logged_out(self, reuse_host):
+        """E2E-008: Verify a reused browser starts the next test logged out with an empty cart."""
+
+        log.info("Step 1. Login, add a product to cart and leave saucedemo for another page")
+        session = reuse_host.acquire()
+        login_page = LoginPage(session)
+        login_page.go_to_login_page()
+        inventory_page = login_page.login(User.STANDARD_USER["username"], User.STANDARD_USER["password"])
+        inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
+        assert inventory_page.get_cart_count() == 1, "Incorrect products count on cart"
+        session.get("about:blank")
+
+        log.info("Step 2. Release the session and acquire it again as the next test does")
+        reuse_host.release(session)
+        session = reuse_host.acquire()
+
+        log.info("Step 3. Verify the inventory page needs a new login")
+        login_page = LoginPage(session)
+        login_page.go_to_url(Urls.INVENTORY_URL)
+        login_page.verify_error_message(ExpectedMessages.AUTH_ERROR_RESTRICTED_ACCESS.format(path="/inventory.html"))
+
+        log.info("Step 4. Login again and verify the cart is empty")
+        login_page.go_to_login_page()
+        inventory_page = login_page.login(User.STANDARD_USER["username"], User.STANDARD_USER["password"])
+        assert inventory_page.get_cart_count() == 0, "Cart of the previous test is kept in the reused session"
@@ -0,0 +1,298 @@
+# tests/unit/test_async_pages.py
+import asyncio
+import functools
+import itertools
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from constants import Urls
+from pages import base_page
+from pages.aio import base_page as aio_base_page
+from pages.aio.inventory_page import AsyncInventoryPage
+from pages.aio.login_page import AsyncLoginPage
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutInfoPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from tests.data import CheckoutInfo, ExpectedMessages, Products, User
+from tool.async_driver import AsyncDriver, AsyncWait
+from tool.locator_registry import product_locators
+from tool.scenarios import catalog
+
+ELEMENT_IDS = itertools.count()
+USERNAMES = {user["username"] for user in catalog(User).values()}
+PRODUCTS = list(catalog(Products).values())
+CHECKOUT_FIELDS = [
+    ("first-name", ExpectedMessages.ERROR_FIRST_NAME_REQUIRED),
+    ("last-name", ExpectedMessages.ERROR_LAST_NAME_REQUIRED),
+    ("postal-code", ExpectedMessages.ERROR_POSTAL_CODE_REQUIRED),
+]
+
+
+class FakeElement(WebElement):
+    """A rendered element, clicks and keys go to the app state"""
+
+    def __init__(self, app, text="", on_click=None, field=None):
+        super().__init__(app, f"element-{next(ELEMENT_IDS)}")
+        self.app = app
+        self._text = text
+        self.on_click = on_click
+        self.field = field
+
+    @property
+    def text(self):
+        return self._text
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        if self.on_click:
+            self.on_click()
+
+    def clear(self):
+        self.app.fields[self.field] = ""
+
+    def send_keys(self, *value):
+        self.app.fields[self.field] = self.app.fields.get(self.field, "") + "".join(value)
+
+
+class FakeSauceDemo:
+    """In-memory stand-in for the app, renders the elements of the current URL from the session state"""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.fields = {}
+        self.cart = []
+        self.error = None
+
+    def get(self, url):
+        self.current_url = url
+        self.fields = {}
+        self.error = None
+
+    def state(self):
+        return self.current_url, list(self.cart), self.error
+
+    def find_element(self, by, value):
+        found = self.render().get((by, value))
+        if not found:
+            raise NoSuchElementException(value)
+        return found[0]
+
+    def find_elements(self, by, value):
+        return self.render().get((by, value), [])
+
+    def render(self):
+        def element(text="", on_click=None, field=None):
+            return [FakeElement(self, text, on_click, field)]
+
+        url = self.current_url
+        page = {BasePage.ERROR_MESSAGE_LOCATOR: element(self.error)} if self.error else {}
+        if url == Urls.LOGIN_URL:
+            page[LoginPage.USERNAME_FIELD] = element(field="user-name")
+            page[LoginPage.PASSWORD_FIELD] = element(field="password")
+            page[LoginPage.LOGIN_BUTTON] = element("Login", self.submit_login)
+            return page
+
+        page[BasePage.CART_ICON_LOCATOR] = element(on_click=functools.partial(self.get, Urls.CART_URL))
+        if self.cart:
+            page[BasePage.CART_BADGE_LOCATOR] = element(str(len(self.cart)))
+        if url == Urls.INVENTORY_URL:
+            page[BasePage.PAGE_TITLE] = element("Products")
+            for product in PRODUCTS:
+                locators = product_locators(product)
+                if product in self.cart:
+                    page[locators.remove_button] = element("Remove", functools.partial(self.cart.remove, product))
+                else:
+                    page[locators.add_button] = element("Add to cart", functools.partial(self.cart.append, product))
+        elif url == Urls.CART_URL:
+            page[BasePage.PAGE_TITLE] = element("Your Cart")
+            page[CartPage.CART_ITEM] = [FakeElement(self, product) for product in self.cart]
+            page[BasePage.INVENTORY_ITEM_NAME] = [FakeElement(self, product) for product in self.cart]
+            page[CartPage.CHECKOUT_BUTTON] = element("Checkout",
+                                                     functools.partial(self.get, Urls.CHECKOUT_STEP_ONE_URL))
+        elif url == Urls.CHECKOUT_STEP_ONE_URL:
+            for field, _ in CHECKOUT_FIELDS:
+                page[(By.ID, field)] = element(field=field)
+            page[CheckoutInfoPage.CONTINUE_BUTTON] = element("Continue", self.submit_information)
+        elif url == Urls.CHECKOUT_STEP_TWO_URL:
+            page[BasePage.PAGE_TITLE] = element("Checkout: Overview")
+        return page
+
+    def submit_login(self):
+        username, password = self.fields.get("user-name", ""), self.fields.get("password", "")
+        if not username:
+            self.error = ExpectedMessages.ERROR_USERNAME_REQUIRED
+        elif not password:
+            self.error = ExpectedMessages.ERROR_PASSWORD_REQUIRED
+        elif username not in USERNAMES or password != "secret_sauce":
+            self.error = ExpectedMessages.ERROR_INVALID_CREDENTIALS
+        elif username == User.LOCKED_OUT_USER["username"]:
+            self.error = ExpectedMessages.ERROR_LOCKED_OUT_USER
+        else:
+            self.get(Urls.INVENTORY_URL)
+
+    def submit_information(self):
+        for field, message in CHECKOUT_FIELDS:
+            if not self.fields.get(field):
+                self.error = message
+                return
+        self.get(Urls.CHECKOUT_STEP_TWO_URL)
+
+
+def kind(page):
+    """Page class name shared by the sync page and its async twin"""
+    return None if page is None else type(page).__name__.removeprefix("Async")
+
+
+# Each flow twice, the sync one on LoginPage & co., the async one on their twins. Both return what they observed.
+def login(driver, user):
+    login_page = LoginPage(driver)
+    login_page.go_to_login_page()
+    return login_page, login_page.login(**user)
+
+
+async def async_login(driver, user):
+    login_page = AsyncLoginPage(driver)
+    await login_page.go_to_login_page()
+    return login_page, await login_page.login(**user)
+
+
+def login_success(driver):
+    _, inventory_page = login(driver, User.STANDARD_USER)
+    return kind(inventory_page), inventory_page.get_page_title(), inventory_page.get_cart_count()
+
+
+async def async_login_success(driver):
+    _, inventory_page = await async_login(driver, User.STANDARD_USER)
+    return kind(inventory_page), await inventory_page.get_page_title(), await inventory_page.get_cart_count()
+
+
+def login_failure(driver, user):
+    login_page, inventory_page = login(driver, user)
+    return kind(inventory_page), login_page.get_error_message()
+
+
+async def async_login_failure(driver, user):
+    login_page, inventory_page = await async_login(driver, user)
+    return kind(inventory_page), await login_page.get_error_message()
+
+
+def add_products(driver):
+    _, inventory_page = login(driver, User.STANDARD_USER)
+    inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
+    inventory_page.add_product_to_cart(Products.SAUCE_LABS_ONESIE)
+    inventory_page.remove_product_from_cart(Products.SAUCE_LABS_ONESIE)
+    inventory_page.add_product_to_cart(Products.SAUCE_LABS_BIKE_LIGHT)
+    return (inventory_page.get_cart_count(), inventory_page.get_product_button_text(Products.SAUCE_LABS_BACKPACK),
+            inventory_page.get_product_button_text(Products.SAUCE_LABS_ONESIE))
+
+
+async def async_add_products(driver):
+    _, inventory_page = await async_login(driver, User.STANDARD_USER)
+    await inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
+    await inventory_page.add_product_to_cart(Products.SAUCE_LABS_ONESIE)
+    await inventory_page.remove_product_from_cart(Products.SAUCE_LABS_ONESIE)
+    await inventory_page.add_product_to_cart(Products.SAUCE_LABS_BIKE_LIGHT)
+    return (await inventory_page.get_cart_count(),
+            await inventory_page.get_product_button_text(Products.SAUCE_LABS_BACKPACK),
+            await inventory_page.get_product_button_text(Products.SAUCE_LABS_ONESIE))
+
+
+def checkout(driver, info):
+    _, inventory_page = login(driver, User.STANDARD_USER)
+    inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
+    cart_page = inventory_page.navigate_to_cart()
+    items = cart_page.get_cart_item_names()
+    checkout_page = cart_page.click_checkout()
+    checkout_page.fill_your_information(info["first_name"], info["last_name"], info["zip_code"])
+    overview_page = checkout_page.click_continue()
+    error = checkout_page.get_error_message() if checkout_page.is_error_message_visible() else None
+    return items, kind(overview_page), error
+
+
+async def async_checkout(driver, info):
+    _, inventory_page = await async_login(driver, User.STANDARD_USER)
+    await inventory_page.add_product_to_cart(Products.SAUCE_LABS_BACKPACK)
+    cart_page = await inventory_page.navigate_to_cart()
+    items = await cart_page.get_cart_item_names()
+    checkout_page = await cart_page.click_checkout()
+    await checkout_page.fill_your_information(info["first_name"], info["last_name"], info["zip_code"])
+    overview_page = await checkout_page.click_continue()
+    error = await checkout_page.get_error_message() if await checkout_page.is_error_message_visible() else None
+    return items, kind(overview_page), error
+
+
+WRONG_PASSWORD = {**User.STANDARD_USER, "password": "wrong_sauce"}
+MISSING_ZIP_CODE = {**CheckoutInfo.STANDARD_USER_INFO, "zip_code": ""}
+FLOWS = {
+    "login success": (login_success, async_login_success, ("InventoryPage", "Products", 0)),
+    "login locked out": (functools.partial(login_failure, user=User.LOCKED_OUT_USER),
+                         functools.partial(async_login_failure, user=User.LOCKED_OUT_USER),
+                         (None, ExpectedMessages.ERROR_LOCKED_OUT_USER)),
+    "login wrong password": (functools.partial(login_failure, user=WRONG_PASSWORD),
+                             functools.partial(async_login_failure, user=WRONG_PASSWORD),
+                             (None, ExpectedMessages.ERROR_INVALID_CREDENTIALS)),
+    "add to cart": (add_products, async_add_products, (2, "Remove", "Add to cart")),
+    "checkout": (functools.partial(checkout, info=CheckoutInfo.STANDARD_USER_INFO),
+                 functools.partial(async_checkout, info=CheckoutInfo.STANDARD_USER_INFO),
+                 ([Products.SAUCE_LABS_BACKPACK], "CheckoutOverviewPage", None)),
+    "checkout validation error": (functools.partial(checkout, info=MISSING_ZIP_CODE),
+                                  functools.partial(async_checkout, info=MISSING_ZIP_CODE),
+                                  ([Products.SAUCE_LABS_BACKPACK], None, ExpectedMessages.ERROR_POSTAL_CODE_REQUIRED)),
+}
+
+
+@pytest.fixture(autouse=True)
+def short_waits(monkeypatch):
+    """Missing elements time out after 0.2s instead of 10s, on both page variants"""
+    monkeypatch.setattr(base_page, "WebDriverWait",
+                        lambda driver, timeout: WebDriverWait(driver, 0.2, poll_frequency=0.02))
+    monkeypatch.setattr(aio_base_page, "AsyncWait", lambda driver, timeout: AsyncWait(driver, 0.2, poll_frequency=0.02))
+
+
+def run_async(flow, app):
+    async def run():
+        driver = AsyncDriver(app)
+        try:
+            return await flow(driver)
+        finally:
+            driver.close()
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("flow", FLOWS)
+def test_async_pages_match_sync_pages(flow):
+    sync_flow, async_flow, expected = FLOWS[flow]
+    sync_app, async_app = FakeSauceDemo(), FakeSauceDemo()
+
+    sync_result = sync_flow(sync_app)
+    async_result = run_async(async_flow, async_app)
+
+    assert async_result == sync_result == expected
+    assert async_app.state() == sync_app.state()
+
+
+@pytest.mark.parametrize("page_class", [InventoryPage, AsyncInventoryPage], ids=["sync", "async"])
+def test_product_button_text_does_not_hide_browser_errors(page_class):
+    app = FakeSauceDemo()
+    app.get(Urls.INVENTORY_URL)
+
+    def crashed(by, value):
+        raise WebDriverException("chrome not reachable")
+
+    app.find_element = crashed
+    with pytest.raises(WebDriverException, match="chrome not reachable"):
+        if page_class is InventoryPage:
+            page_class(app).get_product_button_text(Products.SAUCE_LABS_BACKPACK)
+        else:
+            run_async(lambda driver: page_class(driver).get_product_button_text(Products.SAUCE_LABS_BACKPACK), app)
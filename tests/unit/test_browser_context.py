@@ -0,0 +1,129 @@
+# tests/unit/test_browser_context.py
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.webelement import WebElement
+
+from selenium.webdriver.support import expected_conditions as exp
+
+from tool.async_driver import AsyncDriver, AsyncWait
+from tool.browser_context import BrowserContextError, BrowserContextPool, IsolatedContext
+from tool.browser_host import BrowserHost
+from tool.memory_governor import MemoryGovernor
+
+
+class FakeDriver:
+    """Chromium-like session without a browser, records the active tab of every command"""
+
+    def __init__(self):
+        self.capabilities = {"browserName": "chrome"}
+        self.locator_converter = LocatorConverter()
+        self.current_window_handle = "home"
+        self.active_handle = "home"
+        self.switch_to = SimpleNamespace(window=self._switch)
+        self.commands = []
+        self._created = 0
+
+    def _switch(self, handle):
+        self.active_handle = handle
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self._created += 1
+        return {"browserContextId": f"context-{self._created}", "targetId": f"tab-{self._created}"}
+
+    def find_element(self, by, value):
+        return WebElement(self, f"element-on-{self.active_handle}")
+
+    def find_elements(self, by, value):
+        return [self.find_element(by, value)]
+
+    def execute(self, command, params=None):
+        self.commands.append((command, self.active_handle))
+        if command == Command.FIND_CHILD_ELEMENT:
+            return {"value": WebElement(self, f"child-on-{self.active_handle}")}
+        return {"value": f"text on {self.active_handle}"}
+
+
+def test_elements_switch_to_their_own_context():
+    fake_driver = FakeDriver()
+    pool = BrowserContextPool(fake_driver)
+    first, second = pool.new_context(), pool.new_context()
+
+    element = first.find_element("id", "title")
+    second.find_element("id", "title")
+    assert fake_driver.active_handle == second.handle
+
+    assert element.text == f"text on {first.handle}"
+    assert fake_driver.active_handle == first.handle
+
+
+def test_elements_keep_context_as_parent():
+    pool = BrowserContextPool(FakeDriver())
+    context = pool.new_context()
+
+    element = context.find_element("id", "title")
+    child = element.find_element("css selector", "span")
+    assert isinstance(element, WebElement)
+    assert element.parent is context
+    assert child.parent is context
+    assert all(found.parent is context for found in context.find_elements("id", "title"))
+
+
+@pytest.mark.asyncio
+async def test_async_sessions_read_their_own_context():
+    pool = BrowserContextPool(FakeDriver())
+    sessions = [AsyncDriver(pool.new_context()) for _ in range(2)]
+
+    async def read_title(session):
+        texts = []
+        for _ in range(50):
+            element = await AsyncWait(session, 1).until(exp.presence_of_element_located(("id", "title")))
+            texts.append(await element.text())
+        return texts
+
+    try:
+        results = await asyncio.gather(*(read_title(session) for session in sessions))
+    finally:
+        for session in sessions:
+            session.close()
+
+    for session, texts in zip(sessions, results):
+        assert set(texts) == {f"text on {session.wrapped_driver.handle}"}
+
+
+
+def crash(fake_driver):
+    """The browser process died, window switches fail from now on"""
+    def switch(handle):
+        raise WebDriverException("chrome not reachable")
+    fake_driver.switch_to.window = switch
+
+
+def test_close_context_of_crashed_browser_raises_context_error():
+    fake_driver = FakeDriver()
+    pool = BrowserContextPool(fake_driver)
+    first, second = pool.new_context(), pool.new_context()
+    crash(fake_driver)
+
+    with pytest.raises(BrowserContextError, match="home window"):
+        first.quit()
+    pool.close_all()
+
+    assert pool.contexts == []
+
+
+def test_host_recycles_browser_when_context_close_fails():
+    drivers = [FakeDriver(), FakeDriver()]
+    governor = MemoryGovernor()
+    host = BrowserHost(lambda enable_bidi: drivers.pop(0), "context", governor)
+    session = host.acquire()
+    crash(session.wrapped_driver)
+
+    host.release(session)
+
+    assert (host.driver, governor.recycles) == (None, 1)
+    assert isinstance(host.acquire(), IsolatedContext)
@@ -0,0 +1,66 @@
+# tests/unit/test_browser_host.py
+from selenium.common.exceptions import InvalidSessionIdException
+
+from tool.browser_host import RESET_STORAGE_SCRIPT, BrowserHost
+from tool.memory_governor import MemoryGovernor
+
+BASE_URL = "https://www.saucedemo.com/"
+
+
+class FakeDriver:
+    """Records the page each reset step runs on"""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.steps = []
+
+    def get(self, url):
+        self.current_url = url
+        self.steps.append(("get", url))
+
+    def execute_script(self, script, *args):
+        self.steps.append((script, self.current_url))
+
+    def delete_all_cookies(self):
+        self.steps.append(("delete_all_cookies", self.current_url))
+
+    def quit(self):
+        self.steps.append(("quit", self.current_url))
+
+
+class CrashedDriver(FakeDriver):
+    """A browser that died during the test, every command fails"""
+
+    def get(self, url):
+        raise InvalidSessionIdException("invalid session id")
+
+    def quit(self):
+        raise InvalidSessionIdException("invalid session id")
+
+
+def test_reset_clears_state_of_base_url_origin():
+    fake_driver = FakeDriver()
+    host = BrowserHost(lambda enable_bidi: fake_driver, "reuse", MemoryGovernor(), base_url=BASE_URL)
+    host.acquire()
+
+    host.reset()
+
+    assert fake_driver.steps == [
+        ("get", BASE_URL),
+        (RESET_STORAGE_SCRIPT, BASE_URL),
+        ("delete_all_cookies", BASE_URL),
+        ("get", "about:blank"),
+    ]
+
+
+def test_release_of_crashed_browser_recycles_it():
+    drivers = [CrashedDriver(), FakeDriver()]
+    governor = MemoryGovernor()
+    host = BrowserHost(lambda enable_bidi: drivers.pop(0), "reuse", governor, base_url=BASE_URL)
+    crashed = host.acquire()
+
+    host.release(crashed)
+
+    assert (host.driver, governor.recycles) == (None, 1)
+    fresh = host.acquire()
+    assert fresh is not crashed and fresh.steps == []
@@ -0,0 +1,150 @@
+# tests/unit/test_element_cache.py
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.base_page import ELEMENT_CACHE_STATS, BasePage, mutates_page
+
+MESSAGE = (By.ID, "message")
+ITEMS = (By.CSS_SELECTOR, ".item")
+
+
+class FakeElement(WebElement):
+    """An element whose state is set by the test instead of a browser"""
+
+    def __init__(self, parent, text):
+        super().__init__(parent, f"element-{text}")
+        self._text = text
+        self.displayed = True
+        self.stale = False
+        self.clicks = 0
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException("element is not attached to the page document")
+
+    @property
+    def text(self):
+        self._check()
+        return self._text
+
+    def is_displayed(self):
+        self._check()
+        return self.displayed
+
+    def is_enabled(self):
+        self._check()
+        return True
+
+    def click(self):
+        self._check()
+        self.clicks += 1
+
+
+class FakeDriver:
+    """Renders one version of the page at a time and counts the lookups"""
+
+    def __init__(self):
+        self.version = 0
+        self.lookups = 0
+        self.render()
+
+    def render(self):
+        self.version += 1
+        self.elements = {
+            MESSAGE: [FakeElement(self, f"message v{self.version}")],
+            ITEMS: [FakeElement(self, f"item {index} v{self.version}") for index in range(2)],
+        }
+
+    def find_element(self, by, value):
+        self.lookups += 1
+        found = self.elements.get((by, value))
+        if not found:
+            raise NoSuchElementException(value)
+        return found[0]
+
+    def find_elements(self, by, value):
+        self.lookups += 1
+        return list(self.elements.get((by, value), []))
+
+
+class CachedPage(BasePage):
+    CACHE_ELEMENTS = True
+
+    @mutates_page
+    def rerender(self):
+        self.driver.render()
+
+
+@pytest.fixture
+def page():
+    ELEMENT_CACHE_STATS.pop(CachedPage.__name__, None)
+    cached_page = CachedPage(FakeDriver())
+    cached_page.wait = WebDriverWait(cached_page.driver, 0.2, poll_frequency=0.05)
+    yield cached_page
+    ELEMENT_CACHE_STATS.pop(CachedPage.__name__, None)
+
+
+def test_repeated_lookups_hit_cache(page):
+    assert page.is_element_visible(MESSAGE)
+    assert page.get_element_text(MESSAGE) == "message v1"
+    page.get_element_text(MESSAGE)
+
+    assert page.driver.lookups == 1
+    stats = ELEMENT_CACHE_STATS[CachedPage.__name__]
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+
+
+def test_mutates_page_invalidates_cache(page):
+    page.get_element_text(MESSAGE)
+
+    page.rerender()
+
+    assert page.get_element_text(MESSAGE) == "message v2"
+    assert page.driver.lookups == 2
+    stats = ELEMENT_CACHE_STATS[CachedPage.__name__]
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (0, 2, 1)
+
+
+def test_hit_still_waits_for_cached_element(page):
+    page.get_element_text(MESSAGE)
+    page.driver.elements[MESSAGE][0].displayed = False
+
+    assert not page.is_element_visible(MESSAGE)
+
+
+def test_stale_hit_finds_element_again(page):
+    page.get_element_text(MESSAGE)
+    page.driver.elements[MESSAGE][0].stale = True
+    page.driver.render()
+
+    assert page.get_element_text(MESSAGE) == "message v2"
+    stats = ELEMENT_CACHE_STATS[CachedPage.__name__]
+    assert (stats["hits"], stats["misses"], stats["stale"]) == (0, 2, 1)
+
+
+def test_click_drops_cache(page):
+    page.click_element(MESSAGE)
+    page.get_element_text(MESSAGE)
+
+    assert page.driver.elements[MESSAGE][0].clicks == 1
+    assert ELEMENT_CACHE_STATS[CachedPage.__name__]["misses"] == 2
+
+
+def test_element_lists_hit_cache(page):
+    assert page.get_elements_text(ITEMS) == ["item 0 v1", "item 1 v1"]
+    assert page.get_elements_text(ITEMS) == ["item 0 v1", "item 1 v1"]
+
+    assert page.driver.lookups == 1
+    assert ELEMENT_CACHE_STATS[CachedPage.__name__]["hits"] == 1
+
+
+def test_uncached_page_finds_every_time(page):
+    uncached_page = BasePage(page.driver)
+    uncached_page.get_element_text(MESSAGE)
+    uncached_page.get_element_text(MESSAGE)
+
+    assert page.driver.lookups == 2
+    assert BasePage.__name__ not in ELEMENT_CACHE_STATS
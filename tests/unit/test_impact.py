@@ -0,0 +1,249 @@
+# tests/unit/test_impact.py
+import json
+import subprocess
+
+import pytest
+
+from tool import impact
+from tool.impact import ImpactSelector, _changed_symbols
+
+CHANGED = {"Products.SAUCE_LABS_ONESIE"}
+
+CHECKOUT_PAGE = '''\
+from selenium.webdriver.common.by import By
+
+
+class CheckoutOverviewPage:
+    TOTAL_LABEL = (By.CSS_SELECTOR, ".summary_total_label")
+    FINISH_BUTTON = (By.ID, "finish")
+
+    def get_total(self):
+        return self.get_element_text(self.TOTAL_LABEL)
+
+    def click_finish(self):
+        # Leaves the overview
+        self.click_element(self.FINISH_BUTTON)
+'''
+
+LOGIN_PAGE = '''\
+class LoginPage:
+    def login(self, username):
+        return username
+'''
+
+DATA = '''\
+class Products:
+    SAUCE_LABS_BACKPACK = "Sauce Labs Backpack"
+    SAUCE_LABS_ONESIE = "Sauce Labs Onesie"
+'''
+
+TEST_MODULE = '''\
+def test_total():
+    pass
+
+
+def test_finish():
+    pass
+
+
+def test_login():
+    pass
+
+
+def test_onesie():
+    assert Products.SAUCE_LABS_ONESIE
+'''
+
+RECORDED = {
+    "test_checkout.py::test_total": {"methods": ["pages/checkout_page.py::CheckoutOverviewPage.get_total"],
+                                     "locators": []},
+    "test_checkout.py::test_finish": {"methods": ["pages/checkout_page.py::CheckoutOverviewPage.click_finish"],
+                                      "locators": ["CheckoutOverviewPage.FINISH_BUTTON"]},
+    "test_checkout.py::test_login": {"methods": ["pages/login_page.py::LoginPage.login"], "locators": []},
+    "test_checkout.py::test_onesie": {"methods": [], "locators": []},
+}
+
+
+def selected_names(items):
+    return [item.name for item in items if ImpactSelector._uses_symbols(item, CHANGED)]
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(pytester, monkeypatch):
+    """A git repo with two page modules, a data module, a conftest and a recorded impact map, committed as HEAD"""
+    monkeypatch.setattr(impact, "ROOT", pytester.path)
+    impact._attributes_read_by_methods.cache_clear()
+    files = {
+        "pages/__init__.py": "",
+        "pages/checkout_page.py": CHECKOUT_PAGE,
+        "pages/login_page.py": LOGIN_PAGE,
+        "tests/data.py": DATA,
+        "constants.py": "BASE_URL = 'https://www.saucedemo.com/'\n",
+        "conftest.py": "",
+        "test_checkout.py": TEST_MODULE,
+    }
+    for rel_path, content in files.items():
+        (pytester.path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (pytester.path / rel_path).write_text(content, encoding="utf-8")
+    git(pytester.path, "init", "-q")
+    git(pytester.path, "add", ".")
+    git(pytester.path, "commit", "-q", "-m", "baseline")
+    impact_map = {"files": {rel_path: impact._hash_file(rel_path) for rel_path in impact._tracked_files()},
+                  "tests": RECORDED}
+    (pytester.path / "impact_map.json").write_text(json.dumps(impact_map), encoding="utf-8")
+    yield pytester
+    impact._attributes_read_by_methods.cache_clear()
+
+
+def edit(repo, rel_path, old, new):
+    path = repo.path / rel_path
+    content = path.read_text(encoding="utf-8")
+    assert old in content
+    path.write_text(content.replace(old, new), encoding="utf-8")
+
+
+def select(repo, items=None):
+    if items is None:
+        items, _ = repo.inline_genitems("test_checkout.py")
+    selector = ImpactSelector(repo.path / "impact_map.json", "HEAD")
+    selected = selector.select(items)
+    return None if selected is None else [item.name for item in selected], selector.reason
+
+
+def test_changed_lines_map_to_symbols(repo):
+    path = "pages/checkout_page.py"
+
+    assert _changed_symbols(path, {9}) == {"CheckoutOverviewPage.get_total"}
+    assert _changed_symbols(path, {5}) == {"CheckoutOverviewPage.TOTAL_LABEL"}
+    assert _changed_symbols(path, {12, 13}) == {"CheckoutOverviewPage.click_finish"}
+    # Class header: every method of the class
+    assert _changed_symbols(path, {4}) == {"CheckoutOverviewPage.get_total", "CheckoutOverviewPage.click_finish"}
+    # Blank lines between definitions change nothing, an import is module level code
+    assert _changed_symbols(path, {3}) == set()
+    assert _changed_symbols(path, {1}) is None
+
+
+def test_changed_method_selects_its_tests(repo):
+    edit(repo, "pages/checkout_page.py", "self.click_element(self.FINISH_BUTTON)",
+         "self.click_element(self.FINISH_BUTTON, retries=2)")
+
+    assert select(repo)[0] == ["test_finish"]
+
+
+def test_changed_locator_selects_methods_reading_it(repo):
+    edit(repo, "pages/checkout_page.py", '".summary_total_label"', '"[data-test=total-label]"')
+
+    assert select(repo)[0] == ["test_total"]
+
+
+def test_changed_data_selects_tests_reading_it(repo):
+    edit(repo, "tests/data.py", '"Sauce Labs Onesie"', '"Sauce Labs Onesie (red)"')
+
+    assert select(repo)[0] == ["test_onesie"]
+
+
+def test_changed_test_file_selects_its_tests(repo):
+    edit(repo, "test_checkout.py", "def test_login():\n    pass", "def test_login():\n    assert True")
+
+    assert select(repo)[0] == ["test_total", "test_finish", "test_login", "test_onesie"]
+
+
+@pytest.mark.parametrize("rel_path, old, new", [
+    ("conftest.py", "", "import pytest\n"),
+    ("pages/checkout_page.py", "from selenium.webdriver.common.by import By",
+     "from selenium.webdriver.common.by import By as Locate"),
+    ("tests/data.py", "class Products:", "DEFAULT_PRODUCT = 'Sauce Labs Backpack'\n\n\nclass Products:"),
+], ids=["conftest", "page module level", "data module level"])
+def test_framework_and_module_level_changes_run_the_full_suite(repo, rel_path, old, new):
+    path = repo.path / rel_path
+    path.write_text(new + path.read_text(encoding="utf-8") if old == "" else
+                    path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+    selected, reason = select(repo)
+
+    assert selected is None
+    assert rel_path in reason
+
+
+def test_stale_map_runs_the_full_suite(repo):
+    # Committed after the map was recorded: not in the diff, but no longer the recorded code
+    edit(repo, "pages/login_page.py", "return username", "return username.strip()")
+    git(repo.path, "commit", "-q", "-am", "trim user names")
+
+    selected, reason = select(repo)
+
+    assert selected is None
+    assert reason == "impact map is stale, pages/login_page.py changed since it was recorded"
+
+
+def test_unrecorded_test_runs_the_full_suite(repo):
+    repo.makepyfile(test_new="def test_new():\n    pass\n")
+    items, _ = repo.inline_genitems("test_checkout.py", "test_new.py")
+
+    selected, reason = select(repo, items)
+
+    assert selected is None
+    assert reason.startswith("impact map is stale, 1 tests not recorded")
+
+
+def test_tests_reading_changed_data_are_selected(pytester):
+    items = pytester.getitems("""
+        from tests.data import Products
+
+        def test_onesie():
+            assert Products.SAUCE_LABS_ONESIE
+
+        def test_no_data():
+            pass
+    """)
+
+    assert selected_names(items) == ["test_onesie"]
+
+
+def test_module_level_data_selects_the_whole_module(pytester):
+    items = pytester.getitems("""
+        import pytest
+        from tests.data import Products
+
+        PRODUCTS = [value for name, value in vars(Products).items() if name.isupper()]
+
+        @pytest.mark.parametrize("product", PRODUCTS)
+        def test_product(product):
+            pass
+
+        def test_no_data():
+            pass
+    """)
+
+    assert len(selected_names(items)) == len(items)
+
+
+def test_parameters_holding_changed_data_are_selected(pytester):
+    pytester.makeconftest("""
+        from tests.data import Products
+
+        def pytest_generate_tests(metafunc):
+            if "product" in metafunc.fixturenames:
+                metafunc.parametrize("product", [{"name": Products.SAUCE_LABS_ONESIE}, {"name": Products.SAUCE_LABS_BACKPACK}])
+    """)
+    items = pytester.getitems("""
+        def test_product(product):
+            pass
+    """)
+
+    assert selected_names(items) == ["test_product[product0]"]
+
+
+def test_selector_plugin_deselects_unaffected_tests(repo):
+    edit(repo, "pages/checkout_page.py", '".summary_total_label"', '"[data-test=total-label]"')
+
+    result = repo.inline_run("test_checkout.py", plugins=[ImpactSelector(repo.path / "impact_map.json", "HEAD")])
+
+    assert [report.nodeid for report in result.getreports("pytest_runtest_logreport") if report.when == "call"] == \
+        ["test_checkout.py::test_total"]
+    assert len(result.getcall("pytest_deselected").items) == 3
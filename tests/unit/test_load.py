@@ -0,0 +1,26 @@
+# tests/unit/test_load.py
+import threading
+
+from tests.data import User
+from tool.load import LoadStats, VirtualUser
+
+
+class CrashedDriver:
+    """A browser that died: every command fails"""
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            raise ConnectionRefusedError(f"{name}: browser is gone")
+        return command
+
+
+def test_crashed_browser_is_recorded_and_stops_the_virtual_user():
+    stats = LoadStats()
+    user = VirtualUser("vu-1", "standard_user", User.STANDARD_USER, CrashedDriver, stats, threading.Event(),
+                       iterations=3)
+
+    user.start()
+    user.join(timeout=10)
+
+    assert not user.is_alive()
+    assert sorted(stats.errors) == [("standard_user", step) for step in ("login", "quit_browser", "reset_session")]
@@ -0,0 +1,108 @@
+# tests/unit/test_locator_registry.py
+import re
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from tests.data import Products
+from tool.locator_registry import (LocatorCheckPlugin, LocatorRegistry, as_css_or_xpath, product_locators,
+                                   xpath_literal)
+from tool.scenarios import catalog
+
+
+def check(**locators):
+    """Runs the static checks over the given locators only, keyed like the registry"""
+    registry = LocatorRegistry()
+    registry.locators = {name.replace("__", "."): locator for name, locator in locators.items()}
+    return registry.check()
+
+
+def literal_value(literal):
+    """The string an XPath 1.0 literal or concat() of literals evaluates to"""
+    parts = re.findall(r"'([^']*)'|\"([^\"]*)\"", literal)
+    if not literal.startswith("concat("):
+        assert len(parts) == 1
+    return "".join(single or double for single, double in parts)
+
+
+def test_real_page_locators_have_no_errors():
+    registry = LocatorRegistry(products=catalog(Products).values())
+
+    assert [issue for issue in registry.check() if issue.severity == "error"] == []
+
+
+def test_valid_locators_have_no_issues():
+    assert check(
+        Page__BUTTON=(By.ID, "login-button"),
+        Page__TITLE=(By.CLASS_NAME, "title"),
+        Page__ITEMS=(By.CSS_SELECTOR, "div[data-test='inventory-item']"),
+        Page__LINK=(By.XPATH, "//a[normalize-space()=\"Sauce Labs' Onesie\"]"),
+        Page__CHILD=(By.XPATH, ".//span"),
+    ) == []
+
+
+def test_same_element_declared_twice_is_a_warning():
+    issues = check(
+        LoginPage__BUTTON=(By.ID, "login-button"),
+        OtherPage__LOGIN=(By.CSS_SELECTOR, '[id="login-button"]'),
+        OtherPage__TITLE=(By.CLASS_NAME, "title"),
+    )
+
+    assert [(issue.severity, issue.name) for issue in issues] == [("warning", "LoginPage.BUTTON, OtherPage.LOGIN")]
+    assert issues[0].message == 'same element declared 2 times as [id="login-button"]'
+
+
+@pytest.mark.parametrize("locator, message", [
+    ((By.CSS_SELECTOR, "div[data-test='item']']"), "unbalanced brackets or quotes"),
+    ((By.CSS_SELECTOR, "input[name='user]"), "unbalanced brackets or quotes"),
+    ((By.XPATH, "//div[@id='cart'"), "unbalanced brackets or quotes"),
+    ((By.XPATH, "div[@id='cart']"), "is not an absolute or relative path"),
+    ((By.ID, "add to cart"), "id 'add to cart' contains a space"),
+    ((By.CLASS_NAME, "btn btn_primary"), "class name 'btn btn_primary' contains a space"),
+    ((By.CSS_SELECTOR, "  "), "empty selector"),
+    (("shadow", "#root"), "unknown strategy 'shadow'"),
+], ids=["css quote", "css unclosed quote", "xpath bracket", "xpath not a path", "id space", "class space",
+        "empty", "strategy"])
+def test_broken_locators_are_errors(locator, message):
+    issues = check(Page__BROKEN=locator)
+
+    assert [(issue.severity, issue.name) for issue in issues] == [("error", "Page.BROKEN")]
+    assert message in issues[0].message
+
+
+@pytest.mark.parametrize("text", ["Sauce Labs Onesie", "Sauce Labs' Onesie", 'The "Bolt" Shirt',
+                                  "It's the \"Bolt\" shirt's 'tee'", "'", "''"])
+def test_xpath_literal_round_trips(text):
+    assert literal_value(xpath_literal(text)) == text
+
+
+def test_product_name_with_apostrophe_gives_valid_xpath():
+    locators = product_locators("Sauce Labs' \"Bolt\" T-Shirt")
+
+    assert locators.name_link[1].endswith(
+        """normalize-space()=concat('Sauce Labs', "'", ' "Bolt" T-Shirt')]""")
+    assert check(Page__NAME=locators.name_link) == []
+    assert as_css_or_xpath((By.LINK_TEXT, "Sauce Labs' Onesie")) == \
+        (By.XPATH, "//a[normalize-space()=\"Sauce Labs' Onesie\"]")
+
+
+def test_check_plugin_stops_the_run_on_invalid_locators(pytester):
+    pytester.makepyfile(test_nothing="def test_nothing():\n    pass\n")
+
+    # Its add and remove button ids would hold both quote kinds
+    result = pytester.runpytest(plugins=[LocatorCheckPlugin(["Sauce Labs' \"Bolt\" T-Shirt"])])
+
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*Invalid locators: products[[]Sauce Labs' \"Bolt\" T-Shirt[]].add_button*"])
+
+
+def test_check_plugin_without_fixtures_does_not_profile(pytester):
+    pytester.makepyfile(test_nothing="def test_nothing():\n    pass\n")
+    plugin = LocatorCheckPlugin(catalog(Products).values(),
+                                start_browser=lambda: pytest.fail("no browser expected"))
+
+    result = pytester.runpytest(plugins=[plugin])
+
+    result.assert_outcomes(passed=1)
+    assert plugin.results is None
+    assert "locator profile" not in result.stdout.str()
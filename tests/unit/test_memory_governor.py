@@ -0,0 +1,73 @@
+# tests/unit/test_memory_governor.py
+from types import SimpleNamespace
+
+import pytest
+
+from tool import memory_governor
+from tool.memory_governor import MemoryGovernor, descendant_pids
+
+DRIVER_PID = 100
+
+
+def add_process(proc, pid, ppid, name, rss_kb):
+    process_dir = proc / str(pid)
+    process_dir.mkdir()
+    (process_dir / "stat").write_text(f"{pid} ({name}) S {ppid} {pid} {pid} 0 -1\n", encoding="utf-8")
+    (process_dir / "status").write_text(f"Name:\t{name}\nVmRSS:\t{rss_kb} kB\n", encoding="utf-8")
+
+
+@pytest.fixture
+def proc(tmp_path, monkeypatch):
+    """chromedriver (2 MB) -> chrome (100 MB) -> renderer with a space in its name (50 MB), plus a stranger"""
+    add_process(tmp_path, 1, 0, "init", 1024)
+    add_process(tmp_path, DRIVER_PID, 1, "chromedriver", 2 * 1024)
+    add_process(tmp_path, 101, DRIVER_PID, "chrome", 100 * 1024)
+    add_process(tmp_path, 102, 101, "Web Content", 50 * 1024)
+    add_process(tmp_path, 200, 1, "bash", 10 * 1024)
+    (tmp_path / "self").mkdir()
+    monkeypatch.setattr(memory_governor, "PROC", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def driver():
+    return SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(pid=DRIVER_PID)))
+
+
+def test_descendant_pids_walk_the_whole_tree(proc):
+    assert sorted(descendant_pids(DRIVER_PID)) == [101, 102]
+    assert descendant_pids(102) == []
+
+
+def test_recycle_after_max_tests(proc, driver):
+    governor = MemoryGovernor(max_tests=2)
+
+    assert not governor.should_recycle(driver)
+    assert governor.should_recycle(driver)
+    governor.browser_recycled()
+    assert not governor.should_recycle(driver)
+
+
+def test_recycle_at_rss_limit(proc, driver):
+    assert MemoryGovernor(max_rss_mb=150).should_recycle(driver)
+    assert not MemoryGovernor(max_rss_mb=200).should_recycle(driver)
+
+
+def test_remote_session_is_not_sampled(proc):
+    governor = MemoryGovernor(max_rss_mb=1)
+
+    assert not governor.should_recycle(SimpleNamespace())
+    assert governor.summary() == {"samples": 0, "recycles": 0}
+
+
+def test_summary_reports_peak_and_average(proc, driver):
+    governor = MemoryGovernor()
+    governor.should_recycle(driver)
+    (proc / "102").rename(proc / "gone")
+    governor.should_recycle(driver)
+    governor.browser_recycled()
+
+    assert governor.summary() == {
+        "samples": 2, "recycles": 1, "driver_peak_mb": 2.0, "browser_peak_mb": 150.0,
+        "total_peak_mb": 152.0, "total_avg_mb": 127.0,
+    }
@@ -0,0 +1,61 @@
+# tests/unit/test_remote_grid.py
+from unittest import mock
+
+import pytest
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from tool.remote_grid import CommandStats, PooledRemoteConnection, RemoteGridPlugin
+
+
+def test_summary_mean_p95_and_order():
+    stats = CommandStats()
+    for ms in range(1, 21):
+        stats.record("findElement", ms / 1000)
+    stats.record("get", 0.5)
+
+    rows = stats.summary()
+
+    assert [row[0] for row in rows] == ["get", "findElement"]
+    command, count, mean_ms, p95_ms, total_ms = rows[1]
+    assert (count, mean_ms, p95_ms, total_ms) == (20, pytest.approx(10.5), pytest.approx(20.0), pytest.approx(210.0))
+    assert stats.total_commands() == 21
+
+
+def test_pool_settings_reach_urllib3():
+    connection = PooledRemoteConnection("http://grid:4444", CommandStats(), pool_size=3)
+
+    assert (connection._conn.connection_pool_kw["maxsize"], connection._conn.connection_pool_kw["block"]) == (3, True)
+
+
+def test_connection_records_timing_per_command():
+    stats = CommandStats()
+    connection = PooledRemoteConnection("http://grid:4444", stats)
+
+    with mock.patch.object(RemoteConnection, "_request", return_value={"status": 200, "value": "Swag Labs"}):
+        connection.execute(Command.GET_TITLE, {"sessionId": "abc"})
+        connection.execute(Command.GET_TITLE, {"sessionId": "abc"})
+        connection.execute(Command.GET_CURRENT_URL, {"sessionId": "abc"})
+
+    assert {command: len(timings) for command, timings in stats.timings.items()} == \
+        {Command.GET_TITLE: 2, Command.GET_CURRENT_URL: 1}
+
+
+def test_worker_timings_are_merged_by_the_controller(tmp_path, monkeypatch):
+    for worker, baseline, seconds in (("gw0", 0.004, 0.1), ("gw1", 0.002, 0.3)):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+        plugin = RemoteGridPlugin("http://grid:4444", tmp_path)
+        plugin.stats.baseline = baseline
+        plugin.stats.record(Command.GET, seconds)
+        plugin.pytest_sessionfinish(session=None)
+
+    merged = CommandStats.load(sorted(tmp_path.glob("*.json")))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["gw0.json", "gw1.json"]
+    assert (merged.baseline, merged.timings) == (0.002, {Command.GET: [0.1, 0.3]})
+
+
+def test_worker_without_commands_writes_nothing(tmp_path):
+    RemoteGridPlugin("http://grid:4444", tmp_path).pytest_sessionfinish(session=None)
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,143 @@
+# tests/unit/test_result_sink.py
+import json
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from tool.result_sink import main, read_records
+
+SINK_CONFTEST = """
+from tool.result_sink import ResultSink
+from tool.retry import FlakeStats, RetryPlugin
+
+def pytest_configure(config):
+    config.pluginmanager.register(RetryPlugin(1, 0, FlakeStats("flaky_stats.json")), "retry_engine")
+    config.pluginmanager.register(ResultSink("results.jsonl", junit_path="junit.xml", suite_name="unit"), "result_sink")
+"""
+
+OUTCOMES_MODULE = """
+import pytest
+
+ATTEMPTS = []
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("no browser")
+
+def test_pass(record_property):
+    record_property("browser", "chrome")
+
+def test_fail():
+    assert 1 == 2
+
+def test_setup_error(broken):
+    pass
+
+def test_skip():
+    pytest.skip("not on this browser")
+
+@pytest.mark.xfail(reason="known bug")
+def test_xfail():
+    assert False
+
+@pytest.mark.xfail(reason="known bug")
+def test_xpass():
+    pass
+
+def test_rerun_then_pass():
+    ATTEMPTS.append(1)
+    assert len(ATTEMPTS) > 1
+"""
+
+
+@pytest.fixture
+def sink_run(pytester):
+    pytester.makeconftest(SINK_CONFTEST)
+    pytester.makepyfile(test_outcomes=OUTCOMES_MODULE)
+    pytester.runpytest()
+    return pytester
+
+
+def record(nodeid, outcome="passed", start=0.0, stop=None, reruns=0):
+    return {"type": "test", "nodeid": nodeid, "location": [nodeid, 0, nodeid], "outcome": outcome, "when": None,
+            "message": None, "longrepr": None, "duration": 1.0, "start": start,
+            "stop": start + 1.0 if stop is None else stop, "reruns": reruns, "output": "", "properties": [],
+            "artifacts": []}
+
+
+def write_results(path, records):
+    path.write_text("".join(json.dumps(line) + "\n" for line in records), encoding="utf-8")
+    return path
+
+
+def test_records_carry_outcome_of_every_kind(sink_run):
+    records = {line["nodeid"].split("::")[-1]: line for line in read_records(sink_run.path / "results.jsonl")}
+
+    assert {name: line["outcome"] for name, line in records.items()} == {
+        "test_pass": "passed",
+        "test_fail": "failed",
+        "test_setup_error": "error",
+        "test_skip": "skipped",
+        "test_xfail": "xfailed",
+        "test_xpass": "xpassed",
+        "test_rerun_then_pass": "passed",
+    }
+    assert records["test_rerun_then_pass"]["reruns"] == 1
+    assert records["test_fail"]["message"].startswith("assert 1 == 2")
+    assert (records["test_setup_error"]["when"], records["test_setup_error"]["message"]) == \
+        ("setup", "RuntimeError: no browser")
+    assert records["test_skip"]["message"] == "Skipped: not on this browser"
+    assert records["test_pass"]["properties"] == [["browser", "chrome"]]
+
+
+def test_junit_counts_and_properties(sink_run):
+    suite = ElementTree.parse(sink_run.path / "junit.xml").getroot().find("testsuite")
+    cases = {case.get("name"): case for case in suite.iter("testcase")}
+
+    assert {key: suite.get(key) for key in ("name", "tests", "failures", "errors", "skipped")} == \
+        {"name": "unit", "tests": "7", "failures": "1", "errors": "1", "skipped": "2"}
+    # test_fail and test_rerun_then_pass, a setup error is rerun but has no call to count
+    assert suite.find("properties/property[@name='retried_tests']").get("value") == "2"
+    assert cases["test_pass"].find("properties/property[@name='browser']").get("value") == "chrome"
+    assert cases["test_rerun_then_pass"].find("properties/property[@name='reruns']").get("value") == "1"
+    assert cases["test_fail"].find("failure") is not None
+    assert cases["test_setup_error"].find("error") is not None
+    assert cases["test_xfail"].find("skipped").get("type") == "pytest.xfailed"
+    assert list(cases["test_pass"]) == [cases["test_pass"].find("properties")]
+
+
+def test_shards_merge_in_completion_order(tmp_path):
+    first = write_results(tmp_path / "shard1.jsonl", [
+        {"type": "session", "start": 0.0, "host": "runner-1"},
+        # Appended at teardown: a long test finishing last started first
+        record("tests/test_a.py::test_short", start=5.0, stop=6.0),
+        record("tests/test_a.py::test_long", start=1.0, stop=9.0, outcome="failed"),
+    ])
+    second = write_results(tmp_path / "shard2.jsonl", [
+        {"type": "session", "start": 0.5, "host": "runner-2"},
+        record("tests/test_b.py::test_one", start=2.0, stop=3.0),
+        # Reported a little late by its worker
+        record("tests/test_b.py::test_three", start=6.0, stop=8.0, reruns=1),
+        record("tests/test_b.py::test_two", start=3.0, stop=7.0, outcome="skipped"),
+    ])
+    junit_path = tmp_path / "merged.xml"
+
+    assert main([str(first), str(second), "--junit", str(junit_path)]) == 0
+
+    suite = ElementTree.parse(junit_path).getroot().find("testsuite")
+    assert [case.get("name") for case in suite.iter("testcase")] == \
+        ["test_one", "test_short", "test_two", "test_three", "test_long"]
+    assert {key: suite.get(key) for key in ("tests", "failures", "skipped", "hostname")} == \
+        {"tests": "5", "failures": "1", "skipped": "1", "hostname": "runner-1"}
+    assert suite.find("properties/property[@name='retried_tests']").get("value") == "1"
+
+
+def test_truncated_last_line_is_skipped(tmp_path):
+    results = write_results(tmp_path / "results.jsonl", [record("tests/test_a.py::test_one")])
+    with open(results, "a", encoding="utf-8") as results_file:
+        results_file.write(json.dumps(record("tests/test_a.py::test_two"))[:40])
+    junit_path = tmp_path / "junit.xml"
+
+    assert [line["nodeid"] for line in read_records(results)] == ["tests/test_a.py::test_one"]
+    main([str(results), "--junit", str(junit_path)])
+    assert ElementTree.parse(junit_path).getroot().find("testsuite").get("tests") == "1"
@@ -0,0 +1,165 @@
+# tests/unit/test_retry.py
+import json
+
+import pytest
+
+RETRY_CONFTEST = """
+import pytest
+from tool.retry import FlakeStats, RetryPlugin
+
+EVENTS = []
+
+def pytest_addoption(parser):
+    parser.addoption("--lane", default="all")
+
+def pytest_configure(config):
+    config.pluginmanager.register(
+        RetryPlugin(1, 0, FlakeStats("flaky_stats.json"), lane=config.getoption("--lane")), "retry_engine"
+    )
+
+@pytest.fixture(scope="session")
+def browser():
+    EVENTS.append("browser setup")
+    yield
+    EVENTS.append("browser teardown")
+
+@pytest.fixture(scope="module")
+def page(request):
+    EVENTS.append(f"page setup {request.module.__name__}")
+    yield
+    EVENTS.append(f"page teardown {request.module.__name__}")
+"""
+
+
+@pytest.fixture
+def retry_pytester(pytester):
+    pytester.makeconftest(RETRY_CONFTEST)
+    return pytester
+
+
+def flake_history(pytester):
+    with open(pytester.path / "flaky_stats.json", encoding="utf-8") as stats_file:
+        return json.load(stats_file)
+
+
+def test_failed_test_is_rerun_and_recorded_flaky(retry_pytester):
+    retry_pytester.makepyfile(test_flaky="""
+        ATTEMPTS = []
+
+        def test_passes_on_retry():
+            ATTEMPTS.append(1)
+            assert len(ATTEMPTS) > 1
+    """)
+
+    result = retry_pytester.runpytest()
+
+    assert result.parseoutcomes() == {"rerun": 1, "flaky": 1}
+    assert flake_history(retry_pytester) == {"test_flaky.py::test_passes_on_retry": ["R"]}
+
+
+def test_test_failing_every_attempt_is_recorded_failed(retry_pytester):
+    retry_pytester.makepyfile(test_broken="""
+        def test_always_fails():
+            assert False
+    """)
+
+    result = retry_pytester.runpytest()
+
+    assert result.parseoutcomes() == {"failed": 1, "rerun": 1}
+    assert flake_history(retry_pytester) == {"test_broken.py::test_always_fails": ["F"]}
+
+
+def test_passing_test_tears_down_before_next_module(retry_pytester):
+    retry_pytester.makepyfile(
+        test_first="""
+            def test_first(browser, page):
+                pass
+        """,
+        test_second="""
+            from conftest import EVENTS
+
+            def test_second(browser, page):
+                assert EVENTS == ["browser setup", "page setup test_first", "page teardown test_first",
+                                  "page setup test_second"]
+        """,
+    )
+
+    result = retry_pytester.runpytest("test_first.py", "test_second.py")
+
+    assert result.parseoutcomes() == {"passed": 2}
+    assert flake_history(retry_pytester) == {"test_first.py::test_first": ["P"], "test_second.py::test_second": ["P"]}
+
+
+def test_rerun_before_next_module_sets_up_module_again(retry_pytester):
+    retry_pytester.makepyfile(
+        test_first="""
+            ATTEMPTS = []
+
+            def test_first(browser, page):
+                ATTEMPTS.append(1)
+                assert len(ATTEMPTS) > 1
+        """,
+        test_second="""
+            from conftest import EVENTS
+
+            def test_second(browser, page):
+                assert EVENTS == ["browser setup",
+                                  "page setup test_first", "page teardown test_first",
+                                  "page setup test_first", "page teardown test_first",
+                                  "page setup test_second"]
+        """,
+    )
+
+    result = retry_pytester.runpytest("test_first.py", "test_second.py")
+
+    assert result.parseoutcomes() == {"passed": 1, "rerun": 1, "flaky": 1}
+
+
+def test_last_test_is_rerun_in_the_same_session(retry_pytester):
+    retry_pytester.makepyfile(test_last="""
+        from conftest import EVENTS
+
+        def test_last(browser):
+            assert EVENTS.count("browser setup") == 1
+            EVENTS.append("attempt")
+            assert EVENTS.count("attempt") > 1
+    """)
+
+    result = retry_pytester.runpytest()
+
+    assert result.parseoutcomes() == {"rerun": 1, "flaky": 1}
+
+
+@pytest.mark.parametrize("lane, expected", [
+    ("main", ["test_lanes.py::test_stable"]),
+    ("quarantine", ["test_lanes.py::test_chronically_flaky"]),
+    ("all", ["test_lanes.py::test_chronically_flaky", "test_lanes.py::test_stable"]),
+])
+def test_lane_selects_tests_by_flake_history(retry_pytester, lane, expected):
+    retry_pytester.makepyfile(test_lanes="""
+        def test_chronically_flaky():
+            pass
+
+        def test_stable():
+            pass
+    """)
+    (retry_pytester.path / "flaky_stats.json").write_text(json.dumps({
+        "test_lanes.py::test_chronically_flaky": ["R", "P", "R", "P", "R"],
+        "test_lanes.py::test_stable": ["P", "P", "P", "P", "R"],
+    }), encoding="utf-8")
+
+    result = retry_pytester.runpytest("--lane", lane, "--collect-only", "-q")
+
+    assert [line for line in result.outlines if line.startswith("test_lanes.py::")] == expected
+
+
+def test_setup_only_does_not_run_test_bodies(retry_pytester):
+    retry_pytester.makepyfile(test_body="""
+        def test_body(browser):
+            raise AssertionError("boom")
+    """)
+
+    result = retry_pytester.runpytest("--setup-only")
+
+    result.stdout.no_fnmatch_line("*boom*")
+    assert result.ret == pytest.ExitCode.OK
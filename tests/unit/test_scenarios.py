@@ -0,0 +1,81 @@
+# tests/unit/test_scenarios.py
+from itertools import combinations, product
+
+import pytest
+
+from tests.data import CheckoutInfo, Products, User
+from tests.test_e2e_checkout import CHECKOUT_SCENARIOS
+from tool.scenarios import catalog, covering_array, scenario_params
+
+SHAPES = {
+    "2x2x2": {"a": ["a1", "a2"], "b": ["b1", "b2"], "c": ["c1", "c2"]},
+    "3x4x2x5": {"a": ["a1", "a2", "a3"], "b": ["b1", "b2", "b3", "b4"], "c": ["c1", "c2"],
+                "d": ["d1", "d2", "d3", "d4", "d5"]},
+    "6x1x3": {"a": [f"a{index}" for index in range(6)], "b": ["b1"], "c": ["c1", "c2", "c3"]},
+}
+
+
+def missing_interactions(parameters, rows, strength):
+    """Brute force: every value combination of every `strength` parameters that no row holds"""
+    missing = []
+    for names in combinations(parameters, strength):
+        seen = {tuple(row[name] for name in names) for row in rows}
+        missing.extend((names, values) for values in product(*(parameters[name] for name in names))
+                       if values not in seen)
+    return missing
+
+
+def test_checkout_scenarios_cover_every_pair():
+    catalogs = [list(catalog(User, include=("STANDARD_USER", "PERFORMANCE_GLITCH_USER")).values()),
+                list(catalog(Products).values()), list(catalog(CheckoutInfo).values())]
+    rows = [[options.index(value) for options, value in zip(catalogs, scenario.values)]
+            for scenario in CHECKOUT_SCENARIOS]
+
+    for first, second in combinations(range(len(catalogs)), 2):
+        pairs = {(row[first], row[second]) for row in rows}
+        assert pairs == set(product(range(len(catalogs[first])), range(len(catalogs[second]))))
+    assert len(rows) < len(catalogs[0]) * len(catalogs[1]) * len(catalogs[2])
+
+
+@pytest.mark.parametrize("shape", SHAPES, ids=str)
+@pytest.mark.parametrize("strength", [2, 3])
+def test_every_interaction_is_covered(shape, strength):
+    parameters = SHAPES[shape]
+
+    assert missing_interactions(parameters, covering_array(parameters, strength), strength) == []
+
+
+def test_full_strength_is_the_cross_product():
+    parameters = SHAPES["2x2x2"]
+
+    rows = covering_array(parameters, strength=3)
+
+    assert sorted(tuple(row.values()) for row in rows) == sorted(product(*parameters.values()))
+
+
+def test_pinned_rows_come_first():
+    parameters = SHAPES["3x4x2x5"]
+    pinned = [{"a": "a3", "b": "b4", "c": "c2", "d": "d5"}, {"a": "a1", "b": "b2", "c": "c1", "d": "d3"}]
+
+    rows = covering_array(parameters, pinned=pinned)
+
+    assert rows[:2] == pinned
+    assert missing_interactions(parameters, rows, 2) == []
+
+
+def test_generation_is_deterministic():
+    parameters = SHAPES["3x4x2x5"]
+    catalogs = {"user": catalog(User), "product": catalog(Products)}
+
+    assert covering_array(parameters, 3) == covering_array(parameters, 3)
+    assert [param.id for param in scenario_params(catalogs)] == [param.id for param in scenario_params(catalogs)]
+
+
+@pytest.mark.parametrize("pin, message", [
+    ({"a": "a1", "b": "b1", "c": "c1", "x": "x1"}, r"unknown parameters \['x'\]"),
+    ({"a": "a1", "b": "b1"}, r"must give a value for \['c'\]"),
+    ({"a": "a1", "b": "y", "c": "c1"}, r"unknown value 'y' for 'b', available: b1, b2"),
+])
+def test_invalid_pinned_scenario_is_reported(pin, message):
+    with pytest.raises(ValueError, match=message):
+        covering_array(SHAPES["2x2x2"], pinned=[pin])
@@ -0,0 +1,153 @@
+# tests/unit/test_startup.py
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tool.startup import DoctestScope, StartupProfile
+
+ROOT = Path(__file__).resolve().parents[2]
+
+WITH_DOCTEST = '''
+def double(value):
+    """
+    >>> double(2)
+    4
+    """
+    return value * 2
+'''
+
+WITHOUT_DOCTEST = '''
+PROMPT = ">>> "
+
+
+def double(value):
+    """Shell prompt in a string, example output in a comment: # >>> double(2)"""
+    return value * 2
+'''
+
+
+def touch(path, content=None):
+    """Rewrites the file, keeping its size unless content is given, with a newer mtime"""
+    stat = path.stat()
+    path.write_text(path.read_text(encoding="utf-8") if content is None else content, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_only_prompt_lines_count_as_doctests(tmp_path):
+    (tmp_path / "with_doctest.py").write_text(WITH_DOCTEST, encoding="utf-8")
+    (tmp_path / "without_doctest.py").write_text(WITHOUT_DOCTEST, encoding="utf-8")
+    scope = DoctestScope(tmp_path / "scope.json")
+
+    assert scope.has_doctests(tmp_path / "with_doctest.py")
+    assert not scope.has_doctests(tmp_path / "without_doctest.py")
+    assert (scope.scanned, scope.cached, scope.skipped) == (2, 0, 1)
+
+
+def test_answers_are_cached_between_runs(tmp_path):
+    module = tmp_path / "with_doctest.py"
+    module.write_text(WITH_DOCTEST, encoding="utf-8")
+    DoctestScope(tmp_path / "scope.json").has_doctests(module)
+    first_run = DoctestScope(tmp_path / "scope.json")
+    first_run.has_doctests(module)
+    first_run.save()
+
+    second_run = DoctestScope(tmp_path / "scope.json")
+
+    assert second_run.has_doctests(module)
+    assert (second_run.scanned, second_run.cached) == (0, 1)
+
+
+def test_changed_files_are_scanned_again(tmp_path):
+    same_size = tmp_path / "same_size.py"
+    same_size.write_text(WITH_DOCTEST, encoding="utf-8")
+    grown = tmp_path / "grown.py"
+    grown.write_text(WITHOUT_DOCTEST, encoding="utf-8")
+    scope = DoctestScope(tmp_path / "scope.json")
+    for module in (same_size, grown):
+        scope.has_doctests(module)
+    scope.save()
+
+    # Same size, newer mtime: the prompt became a comment
+    touch(same_size, WITH_DOCTEST.replace(">>> double(2)", "### double(2)"))
+    touch(grown, WITHOUT_DOCTEST + WITH_DOCTEST)
+    rescan = DoctestScope(tmp_path / "scope.json")
+
+    assert not rescan.has_doctests(same_size)
+    assert rescan.has_doctests(grown)
+    assert (rescan.scanned, rescan.cached) == (2, 0)
+
+
+def test_save_drops_removed_files_and_skips_unchanged_cache(tmp_path):
+    kept, removed = tmp_path / "kept.py", tmp_path / "removed.py"
+    for module in (kept, removed):
+        module.write_text(WITH_DOCTEST, encoding="utf-8")
+    cache_path = tmp_path / "output" / "scope.json"
+    scope = DoctestScope(cache_path)
+    for module in (kept, removed):
+        scope.has_doctests(module)
+    removed.unlink()
+
+    scope.save()
+    saved_mtime = cache_path.stat().st_mtime_ns
+    scope.save()
+
+    assert list(json.loads(cache_path.read_text(encoding="utf-8"))) == [str(kept.resolve())]
+    assert cache_path.stat().st_mtime_ns == saved_mtime
+
+
+def test_corrupt_cache_scans_everything(tmp_path):
+    module = tmp_path / "with_doctest.py"
+    module.write_text(WITH_DOCTEST, encoding="utf-8")
+    (tmp_path / "scope.json").write_text('{"truncat', encoding="utf-8")
+    scope = DoctestScope(tmp_path / "scope.json")
+
+    assert scope.has_doctests(module)
+    assert scope.scanned == 1
+
+
+def test_profile_write_returns_previous_profile(tmp_path):
+    path = tmp_path / "output" / "startup.json"
+    first = StartupProfile(interpreter=0.1, conftest_import=0.2, modules_imported=8)
+    first.phases["collection"] = 0.3
+    second = StartupProfile(interpreter=0.1, conftest_import=0.05, modules_imported=5)
+
+    assert first.write(path) is None
+    previous = second.write(path)
+
+    assert previous == {"phases": {"interpreter": 0.1, "conftest_import": 0.2, "collection": 0.3},
+                        "total": first.total(), "modules_imported": 8, "collected": 0}
+    assert json.loads(path.read_text(encoding="utf-8")) == second.to_dict()
+
+
+def test_profile_ignores_unreadable_previous_profile(tmp_path):
+    path = tmp_path / "startup.json"
+    path.write_text("", encoding="utf-8")
+
+    assert StartupProfile(None, 0.1, 3).write(path) is None
+
+
+def test_phase_is_timed_once():
+    profile = StartupProfile(interpreter=None, conftest_import=0.01, modules_imported=0)
+    profile.start("first_test")
+    profile.stop("first_test")
+    first_test = profile.phases["first_test"]
+
+    # Every later test start reports the phase end again
+    profile.stop("first_test")
+    profile.stop("configure")
+
+    assert profile.phases["first_test"] == first_test
+    assert "configure" not in profile.phases
+    assert profile.total() == 0.01 + first_test
+
+
+def test_conftest_import_leaves_features_unloaded():
+    lazy = ["selenium.webdriver.remote.webdriver", "pages.base_page", "pytest_asyncio", "tool.async_driver",
+            "tool.impact", "tool.locator_registry", "tool.remote_grid", "tool.result_sink"]
+    script = f"import sys, conftest; print([name for name in {lazy!r} if name in sys.modules])"
+
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,130 @@
+# tests/unit/test_visual.py
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from tool.visual import VisualChecker
+
+WIDTH, HEIGHT = 64, 48
+
+
+def screenshot(pixels, compress_level=6):
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG", compress_level=compress_level)
+    return buffer.getvalue()
+
+
+def grayscale(pixels):
+    return np.asarray(Image.fromarray(pixels).convert("L"), dtype=np.int16)
+
+
+@pytest.fixture
+def page_pixels():
+    # Horizontal gradient with a dark block, like a page with a button
+    pixels = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    pixels[:] = np.linspace(40, 220, WIDTH, dtype=np.uint8)[None, :, None]
+    pixels[10:20, 10:30] = 10
+    return pixels
+
+
+@pytest.fixture
+def checker(tmp_path):
+    return VisualChecker(baseline_dir=tmp_path / "baselines", diff_dir=tmp_path / "diffs", enabled=True,
+                         pixel_tolerance=16, max_diff_ratio=0.001)
+
+
+def test_missing_baseline_is_recorded(checker, page_pixels):
+    result = checker.check(screenshot(page_pixels), "inventory")
+
+    assert (result.passed, result.compared) == (True, "new baseline")
+    assert (checker.baseline_dir / "inventory.png").read_bytes() == screenshot(page_pixels)
+
+
+def test_identical_bytes_pass_by_digest(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+
+    result = checker.check(screenshot(page_pixels), "inventory")
+
+    assert (result.passed, result.compared) == (True, "digest")
+
+
+def test_same_pixels_encoded_differently_pass_by_pixels(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+
+    result = checker.check(screenshot(page_pixels, compress_level=1), "inventory")
+
+    assert (result.passed, result.compared, result.diff_ratio) == (True, "pixels", 0.0)
+
+
+def test_changes_within_tolerance_pass(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+    shifted = page_pixels.copy()
+    shifted[:, :, 0] += 8
+
+    result = checker.check(screenshot(shifted), "inventory")
+
+    assert (result.passed, result.compared, result.diff_ratio) == (True, "pixels", 0.0)
+
+
+def test_changed_region_fails_with_diff_image(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+    changed = page_pixels.copy()
+    changed[30:40, 40:60] = 255
+
+    result = checker.check(screenshot(changed), "inventory")
+
+    assert not result.passed
+    assert result.diff_ratio == pytest.approx(10 * 20 / (WIDTH * HEIGHT))
+    diff = np.asarray(Image.open(result.diff_path).convert("RGB"))
+    assert (diff[30:40, 40:60] == (255, 0, 0)).all()
+    assert (diff[:30] == page_pixels[:30]).all()
+
+
+def test_colour_change_of_full_size_page_fails(checker):
+    # A red button turning green at the same brightness, on a 1920x1080 page
+    pixels = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+    pixels[500:558, 900:1040] = (255, 0, 0)
+    checker.check(screenshot(pixels), "checkout")
+    recoloured = pixels.copy()
+    recoloured[500:558, 900:1040] = (0, 130, 0)
+    assert np.abs(grayscale(recoloured) - grayscale(pixels)).max() <= 1
+
+    result = checker.check(screenshot(recoloured), "checkout")
+
+    assert (result.passed, result.compared) == (False, "pixels")
+    assert result.diff_ratio == pytest.approx(58 * 140 / (1920 * 1080))
+
+
+def test_masked_region_is_ignored(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+    changed = page_pixels.copy()
+    changed[30:40, 40:60] = 255
+
+    result = checker.check(screenshot(changed), "inventory", masks=[(40, 30, 20, 10)])
+
+    assert (result.passed, result.diff_ratio) == (True, 0.0)
+    assert not checker.diff_dir.exists()
+
+
+def test_size_change_fails(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+
+    result = checker.check(screenshot(page_pixels[:-1]), "inventory")
+
+    assert (result.passed, result.diff_ratio) == (False, 1.0)
+    assert result.diff_path.exists()
+
+
+def test_update_baselines_replaces_baseline(checker, page_pixels):
+    checker.check(screenshot(page_pixels), "inventory")
+    changed = page_pixels.copy()
+    changed[30:40, 40:60] = 255
+    checker.configure(update_baselines=True)
+
+    result = checker.check(screenshot(changed), "inventory")
+
+    assert (result.passed, result.compared) == (True, "new baseline")
+    checker.configure(update_baselines=False)
+    assert checker.check(screenshot(changed), "inventory").compared == "digest"
@@ -0,0 +1,140 @@
+# tool/async_driver.py
+"""
+Non-blocking WebDriver client for asyncio page objects.
+
+Selenium only ships a blocking client, so every session gets one worker thread that sends its
+commands, and coroutines await them without blocking the event loop. Commands of one session keep
+their order, while waits and commands of different sessions overlap in the same event loop.
+"""
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+
+POLL_FREQUENCY = 0.5  # Same as WebDriverWait
+IGNORED_EXCEPTIONS = (NoSuchElementException,)
+
+
+class AsyncDriver:
+    """Awaitable facade of one WebDriver (or IsolatedContext) session"""
+
+    def __init__(self, driver):
+        self.wrapped_driver = driver
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webdriver")
+
+    async def run(self, func, *args, **kwargs):
+        """Runs a blocking call on the session thread"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get(self, url):
+        await self.run(self.wrapped_driver.get, url)
+
+    async def current_url(self):
+        return await self.run(lambda: self.wrapped_driver.current_url)
+
+    async def find_element(self, by, value):
+        return AsyncElement(self, await self.run(self.wrapped_driver.find_element, by, value))
+
+    async def find_elements(self, by, value):
+        return [AsyncElement(self, element) for element in await self.run(self.wrapped_driver.find_elements, by, value)]
+
+    async def execute_script(self, script, *args):
+        return await self.run(self.wrapped_driver.execute_script, script, *args)
+
+    async def get_screenshot_as_png(self):
+        return await self.run(self.wrapped_driver.get_screenshot_as_png)
+
+    async def delete_all_cookies(self):
+        await self.run(self.wrapped_driver.delete_all_cookies)
+
+    async def quit(self):
+        try:
+            await self.run(self.wrapped_driver.quit)
+        finally:
+            self.close()
+
+    def close(self):
+        """Stops the session thread, the browser itself is left to its owner"""
+        self._executor.shutdown(wait=False)
+
+
+class AsyncElement:
+    """Awaitable facade of one WebElement, commands run on the thread of its session"""
+
+    def __init__(self, driver, element):
+        self.driver = driver
+        self.wrapped_element = element
+
+    async def text(self):
+        return await self.driver.run(lambda: self.wrapped_element.text)
+
+    async def rect(self):
+        return await self.driver.run(lambda: self.wrapped_element.rect)
+
+    async def screenshot_as_png(self):
+        return await self.driver.run(lambda: self.wrapped_element.screenshot_as_png)
+
+    async def click(self):
+        await self.driver.run(self.wrapped_element.click)
+
+    async def clear(self):
+        await self.driver.run(self.wrapped_element.clear)
+
+    async def send_keys(self, *value):
+        await self.driver.run(self.wrapped_element.send_keys, *value)
+
+    async def is_displayed(self):
+        return await self.driver.run(self.wrapped_element.is_displayed)
+
+    async def find_element(self, by, value):
+        return AsyncElement(self.driver, await self.driver.run(self.wrapped_element.find_element, by, value))
+
+    async def find_elements(self, by, value):
+        elements = await self.driver.run(self.wrapped_element.find_elements, by, value)
+        return [AsyncElement(self.driver, element) for element in elements]
+
+
+class AsyncWait:
+    """
+    WebDriverWait for AsyncDriver. Takes the same expected_conditions, polls them on the session
+    thread and sleeps on the event loop in between, so other sessions keep running while it waits.
+    """
+
+    def __init__(self, driver, timeout, poll_frequency=POLL_FREQUENCY, ignored_exceptions=IGNORED_EXCEPTIONS):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.ignored_exceptions = tuple(ignored_exceptions)
+
+    async def _poll(self, condition, until):
+        end_time = time.monotonic() + self.timeout
+        while True:
+            try:
+                value = await self.driver.run(condition, self.driver.wrapped_driver)
+                if bool(value) == until:
+                    return value
+            except self.ignored_exceptions:
+                if not until:
+                    return True
+            if time.monotonic() > end_time:
+                raise TimeoutException(f"Condition not {'met' if until else 'lost'} after {self.timeout}s")
+            await asyncio.sleep(self.poll_frequency)
+
+    async def until(self, condition):
+        """
+        :param condition: expected condition callable taking the driver, e.g. exp.visibility_of_element_located(...)
+        :return: its first truthy value, WebElements wrapped as AsyncElement
+        """
+        value = await self._poll(condition, True)
+        if isinstance(value, WebElement):
+            return AsyncElement(self.driver, value)
+        if isinstance(value, list):
+            return [AsyncElement(self.driver, item) if isinstance(item, WebElement) else item for item in value]
+        return value
+
+    async def until_not(self, condition):
+        return await self._poll(condition, False)
@@ -0,0 +1,45 @@
+# tool/async_fixtures.py
+"""
+Fixtures of the asyncio page objects in pages.aio, loaded as pytest plugin by conftest.py.
+They wrap the sessions of the `driver` and `new_session` fixtures.
+"""
+import asyncio
+
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def async_driver(driver):
+    """
+    The session of the `driver` fixture behind a non-blocking client, for the asyncio page objects in pages.aio.
+    Same browser, isolation mode and failure screenshots as `driver`.
+    """
+    from tool.async_driver import AsyncDriver
+
+    session = AsyncDriver(driver)
+    yield session
+    session.close()
+
+
+@pytest_asyncio.fixture
+async def async_new_session(request, new_session):
+    """
+    Async factory for extra sessions, `await async_new_session()`. Browsers are started off the event loop,
+    so several sessions can be started together with asyncio.gather. Closed at teardown by `new_session`.
+    """
+    from tool.async_driver import AsyncDriver
+
+    if request.config.getoption("--isolation") == "context":
+        # Set up the shared browser here, fixtures cannot be resolved from the worker threads
+        request.getfixturevalue("browser_host")
+    sessions = []
+
+    async def _new_session():
+        session = AsyncDriver(await asyncio.to_thread(new_session))
+        sessions.append(session)
+        return session
+
+    yield _new_session
+
+    for session in sessions:
+        session.close()
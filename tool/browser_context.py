@@ -0,0 +1,154 @@
+# tool/browser_context.py
+import logging
+import threading
+
+from selenium.webdriver.remote.webelement import WebElement
+
+log = logging.getLogger(__name__)
+
+
+class BrowserContextError(RuntimeError):
+    """Raised when the browser cannot create or dispose an isolated context."""
+
+
+class IsolatedContext:
+    """
+    A WebDriver stand-in bound to one isolated browser context (own cookie and storage jar)
+    of a shared browser process. Every command first switches the shared session to the
+    context's tab, so page objects can take it as their `driver` without any change.
+    Elements found through it have the context as parent, so their commands (click, text, ...)
+    take the same lock and tab switch.
+    """
+
+    def __init__(self, pool, context_id, handle):
+        self._pool = pool
+        self.context_id = context_id
+        self.handle = handle
+
+    @property
+    def wrapped_driver(self):
+        return self._pool.driver
+
+    def __getattr__(self, name):
+        # Properties such as current_url or title are evaluated by getattr, so the tab must be active first
+        with self._pool.lock:
+            self._pool.activate(self.handle)
+            value = getattr(self._pool.driver, name)
+        if not callable(value):
+            return value
+
+        def command(*args, **kwargs):
+            with self._pool.lock:
+                self._pool.activate(self.handle)
+                return self._bind(value(*args, **kwargs))
+        return command
+
+    def _bind(self, value):
+        """
+        Re-parents the WebElements of a command result (also inside execute() responses and lists) to this context.
+        WebElement sends all its commands through parent.execute or parent.execute_script.
+        """
+        if isinstance(value, WebElement):
+            return value if value.parent is self else type(value)(self, value.id)
+        if isinstance(value, list):
+            return [self._bind(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._bind(item) for key, item in value.items()}
+        return value
+
+    def quit(self):
+        """Closes only this context, the shared browser keeps running."""
+        self._pool.close_context(self)
+
+    def __repr__(self):
+        return f"<IsolatedContext {self.context_id} handle={self.handle}>"
+
+
+class BrowserContextPool:
+    """
+    Hosts several IsolatedContext objects inside one browser process.
+
+    Uses WebDriver BiDi user contexts when the session was started with BiDi enabled,
+    otherwise falls back to CDP browser contexts on Chromium based browsers.
+    Commands of all contexts go through the same WebDriver session and are serialized by `lock`.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.lock = threading.RLock()
+        self.contexts = []
+        self._home_handle = driver.current_window_handle
+        self._active_handle = self._home_handle
+        if driver.capabilities.get("webSocketUrl"):
+            self.mode = "bidi"
+        elif hasattr(driver, "execute_cdp_cmd"):
+            self.mode = "cdp"
+        else:
+            raise BrowserContextError(
+                f"{driver.capabilities.get('browserName')} supports neither BiDi user contexts nor CDP browser contexts"
+            )
+        log.info(f"Browser context pool started in '{self.mode}' mode")
+
+    def activate(self, handle):
+        if handle != self._active_handle:
+            self.driver.switch_to.window(handle)
+            self._active_handle = handle
+
+    def new_context(self):
+        """
+        Opens a fresh isolated context with its own tab and returns it.
+        :return: IsolatedContext
+        """
+        with self.lock:
+            try:
+                if self.mode == "bidi":
+                    context_id = self.driver.browser.create_user_context()
+                    handle = self.driver.browsing_context.create(type="tab", user_context=context_id)
+                else:
+                    context_id = self.driver.execute_cdp_cmd(
+                        "Target.createBrowserContext", {"disposeOnDetach": True})["browserContextId"]
+                    handle = self.driver.execute_cdp_cmd(
+                        "Target.createTarget", {"url": "about:blank", "browserContextId": context_id})["targetId"]
+            except Exception as e:
+                raise BrowserContextError(f"Could not create browser context: {e}") from e
+
+            context = IsolatedContext(self, context_id, handle)
+            self.contexts.append(context)
+            self.activate(handle)
+            log.info(f"Opened isolated browser context {context_id}")
+            return context
+
+    def close_context(self, context):
+        """
+        Disposes one context and moves the session back to the home window.
+        Raises BrowserContextError when that window cannot be reached, the browser is probably gone.
+        """
+        with self.lock:
+            if context not in self.contexts:
+                return
+            self.contexts.remove(context)
+            try:
+                if self.mode == "bidi":
+                    self.driver.browser.remove_user_context(context.context_id)
+                else:
+                    self.driver.execute_cdp_cmd("Target.disposeBrowserContext",
+                                                {"browserContextId": context.context_id})
+            except Exception as e:
+                log.error(f"Could not dispose browser context {context.context_id}: {e}")
+            # The closed tab was probably the active one, move the session back to a live window
+            try:
+                self.driver.switch_to.window(self._home_handle)
+            except Exception as e:
+                # Unknown active tab, the next command switches again
+                self._active_handle = None
+                raise BrowserContextError(
+                    f"Could not return to the home window after closing {context.context_id}: {e}") from e
+            self._active_handle = self._home_handle
+            log.info(f"Closed isolated browser context {context.context_id}")
+
+    def close_all(self):
+        for context in list(self.contexts):
+            try:
+                self.close_context(context)
+            except BrowserContextError as e:
+                log.error(str(e))
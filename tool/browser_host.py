@@ -0,0 +1,109 @@
+# tool/browser_host.py
+import logging
+
+from selenium.common.exceptions import WebDriverException
+
+from tool.browser_context import BrowserContextError, BrowserContextPool
+
+log = logging.getLogger(__name__)
+
+RESET_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+class BrowserHost:
+    """
+    Owns the long-lived browser of one worker for the 'reuse' and 'context' isolation modes.
+
+    'reuse' hands the same driver to every test and wipes cookies and storage in between,
+    'context' opens a new isolated browser context per test. After each test the memory governor
+    decides whether the browser is restarted before the next one.
+    """
+
+    def __init__(self, start_browser, isolation, governor, base_url=None):
+        """
+        :param start_browser: callable(enable_bidi) returning a new WebDriver
+        :param isolation: 'reuse' or 'context'
+        :param governor: MemoryGovernor
+        :param base_url: origin whose cookies and storage are wiped between tests in 'reuse' mode
+        """
+        self._start_browser = start_browser
+        self.isolation = isolation
+        self.governor = governor
+        self.base_url = base_url
+        self.driver = None
+        self.pool = None
+
+    def _ensure_browser(self):
+        if self.driver is None:
+            self.driver = self._start_browser(enable_bidi=self.isolation == "context")
+            if self.isolation == "context":
+                self.pool = BrowserContextPool(self.driver)
+        return self.driver
+
+    def new_context(self):
+        """Opens an extra isolated context in the shared browser (context mode only)"""
+        self._ensure_browser()
+        return self.pool.new_context()
+
+    def acquire(self):
+        """
+        Returns a clean session for the next test
+        :return: WebDriver (reuse) or IsolatedContext (context)
+        """
+        driver = self._ensure_browser()
+        if self.isolation == "context":
+            return self.pool.new_context()
+        return driver
+
+    def reset(self):
+        """Wipes cookies and web storage of the reused driver so the next test starts logged out"""
+        if self.isolation == "context" or self.driver is None:
+            return
+        if self.base_url:
+            # Cookies and storage are per origin, the test may have ended on another site or on about:blank
+            self.driver.get(self.base_url)
+        try:
+            self.driver.execute_script(RESET_STORAGE_SCRIPT)
+        except Exception as e:
+            # Storage is not accessible on about:blank or error pages, nothing to clear there
+            log.debug(f"Could not clear web storage: {e}")
+        self.driver.delete_all_cookies()
+        self.driver.get("about:blank")
+
+    def release(self, session):
+        """
+        Returns the session of a finished test and recycles the browser when the governor asks for it,
+        or when the browser can no longer be cleaned up (it crashed or was closed by the test)
+        """
+        if self.driver is None:
+            return
+        try:
+            if self.isolation == "context":
+                session.quit()
+            else:
+                self.reset()
+        except (WebDriverException, BrowserContextError) as e:
+            log.error(f"Shared browser is not usable any more, recycling it: {e}")
+            self.recycle()
+            return
+        if self.governor.should_recycle(self.driver):
+            self.recycle()
+
+    def recycle(self):
+        self.close()
+        self.governor.browser_recycled()
+
+    def close(self):
+        if self.driver is None:
+            return
+        log.info("Closing shared browser process...")
+        if self.pool is not None:
+            self.pool.close_all()
+        try:
+            self.driver.quit()
+        except Exception as e:
+            # A crashed browser cannot be quit cleanly, it is dropped all the same
+            log.error(f"Could not quit shared browser: {e}")
+        finally:
+            self.driver = None
+            self.pool = None
@@ -0,0 +1,106 @@
+# tool/driver_factory.py
+import logging
+
+# Browser specific modules and webdriver_manager are imported when a browser of that kind is started,
+# so runs that never start one (collection, -k reruns, other browsers) do not pay for them
+log = logging.getLogger(__name__)
+
+SUPPORTED_BROWSERS = ("chrome", "firefox", "edge")
+
+
+class UnsupportedBrowserError(ValueError):
+    """Raised when a browser name is not one of SUPPORTED_BROWSERS."""
+
+
+def build_options(browser_name, headless=False, enable_bidi=False):
+    """
+    Builds the framework's default browser options, shared by local and remote drivers.
+    :param browser_name: chrome, firefox or edge
+    :param headless: run the browser without a window
+    :param enable_bidi: open a WebDriver BiDi connection (needed for isolated browser contexts)
+    :return: browser specific Options
+    """
+    if browser_name == "chrome":
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        chrome_options = ChromeOptions()
+        chrome_options.add_argument("--no-sandbox")
+        if headless:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--window-size=1920,1080")
+
+        # --- Options to Make Automation Less Detectable ---
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        # --- Preferences to Disable Pop-ups and Warnings ---
+        prefs = {
+            "credentials_enable_service": False,
+            "password_manager_enabled": False,
+            "profile.password_manager_leak_detection": False,
+            "devtools.preferences.selfXssWarning": "false",
+            "profile.default_content_setting_values.notifications": 1  # 1=Allow, 2=Block
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options.enable_bidi = enable_bidi
+        return chrome_options
+
+    if browser_name == "firefox":
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        firefox_options = FirefoxOptions()
+        if headless:
+            firefox_options.add_argument("--headless")
+        firefox_options.add_argument("--width=1920")
+        firefox_options.add_argument("--height=1080")
+        firefox_options.enable_bidi = enable_bidi
+        return firefox_options
+
+    if browser_name == "edge":
+        from selenium.webdriver.edge.options import Options as EdgeOptions
+        edge_options = EdgeOptions()
+        if headless:
+            edge_options.add_argument("--headless")
+        edge_options.add_argument("--window-size=1920,1080")
+        edge_options.enable_bidi = enable_bidi
+        return edge_options
+
+    raise UnsupportedBrowserError(f"Unsupported browser: '{browser_name}'. "
+                                  f"Supported browsers: {', '.join(SUPPORTED_BROWSERS)}, remote")
+
+
+def create_driver(browser_name, headless=False, enable_bidi=False):
+    """
+    Builds a local WebDriver for the given browser with the framework's default options.
+    :param browser_name: chrome, firefox or edge
+    :param headless: run the browser without a window
+    :param enable_bidi: open a WebDriver BiDi connection (needed for isolated browser contexts)
+    :return: WebDriver
+    """
+    from selenium import webdriver
+
+    options = build_options(browser_name, headless=headless, enable_bidi=enable_bidi)
+    if browser_name == "chrome":
+        from selenium.webdriver.chrome.service import Service as ChromeServices
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        driver_path = ChromeDriverManager().install()
+        log.debug(f"ChromeDriver: {driver_path}")
+        services = ChromeServices(executable_path=driver_path)
+        return webdriver.Chrome(service=services, options=options)
+    if browser_name == "firefox":
+        return webdriver.Firefox(options=options)
+    return webdriver.Edge(options=options)
+
+
+def create_remote_driver(command_executor, browser_name, headless=False, enable_bidi=False):
+    """
+    Builds a WebDriver session on a Selenium Grid with the same options as the local browsers.
+    :param command_executor: RemoteConnection (or grid URL) the commands are sent through
+    :param browser_name: browser requested from the grid, chrome, firefox or edge
+    :param headless: run the browser without a window
+    :param enable_bidi: open a WebDriver BiDi connection
+    :return: WebDriver
+    """
+    from selenium import webdriver
+
+    options = build_options(browser_name, headless=headless, enable_bidi=enable_bidi)
+    return webdriver.Remote(command_executor=command_executor, options=options)
@@ -0,0 +1,400 @@
+# tool/impact.py
+import ast
+import functools
+import importlib
+import inspect
+import json
+import logging
+import os
+import pkgutil
+import re
+import subprocess
+from pathlib import Path
+
+import pages
+from pages.base_page import BasePage
+
+log = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES_DIR = "pages"
+DATA_FILES = ("tests/data.py", "constants.py")
+FULL_SUITE_FILES = ("conftest.py",)
+# Changes to other files with these suffixes may affect any test, so they select the full suite
+FRAMEWORK_SUFFIXES = (".py", ".ini", ".json", ".toml")
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def _hash_file(rel_path):
+    try:
+        return _git("hash-object", rel_path).strip()
+    except subprocess.CalledProcessError:
+        return None
+
+
+def _tracked_files():
+    """Files whose content the map depends on"""
+    files = [path.relative_to(ROOT).as_posix() for path in sorted((ROOT / PAGES_DIR).rglob("*.py"))]
+    return files + list(DATA_FILES) + list(FULL_SUITE_FILES)
+
+
+def _subclasses_in(package, base):
+    for module_info in pkgutil.iter_modules(package.__path__):
+        importlib.import_module(f"{package.__name__}.{module_info.name}")
+    found, stack = [base], [base]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in found and subclass.__module__.startswith(f"{package.__name__}."):
+                found.append(subclass)
+                stack.append(subclass)
+    return found
+
+
+def page_classes():
+    """All BasePage subclasses (and BasePage itself) of the pages package"""
+    return _subclasses_in(pages, BasePage)
+
+
+def async_page_classes():
+    """All AsyncBasePage subclasses (and AsyncBasePage itself) of the pages.aio package"""
+    import pages.aio
+    from pages.aio.base_page import AsyncBasePage
+    return _subclasses_in(pages.aio, AsyncBasePage)
+
+
+def _method_id(cls, name):
+    return f"{cls.__module__.replace('.', '/')}.py::{cls.__name__}.{name}"
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value)
+
+
+class ImpactRecorder:
+    """
+    Records which page-object methods and locators every test exercises.
+
+    Each method defined on a page class is wrapped once; the wrapper notes the method and
+    every declared locator passed to it for the test that is currently running.
+    """
+
+    def __init__(self, map_path):
+        self.map_path = Path(map_path)
+        self.current = None
+        self.tests = {}
+        self.locator_names = {}  # locator tuple -> ["Class.ATTR", ...]
+        for cls in page_classes():
+            for name, value in vars(cls).items():
+                if _is_locator(value):
+                    self.locator_names.setdefault(value, []).append(f"{cls.__name__}.{name}")
+        # Async page classes take their locators from the sync classes, only their methods are recorded
+        for cls in page_classes() + async_page_classes():
+            for name, value in list(vars(cls).items()):
+                if isinstance(value, staticmethod):
+                    setattr(cls, name, staticmethod(self._wrap(cls, name, value.__func__)))
+                elif inspect.isfunction(value):
+                    setattr(cls, name, self._wrap(cls, name, value))
+
+    def _wrap(self, cls, name, func):
+        method_id = _method_id(cls, name)
+
+        @functools.wraps(func)
+        def recorded(*args, **kwargs):
+            if self.current is not None:
+                self.current["methods"].add(method_id)
+                for arg in args:
+                    if _is_locator(arg) and arg in self.locator_names:
+                        self.current["locators"].update(self.locator_names[arg])
+            return func(*args, **kwargs)
+        return recorded
+
+    def pytest_runtest_logstart(self, nodeid):
+        self.current = {"methods": set(), "locators": set()}
+        self.tests[nodeid] = self.current
+
+    def pytest_runtest_logfinish(self):
+        self.current = None
+
+    def pytest_sessionfinish(self):
+        """Merges this run into the map so partial (-k) recordings extend it"""
+        if not self.tests:
+            return
+        try:
+            with open(self.map_path, encoding="utf-8") as map_file:
+                impact_map = json.load(map_file)
+        except (OSError, ValueError):
+            impact_map = {"tests": {}}
+        impact_map["files"] = {rel_path: _hash_file(rel_path) for rel_path in _tracked_files()}
+        for nodeid, usage in self.tests.items():
+            impact_map["tests"][nodeid] = {key: sorted(value) for key, value in usage.items()}
+        self.map_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.map_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as map_file:
+            json.dump(impact_map, map_file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.map_path)
+        log.info(f"Impact map with {len(impact_map['tests'])} tests written to {self.map_path}")
+
+
+def changed_lines(ref, rel_path):
+    """Line numbers of the working tree file that differ from ref"""
+    diff = _git("diff", "-U0", ref, "--", rel_path)
+    lines = set()
+    for start, count in HUNK_RE.findall(diff):
+        count = 1 if count == "" else int(count)
+        # A pure deletion (count 0) still touches the code around that line
+        lines.update(range(int(start), int(start) + max(count, 1)))
+    return lines
+
+
+def _changed_symbols(rel_path, lines):
+    """
+    Maps changed lines of a module to the symbols defined there.
+    :return: set of 'Class.member' names, or None when code outside any class changed
+    """
+    source = (ROOT / rel_path).read_text(encoding="utf-8")
+    source_lines = source.splitlines()
+    symbols = set()
+    outside = set(lines)
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        class_lines = set(range(node.lineno, node.end_lineno + 1)) & lines
+        if not class_lines:
+            continue
+        outside -= class_lines
+        members = [child for child in node.body if isinstance(child, (*FUNCTION_NODES, ast.Assign, ast.AnnAssign))]
+        hit_member = False
+        for child in members:
+            if not set(range(child.lineno, child.end_lineno + 1)) & lines:
+                continue
+            hit_member = True
+            if isinstance(child, FUNCTION_NODES):
+                symbols.add(f"{node.name}.{child.name}")
+            else:
+                targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+                symbols.update(f"{node.name}.{target.id}" for target in targets if isinstance(target, ast.Name))
+        if not hit_member:
+            # Class header or base classes changed: every method of the class counts as changed
+            symbols.update(f"{node.name}.{child.name}" for child in members if isinstance(child, FUNCTION_NODES))
+
+    for line in outside:
+        text = source_lines[line - 1].strip() if line <= len(source_lines) else ""
+        if text and not text.startswith("#"):
+            return None
+    return symbols
+
+
+@functools.lru_cache(maxsize=None)
+def _attributes_read_by_methods(rel_path):
+    """Maps every method id of a page module to the attribute names it reads (self.X, Class.X)"""
+    tree = ast.parse((ROOT / rel_path).read_text(encoding="utf-8"))
+    result = {}
+    for class_node in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        for func in (node for node in class_node.body if isinstance(node, FUNCTION_NODES)):
+            result[f"{rel_path}::{class_node.name}.{func.name}"] = frozenset(
+                node.attr for node in ast.walk(func) if isinstance(node, ast.Attribute))
+    return result
+
+
+def _page_methods_using(attributes):
+    """Page methods whose source reads any of the given attribute names"""
+    method_ids = set()
+    for path in sorted((ROOT / PAGES_DIR).rglob("*.py")):
+        for method_id, used in _attributes_read_by_methods(path.relative_to(ROOT).as_posix()).items():
+            if used & attributes:
+                method_ids.add(method_id)
+    return method_ids
+
+
+class _NameCollector(ast.NodeVisitor):
+    """Dotted names read by a piece of code, 'Products' for the class itself, 'Products.SAUCE_LABS_ONESIE' for a member"""
+
+    def __init__(self):
+        self.names = set()
+
+    def visit_Attribute(self, node):
+        parts, value = [node.attr], node.value
+        while isinstance(value, ast.Attribute):
+            parts.append(value.attr)
+            value = value.value
+        if isinstance(value, ast.Name):
+            self.names.add(".".join([value.id, *reversed(parts)]))
+        else:
+            self.visit(value)
+
+    def visit_Name(self, node):
+        self.names.add(node.id)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_level_names(path):
+    """
+    Names read by a test module outside its test bodies: module constants, parametrize values, decorators and helpers
+    """
+    collector = _NameCollector()
+
+    def visit(body):
+        for node in body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                continue
+            if isinstance(node, FUNCTION_NODES) and node.name.startswith("test"):
+                for decorator in node.decorator_list:
+                    collector.visit(decorator)
+            elif isinstance(node, ast.ClassDef):
+                for part in (*node.decorator_list, *node.bases):
+                    collector.visit(part)
+                visit(node.body)
+            else:
+                collector.visit(node)
+
+    visit(ast.parse(Path(path).read_text(encoding="utf-8")).body)
+    return frozenset(collector.names)
+
+
+def _reads_symbol(names, symbol):
+    class_name = symbol.split(".")[0]
+    return any(name == class_name or name == symbol or name.startswith(f"{symbol}.") for name in names)
+
+
+def _data_values(symbols):
+    """Current values of changed 'Class.member' data symbols, removed symbols are left out"""
+    values = []
+    for rel_path in DATA_FILES:
+        module = importlib.import_module(rel_path[:-len(".py")].replace("/", "."))
+        for symbol in symbols:
+            class_name, member = symbol.split(".", 1)
+            value = getattr(getattr(module, class_name, None), member, None)
+            if value is not None and not callable(value):
+                values.append(value)
+    return values
+
+
+def _contains(param, value):
+    if param == value:
+        return True
+    if isinstance(param, dict):
+        return any(_contains(item, value) for item in param.values())
+    if isinstance(param, (list, tuple)):
+        return any(_contains(item, value) for item in param)
+    return False
+
+
+class ImpactSelector:
+    """
+    Selects the tests affected by the changes since a git ref using the recorded impact map.
+    Registered as pytest plugin by --changed-since, it deselects the other tests after collection.
+    """
+
+    def __init__(self, map_path, ref):
+        self.map_path = Path(map_path)
+        self.ref = ref
+        self.reason = None
+
+    def _full_suite(self, reason):
+        self.reason = reason
+        return None
+
+    def select(self, items):
+        """
+        :return: list of selected items, or None when the full suite must run (reason in self.reason)
+        """
+        try:
+            with open(self.map_path, encoding="utf-8") as map_file:
+                impact_map = json.load(map_file)
+        except (OSError, ValueError):
+            return self._full_suite(f"no impact map at {self.map_path}, record one with --record-impact")
+
+        try:
+            changed_files = [path for path in _git("diff", "--name-only", self.ref).splitlines() if path]
+        except subprocess.CalledProcessError as e:
+            return self._full_suite(f"git diff against '{self.ref}' failed: {e.stderr.strip()}")
+
+        # The map is only valid for the code it was recorded on: files unchanged since ref must still match it
+        for rel_path, recorded_hash in impact_map.get("files", {}).items():
+            if rel_path not in changed_files and recorded_hash != _hash_file(rel_path):
+                return self._full_suite(f"impact map is stale, {rel_path} changed since it was recorded")
+        missing = [item.nodeid for item in items if item.nodeid not in impact_map["tests"]]
+        if missing:
+            return self._full_suite(f"impact map is stale, {len(missing)} tests not recorded (e.g. {missing[0]})")
+
+        methods, locators, symbols, test_files = set(), set(), set(), set()
+        for rel_path in changed_files:
+            if rel_path in FULL_SUITE_FILES:
+                return self._full_suite(f"{rel_path} changed")
+            if not (ROOT / rel_path).exists():
+                if rel_path.endswith(FRAMEWORK_SUFFIXES):
+                    return self._full_suite(f"{rel_path} was removed")
+                continue
+            if rel_path.startswith(f"{PAGES_DIR}/") and rel_path.endswith(".py"):
+                changed = _changed_symbols(rel_path, changed_lines(self.ref, rel_path))
+                if changed is None:
+                    # Imports, decorators or helpers outside the classes may reach methods of any page module
+                    return self._full_suite(f"module level change in {rel_path}")
+                for symbol in changed:
+                    member = symbol.split(".")[1]
+                    methods.add(f"{rel_path}::{symbol}")
+                    locators.add(symbol)
+                    if member.isupper():
+                        methods.update(_page_methods_using({member}))
+            elif rel_path in DATA_FILES:
+                changed = _changed_symbols(rel_path, changed_lines(self.ref, rel_path))
+                if changed is None:
+                    return self._full_suite(f"module level change in {rel_path}")
+                symbols.update(changed)
+            elif Path(rel_path).name.startswith("test_") and rel_path.endswith(".py"):
+                test_files.add(rel_path)
+            elif rel_path.endswith(FRAMEWORK_SUFFIXES):
+                return self._full_suite(f"{rel_path} changed")
+
+        if symbols:
+            conftest_source = (ROOT / "conftest.py").read_text(encoding="utf-8")
+            if any(symbol in conftest_source for symbol in symbols):
+                return self._full_suite(f"conftest.py fixtures use changed data {sorted(symbols)}")
+            # Data and constants are read by tests directly and by page objects
+            methods.update(_page_methods_using({symbol.split(".")[1] for symbol in symbols}))
+
+        selected = []
+        for item in items:
+            usage = impact_map["tests"][item.nodeid]
+            item_file = item.nodeid.split("::")[0]
+            if (item_file in test_files
+                    or methods & set(usage["methods"])
+                    or locators & set(usage["locators"])
+                    or (symbols and self._uses_symbols(item, symbols))):
+                selected.append(item)
+        self.reason = f"{len(changed_files)} files changed since {self.ref}"
+        return selected
+
+    def pytest_collection_modifyitems(self, config, items):
+        # Runs before the retry engine keeps the tests of the lane
+        selected = self.select(items)
+        if selected is None:
+            log.warning(f"Running the full suite: {self.reason}")
+            return
+        log.info(f"Change impact: {self.reason}, {len(selected)} of {len(items)} tests selected")
+        config.hook.pytest_deselected(items=[item for item in items if item not in selected])
+        items[:] = selected
+
+    @staticmethod
+    def _uses_symbols(item, symbols):
+        """
+        A test reads changed data in its own source, through its parameters, or anywhere in the module level
+        code of its module (e.g. scenarios built from a whole data class), which selects the whole module
+        """
+        try:
+            source = inspect.getsource(item.function)
+            module_names = _module_level_names(str(item.path))
+        except (OSError, TypeError, AttributeError, SyntaxError):
+            return True
+        if any(symbol in source or _reads_symbol(module_names, symbol) for symbol in symbols):
+            return True
+        callspec = getattr(item, "callspec", None)
+        if callspec is None:
+            return False
+        values = _data_values(symbols)
+        return any(_contains(param, value) for param in callspec.params.values() for value in values)
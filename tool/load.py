@@ -0,0 +1,320 @@
+# tool/load.py
+"""
+Load and soak harness reusing the page objects as virtual users.
+
+Every virtual user drives its own browser through the purchase flow
+(login, add to cart, cart, checkout, overview, finish) in a loop and
+the duration of every step is collected per user type.
+
+    python -m tool.load --users standard_user=5,performance_glitch_user=2 --ramp linear --ramp-time 30 --duration 300
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+RAMP_PROFILES = ("all", "linear", "step")
+PERCENTILES = (50, 90, 95, 99)
+
+
+def ramp_schedule(total_users, profile="linear", ramp_time=0.0, step_size=1):
+    """
+    Start offset in seconds of every virtual user.
+    'all' starts everybody at once, 'linear' spreads the starts evenly over ramp_time,
+    'step' starts batches of step_size users at evenly spaced moments within ramp_time.
+
+    >>> ramp_schedule(4, "linear", 6)
+    [0.0, 1.5, 3.0, 4.5]
+    >>> ramp_schedule(5, "step", 10, step_size=2)
+    [0.0, 0.0, 5.0, 5.0, 10.0]
+    """
+    if profile == "all" or total_users <= 1 or ramp_time <= 0:
+        return [0.0] * total_users
+    if profile == "linear":
+        return [ramp_time * index / total_users for index in range(total_users)]
+    if profile == "step":
+        steps = -(-total_users // step_size)
+        interval = ramp_time / (steps - 1) if steps > 1 else 0.0
+        return [interval * (index // step_size) for index in range(total_users)]
+    raise ValueError(f"Unknown ramp profile '{profile}', available: {', '.join(RAMP_PROFILES)}")
+
+
+def percentile(ordered, pct):
+    """
+    Nearest-rank percentile of an already sorted list
+
+    >>> percentile([1, 2, 3, 4], 50)
+    2
+    """
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class LoadStats:
+    """Step durations and errors per (user type, step), shared by all virtual users"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations = {}
+        self.errors = {}
+        self.iterations = {}
+        self.started = None
+        self.finished = None
+
+    def record(self, user_type, step, seconds):
+        with self.lock:
+            self.durations.setdefault((user_type, step), []).append(seconds)
+
+    def record_error(self, user_type, step, error):
+        with self.lock:
+            self.errors.setdefault((user_type, step), []).append(f"{type(error).__name__}: {error}")
+
+    def iteration_done(self, user_type):
+        with self.lock:
+            self.iterations[user_type] = self.iterations.get(user_type, 0) + 1
+
+    def summary(self):
+        """
+        :return: list of per step dicts with count, errors, throughput (per s) and latency percentiles (ms)
+        """
+        elapsed = max((self.finished or time.monotonic()) - (self.started or time.monotonic()), 1e-9)
+        rows = []
+        with self.lock:
+            keys = list(self.durations) + [key for key in self.errors if key not in self.durations]
+            for user_type, step in keys:
+                ordered = sorted(self.durations.get((user_type, step), []))
+                row = {
+                    "user": user_type,
+                    "step": step,
+                    "count": len(ordered),
+                    "errors": len(self.errors.get((user_type, step), [])),
+                    "throughput": len(ordered) / elapsed,
+                }
+                for pct in PERCENTILES:
+                    value = percentile(ordered, pct)
+                    row[f"p{pct}_ms"] = None if value is None else value * 1000
+                rows.append(row)
+        return rows
+
+
+def purchase_flow(driver, credentials, product, checkout_info):
+    """
+    The purchase flow as (step name, action) pairs, built on the page objects used by the E2E tests
+    """
+    from pages.login_page import LoginPage
+
+    login_page = LoginPage(driver)
+    pages = {}
+
+    def login():
+        login_page.go_to_login_page()
+        pages["inventory"] = login_page.login(credentials["username"], credentials["password"])
+        if pages["inventory"] is None:
+            raise AssertionError(f"Login failed for {credentials['username']}")
+
+    def add_product_to_cart():
+        pages["inventory"].add_product_to_cart(product)
+
+    def open_cart():
+        pages["cart"] = pages["inventory"].navigate_to_cart()
+
+    def click_checkout():
+        pages["checkout_info"] = pages["cart"].click_checkout()
+
+    def fill_information():
+        pages["checkout_info"].fill_your_information(
+            checkout_info["first_name"], checkout_info["last_name"], checkout_info["zip_code"])
+        pages["overview"] = pages["checkout_info"].click_continue()
+        if pages["overview"] is None:
+            raise AssertionError(pages["checkout_info"].get_error_message())
+
+    def click_finish():
+        pages["overview"].click_finish()
+
+    return [
+        ("login", login),
+        ("add_product_to_cart", add_product_to_cart),
+        ("open_cart", open_cart),
+        ("click_checkout", click_checkout),
+        ("fill_information", fill_information),
+        ("click_finish", click_finish),
+    ]
+
+
+class VirtualUser(threading.Thread):
+    """One browser looping over the purchase flow until the stop event is set or its iterations are done"""
+
+    def __init__(self, name, user_type, credentials, driver_factory, stats, stop_event,
+                 start_delay=0.0, iterations=None, think_time=0.0):
+        super().__init__(name=name, daemon=True)
+        self.user_type = user_type
+        self.credentials = credentials
+        self.driver_factory = driver_factory
+        self.stats = stats
+        self.stop_event = stop_event
+        self.start_delay = start_delay
+        self.iterations = iterations
+        self.think_time = think_time
+
+    def run(self):
+        from tool.browser_host import RESET_STORAGE_SCRIPT
+        from tests.data import Products, CheckoutInfo
+
+        if self.stop_event.wait(self.start_delay):
+            return
+        try:
+            driver = self.driver_factory()
+        except Exception as e:
+            self.stats.record_error(self.user_type, "start_browser", e)
+            return
+        done = 0
+        try:
+            while not self.stop_event.is_set() and (self.iterations is None or done < self.iterations):
+                flow = purchase_flow(driver, self.credentials, Products.SAUCE_LABS_BACKPACK,
+                                     CheckoutInfo.STANDARD_USER_INFO)
+                for step, action in flow:
+                    start = time.perf_counter()
+                    try:
+                        action()
+                    except Exception as e:
+                        self.stats.record_error(self.user_type, step, e)
+                        break
+                    self.stats.record(self.user_type, step, time.perf_counter() - start)
+                else:
+                    self.stats.iteration_done(self.user_type)
+                done += 1
+                # Next iteration starts logged out with an empty cart
+                try:
+                    driver.execute_script(RESET_STORAGE_SCRIPT)
+                except Exception:
+                    pass
+                try:
+                    driver.delete_all_cookies()
+                except Exception as e:
+                    # The browser is gone, this virtual user cannot go on
+                    self.stats.record_error(self.user_type, "reset_session", e)
+                    break
+                if self.think_time:
+                    self.stop_event.wait(self.think_time)
+        finally:
+            try:
+                driver.quit()
+            except Exception as e:
+                self.stats.record_error(self.user_type, "quit_browser", e)
+
+
+def parse_users(spec):
+    """
+    Parses 'standard_user=5,performance_glitch_user=2' into {username: count} using the tests.data.User catalog
+    """
+    from tests.data import User
+
+    known = {value["username"]: value for name, value in vars(User).items() if name.isupper()}
+    users = {}
+    for part in spec.split(","):
+        username, _, count = part.strip().partition("=")
+        if username not in known:
+            raise ValueError(f"Unknown user '{username}', available: {', '.join(known)}")
+        users[username] = (known[username], int(count or 1))
+    return users
+
+
+def run_load(users, driver_factory, profile="linear", ramp_time=0.0, step_size=1, duration=None,
+             iterations=None, think_time=0.0):
+    """
+    Runs the virtual users and returns the collected LoadStats.
+    :param users: {username: (credentials, count)}
+    :param driver_factory: callable returning a new WebDriver for one virtual user
+    :param duration: stop after this many seconds (measured from the first start)
+    :param iterations: flow iterations per virtual user
+    """
+    stats = LoadStats()
+    stop_event = threading.Event()
+    plan = [(username, credentials) for username, (credentials, count) in users.items() for _ in range(count)]
+    offsets = ramp_schedule(len(plan), profile, ramp_time, step_size)
+    virtual_users = [
+        VirtualUser(f"vu-{index}-{username}", username, credentials, driver_factory, stats, stop_event,
+                    start_delay=offset, iterations=iterations, think_time=think_time)
+        for index, ((username, credentials), offset) in enumerate(zip(plan, offsets))
+    ]
+
+    stats.started = time.monotonic()
+    for virtual_user in virtual_users:
+        virtual_user.start()
+    try:
+        deadline = None if duration is None else stats.started + duration
+        for virtual_user in virtual_users:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            virtual_user.join(timeout)
+    except KeyboardInterrupt:
+        log.warning("Interrupted, stopping virtual users")
+    finally:
+        stop_event.set()
+        for virtual_user in virtual_users:
+            virtual_user.join()
+        stats.finished = time.monotonic()
+    return stats
+
+
+def format_summary(stats):
+    lines = [f"{'user':<26}{'step':<22}{'count':>7}{'errors':>8}{'req/s':>9}"
+             + "".join(f"{f'p{pct} ms':>11}" for pct in PERCENTILES)]
+    for row in stats.summary():
+        latencies = "".join(
+            f"{row[f'p{pct}_ms']:>11.1f}" if row[f"p{pct}_ms"] is not None else f"{'-':>11}" for pct in PERCENTILES)
+        lines.append(f"{row['user']:<26}{row['step']:<22}{row['count']:>7}{row['errors']:>8}"
+                     f"{row['throughput']:>9.2f}{latencies}")
+    for user_type, count in sorted(stats.iterations.items()):
+        lines.append(f"{user_type}: {count} completed purchases")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the purchase flow page objects as concurrent virtual users")
+    parser.add_argument("--users", required=True,
+                        help="Virtual users per user type, e.g. standard_user=5,performance_glitch_user=2")
+    parser.add_argument("--base-url", default=None, help="Target app, defaults to SAUCEDEMO_BASE_URL/saucedemo.com")
+    parser.add_argument("--browser", default="chrome", help="chrome, firefox or edge")
+    parser.add_argument("--remote-url", default=None, help="Selenium Grid URL, browsers start locally when omitted")
+    parser.add_argument("--headless", action="store_true", default=False)
+    parser.add_argument("--ramp", default="linear", choices=RAMP_PROFILES, help="Ramp-up profile")
+    parser.add_argument("--ramp-time", type=float, default=0.0, help="Seconds until the last virtual user starts")
+    parser.add_argument("--step-size", type=int, default=1, help="Users started together by the 'step' profile")
+    parser.add_argument("--duration", type=float, default=None, help="Soak duration in seconds")
+    parser.add_argument("--iterations", type=int, default=None, help="Flow iterations per virtual user")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause in seconds between iterations")
+    parser.add_argument("--json", default=None, help="Also write the per step summary to this JSON file")
+    args = parser.parse_args(argv)
+    if args.duration is None and args.iterations is None:
+        parser.error("one of --duration or --iterations is required")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(threadName)s %(message)s")
+    if args.base_url:
+        # Must be set before the page objects import constants
+        os.environ["SAUCEDEMO_BASE_URL"] = args.base_url
+
+    from tool.driver_factory import create_driver, create_remote_driver
+
+    def driver_factory():
+        if args.remote_url:
+            return create_remote_driver(args.remote_url, args.browser, headless=args.headless)
+        return create_driver(args.browser, headless=args.headless)
+
+    stats = run_load(parse_users(args.users), driver_factory, profile=args.ramp, ramp_time=args.ramp_time,
+                     step_size=args.step_size, duration=args.duration, iterations=args.iterations,
+                     think_time=args.think_time)
+    print(format_summary(stats))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump({"steps": stats.summary(), "iterations": stats.iterations}, json_file, indent=2)
+    return 1 if any(stats.errors.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,314 @@
+# tool/locator_registry.py
+import functools
+import json
+import logging
+import re
+import statistics
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from constants import Urls
+from tool.memory_governor import worker_id
+
+log = logging.getLogger(__name__)
+
+ProductLocators = namedtuple("ProductLocators", "add_button remove_button name_link")
+LocatorIssue = namedtuple("LocatorIssue", "severity name message")
+
+STRATEGIES = {By.ID, By.NAME, By.XPATH, By.CSS_SELECTOR, By.CLASS_NAME, By.TAG_NAME, By.LINK_TEXT,
+              By.PARTIAL_LINK_TEXT}
+# Locator names ending like this are expected to match several elements
+PLURAL_SUFFIXES = ("S", "_ITEMS", "_LABELS")
+# Page state each page class is checked and profiled in
+PAGE_URLS = {
+    "LoginPage": Urls.LOGIN_URL,
+    "InventoryPage": Urls.INVENTORY_URL,
+    "ProductDetailPage": Urls.INVENTORY_URL.replace("inventory.html", "inventory-item.html?id=4"),
+    "CartPage": Urls.CART_URL,
+    "CheckoutInfoPage": Urls.CHECKOUT_STEP_ONE_URL,
+    "CheckoutOverviewPage": Urls.CHECKOUT_STEP_TWO_URL,
+    "CheckoutCompletePage": Urls.CHECKOUT_COMPLETE_URL,
+}
+
+
+def product_slug(product_name):
+    """
+    Id suffix the app derives from a product name
+
+    >>> product_slug("Test.allTheThings() T-Shirt (Red)")
+    'test.allthethings()-t-shirt-(red)'
+    """
+    return re.sub(r"\s+", "-", product_name).lower()
+
+
+def xpath_literal(text):
+    r"""
+    Quotes text as an XPath 1.0 string literal, which has no escapes: a text holding both
+    quote kinds is spliced together with concat()
+
+    >>> print(xpath_literal("Sauce Labs Onesie"))
+    'Sauce Labs Onesie'
+    >>> print(xpath_literal("Sauce Labs' \"Bolt\" T-Shirt"))
+    concat('Sauce Labs', "'", ' "Bolt" T-Shirt')
+    """
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+@functools.lru_cache(maxsize=None)
+def product_locators(product_name):
+    """Add/remove button and name link locators of one product, computed once per name"""
+    slug = product_slug(product_name)
+    return ProductLocators(
+        add_button=(By.ID, f"add-to-cart-{slug}"),
+        remove_button=(By.ID, f"remove-{slug}"),
+        name_link=(By.XPATH,
+                   f"//div[contains(@class, 'inventory_item_name') and normalize-space()={xpath_literal(product_name)}]"),
+    )
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and all(isinstance(part, str) for part in value)
+
+
+def as_css_or_xpath(locator):
+    """
+    Normalizes a locator to ('css selector' | 'xpath', value), the two forms browsers evaluate natively
+
+    >>> as_css_or_xpath(("id", "checkout"))
+    ('css selector', '[id="checkout"]')
+    """
+    by, value = locator
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    if by == By.LINK_TEXT:
+        return By.XPATH, f"//a[normalize-space()={xpath_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return By.XPATH, f"//a[contains(., {xpath_literal(value)})]"
+    return by, value
+
+
+def _balanced(value):
+    """Brackets and quotes of a selector are balanced"""
+    stack, quote = [], None
+    pairs = {")": "(", "]": "["}
+    for char in value:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            stack.append(char)
+        elif char in pairs:
+            if not stack or stack.pop() != pairs[char]:
+                return False
+    return not stack and quote is None
+
+
+class LocatorRegistry:
+    """
+    Every locator of the page classes in one place, keyed 'PageClass.NAME' where NAME is declared.
+    Per-product locators are registered as 'products[<name>].<kind>'.
+    """
+
+    def __init__(self, products=()):
+        """
+        :param products: product names whose locators are registered, e.g. the test data catalog
+        """
+        from tool.impact import page_classes
+
+        self.products = list(products)
+        self.locators = {}  # 'Class.NAME' -> locator
+        self.page_locators = {}  # page class name -> {'Class.NAME': locator} incl. inherited
+        for cls in page_classes():
+            for name, value in vars(cls).items():
+                if _is_locator(value):
+                    self.locators[f"{cls.__name__}.{name}"] = value
+            self.page_locators[cls.__name__] = {
+                f"{owner.__name__}.{name}": value
+                for owner in reversed(cls.__mro__) for name, value in vars(owner).items() if _is_locator(value)
+            }
+        for product_name in self.products:
+            for kind, locator in product_locators(product_name)._asdict().items():
+                key = f"products[{product_name}].{kind}"
+                self.locators[key] = locator
+                self.page_locators["InventoryPage"][key] = locator
+
+    def check(self):
+        """
+        Static checks run at collection time
+        :return: list of LocatorIssue, severity 'error' for broken declarations, 'warning' for duplicates
+        """
+        issues = []
+        by_selector = {}
+        for name, locator in self.locators.items():
+            by, value = locator
+            if by not in STRATEGIES:
+                issues.append(LocatorIssue("error", name, f"unknown strategy '{by}'"))
+                continue
+            if not value.strip():
+                issues.append(LocatorIssue("error", name, "empty selector"))
+            elif not _balanced(value):
+                issues.append(LocatorIssue("error", name, f"unbalanced brackets or quotes in '{value}'"))
+            elif by == By.XPATH and not value.lstrip().startswith(("/", "(", ".")):
+                issues.append(LocatorIssue("error", name, f"xpath '{value}' is not an absolute or relative path"))
+            elif by in (By.ID, By.CLASS_NAME) and " " in value:
+                issues.append(LocatorIssue("error", name, f"{by} '{value}' contains a space"))
+            by_selector.setdefault(as_css_or_xpath(locator), []).append(name)
+        for selector, names in by_selector.items():
+            if len(names) > 1:
+                issues.append(LocatorIssue("warning", ", ".join(names),
+                                           f"same element declared {len(names)} times as {selector[1]}"))
+        return issues
+
+
+# Evaluates one selector `reps` times in the page and returns [matches, microseconds per lookup]
+PROFILE_SCRIPT = """
+const [using, value, reps] = arguments;
+const find = using === 'xpath'
+    ? () => document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength
+    : () => document.querySelectorAll(value).length;
+let matches = find();
+const start = performance.now();
+for (let i = 0; i < reps; i++) { matches = find(); }
+return [matches, (performance.now() - start) * 1000 / reps];
+"""
+
+
+class LocatorProfiler:
+    """
+    Evaluates every registered locator in the browser on saved page fixtures (HTML snapshots
+    of each page class state) and measures its lookup cost. Missing fixtures are captured from
+    the live app once, after logging in and adding a product so cart dependent elements exist.
+    """
+
+    def __init__(self, registry, fixture_dir, reps=200, slow_factor=3.0):
+        self.registry = registry
+        self.fixture_dir = Path(fixture_dir)
+        self.reps = reps
+        self.slow_factor = slow_factor
+
+    def capture_fixtures(self, driver, credentials):
+        from pages.login_page import LoginPage
+
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        login_page = LoginPage(driver)
+        login_page.go_to_login_page()
+        (self.fixture_dir / "LoginPage.html").write_text(driver.page_source, encoding="utf-8")
+        inventory_page = login_page.login(credentials["username"], credentials["password"])
+        if self.registry.products:
+            inventory_page.add_product_to_cart(self.registry.products[0])
+        for page_name, url in PAGE_URLS.items():
+            if page_name == "LoginPage" or (self.fixture_dir / f"{page_name}.html").exists():
+                continue
+            driver.get(url)
+            (self.fixture_dir / f"{page_name}.html").write_text(driver.page_source, encoding="utf-8")
+            log.info(f"Captured page fixture for {page_name}")
+
+    def profile(self, driver):
+        """
+        :return: list of result dicts (page, name, strategy, selector, matches, micros, flags)
+        """
+        results = []
+        for page_name, locators in self.registry.page_locators.items():
+            fixture = self.fixture_dir / f"{page_name}.html"
+            if not fixture.exists():
+                continue
+            driver.get(fixture.resolve().as_uri())
+            for name, locator in locators.items():
+                using, value = as_css_or_xpath(locator)
+                try:
+                    matches, micros = driver.execute_script(PROFILE_SCRIPT, using, value, self.reps)
+                except Exception as e:
+                    results.append({"page": page_name, "name": name, "strategy": locator[0], "selector": value,
+                                    "matches": None, "micros": None, "flags": [f"invalid: {e.__class__.__name__}"]})
+                    continue
+                results.append({"page": page_name, "name": name, "strategy": locator[0], "selector": value,
+                                "matches": matches, "micros": micros, "flags": []})
+
+        timings = [result["micros"] for result in results if result["micros"] is not None]
+        slow_limit = statistics.median(timings) * self.slow_factor if timings else None
+        for result in results:
+            attr = result["name"].rsplit(".", 1)[-1]
+            if result["matches"] == 0:
+                result["flags"].append("no match")
+            elif result["matches"] and result["matches"] > 1 and not attr.endswith(PLURAL_SUFFIXES):
+                result["flags"].append(f"ambiguous ({result['matches']} matches)")
+            if slow_limit and result["micros"] is not None and result["micros"] > slow_limit:
+                result["flags"].append(f"slow ({result['micros']:.1f} us)")
+        return results
+
+    @staticmethod
+    def write_report(results, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(results, report_file, indent=1)
+
+
+class LocatorCheckPlugin:
+    """
+    pytest plugin of the locator registry: checks every declaration once the tests are collected and,
+    given page fixtures, profiles the locators in the browser and reports the flagged ones in the summary.
+    Page classes are only imported by the check, not when the plugin is registered.
+    """
+
+    def __init__(self, products, fixture_dir=None, report_path=None, start_browser=None, credentials=None):
+        """
+        :param products: product names whose locators are registered
+        :param fixture_dir: folder of the saved page fixtures, None to run the static checks only
+        :param report_path: JSON file of the full profile
+        :param start_browser: callable returning a new WebDriver to profile in
+        :param credentials: user logged in to capture missing page fixtures
+        """
+        self.products = list(products)
+        self.fixture_dir = fixture_dir
+        self.report_path = report_path
+        self.start_browser = start_browser
+        self.credentials = credentials
+        self.results = None
+
+    def pytest_collection_finish(self, session):
+        registry = LocatorRegistry(products=self.products)
+        issues = registry.check()
+        for issue in issues:
+            log.warning(f"Locator {issue.severity}: {issue.name}: {issue.message}")
+        errors = [issue for issue in issues if issue.severity == "error"]
+        if errors:
+            raise pytest.UsageError("Invalid locators: " + "; ".join(f"{e.name}: {e.message}" for e in errors))
+
+        if self.fixture_dir is None or worker_id() != "master":
+            return
+        profiler = LocatorProfiler(registry, self.fixture_dir)
+        web_driver = self.start_browser()
+        try:
+            profiler.capture_fixtures(web_driver, self.credentials)
+            results = profiler.profile(web_driver)
+        finally:
+            web_driver.quit()
+        profiler.write_report(results, self.report_path)
+        self.results = results
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        terminalreporter.section("locator profile")
+        for result in sorted(self.results, key=lambda r: -(r["micros"] or 0)):
+            if result["flags"]:
+                cost = "-" if result["micros"] is None else f"{result['micros']:.1f} us"
+                terminalreporter.write_line(f"{result['page']:<22} {result['name']:<55} {cost:>10}  "
+                                            f"{', '.join(result['flags'])}")
+        terminalreporter.write_line(f"Full profile: {self.report_path}")
@@ -0,0 +1,128 @@
+# tool/memory_governor.py
+import logging
+import os
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+PROC = Path("/proc")
+
+
+def read_rss_kb(pid):
+    """
+    Reads the resident set size of one process from /proc/<pid>/status
+    :return: RSS in kB, 0 if the process is gone
+    """
+    try:
+        with open(PROC / str(pid) / "status", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _parent_pids():
+    """Maps every live pid to its parent pid using /proc/<pid>/stat"""
+    parents = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text(encoding="utf-8")
+        except OSError:
+            continue
+        # The command name is in parentheses and may contain spaces, fields after it are fixed
+        fields = stat[stat.rfind(")") + 2:].split()
+        parents[int(entry.name)] = int(fields[1])
+    return parents
+
+
+def descendant_pids(root_pid):
+    """Returns all pids below root_pid in the process tree"""
+    children = {}
+    for pid, ppid in _parent_pids().items():
+        children.setdefault(ppid, []).append(pid)
+    found, stack = [], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def driver_process_pid(driver):
+    """Pid of the local driver service process (chromedriver, geckodriver, ...), None for remote sessions"""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return getattr(process, "pid", None)
+
+
+class MemoryGovernor:
+    """
+    Samples the memory of a long-lived browser and decides when it must be recycled.
+
+    The driver RSS is read from the driver service process, the browser RSS is the sum of every
+    process below it (the browser and its renderer/GPU/content processes). Sampling needs /proc,
+    on other platforms only the test count limit applies.
+    """
+
+    def __init__(self, max_tests=None, max_rss_mb=None):
+        self.max_tests = max_tests
+        self.max_rss_mb = max_rss_mb
+        self.enabled = PROC.is_dir()
+        self.tests_since_recycle = 0
+        self.recycles = 0
+        self.samples = []  # list of (driver_mb, browser_mb)
+
+    def sample(self, driver):
+        """
+        Takes one memory sample for the driver and browser process trees
+        :return: (driver_mb, browser_mb) or None when it cannot be measured
+        """
+        pid = driver_process_pid(driver)
+        if not self.enabled or pid is None:
+            return None
+        driver_mb = read_rss_kb(pid) / 1024
+        browser_mb = sum(read_rss_kb(child) for child in descendant_pids(pid)) / 1024
+        self.samples.append((driver_mb, browser_mb))
+        log.debug(f"Memory sample: driver {driver_mb:.1f} MB, browser {browser_mb:.1f} MB")
+        return driver_mb, browser_mb
+
+    def should_recycle(self, driver):
+        """
+        Counts one finished test on the browser and checks both limits
+        :return: True when the browser should be restarted
+        """
+        self.tests_since_recycle += 1
+        sample = self.sample(driver)
+        if self.max_tests and self.tests_since_recycle >= self.max_tests:
+            log.info(f"Recycling browser after {self.tests_since_recycle} tests")
+            return True
+        if sample and self.max_rss_mb and sum(sample) >= self.max_rss_mb:
+            log.info(f"Recycling browser at {sum(sample):.1f} MB (limit {self.max_rss_mb} MB)")
+            return True
+        return False
+
+    def browser_recycled(self):
+        self.tests_since_recycle = 0
+        self.recycles += 1
+
+    def summary(self):
+        """Peak and average memory of this worker, in MB"""
+        result = {"samples": len(self.samples), "recycles": self.recycles}
+        if self.samples:
+            totals = [driver_mb + browser_mb for driver_mb, browser_mb in self.samples]
+            result.update({
+                "driver_peak_mb": round(max(s[0] for s in self.samples), 1),
+                "browser_peak_mb": round(max(s[1] for s in self.samples), 1),
+                "total_peak_mb": round(max(totals), 1),
+                "total_avg_mb": round(sum(totals) / len(totals), 1),
+            })
+        return result
+
+
+def worker_id():
+    """pytest-xdist worker name, 'master' for a non distributed run"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
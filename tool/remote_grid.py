@@ -0,0 +1,236 @@
+# tool/remote_grid.py
+import json
+import logging
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import urlparse
+
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from tool.memory_governor import worker_id
+
+log = logging.getLogger(__name__)
+
+
+class CommandStats:
+    """
+    Round trip times of WebDriver commands sent to a remote end, grouped by command name.
+    The baseline is the fastest /status round trip, i.e. the pure network cost of one request.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings = {}  # command -> list of seconds
+        self.baseline = None
+
+    def record(self, command, seconds):
+        with self.lock:
+            self.timings.setdefault(command, []).append(seconds)
+
+    def measure_baseline(self, remote_url, pings=5):
+        """
+        Pings the grid /status endpoint and keeps the fastest round trip as network baseline
+        """
+        status_url = f"{remote_url.rstrip('/')}/status"
+        best = None
+        for _ in range(pings):
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(status_url, timeout=5) as response:
+                    response.read()
+            except (urllib.error.URLError, OSError) as e:
+                log.warning(f"Could not reach {status_url}: {e}")
+                return None
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        self.baseline = best
+        return best
+
+    def summary(self):
+        """
+        :return: list of (command, count, mean_ms, p95_ms, total_ms) sorted by total time
+        """
+        rows = []
+        with self.lock:
+            for command, timings in self.timings.items():
+                ordered = sorted(timings)
+                p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+                rows.append((command, len(ordered), sum(ordered) / len(ordered) * 1000,
+                             p95 * 1000, sum(ordered) * 1000))
+        return sorted(rows, key=lambda row: row[4], reverse=True)
+
+    def total_commands(self):
+        with self.lock:
+            return sum(len(timings) for timings in self.timings.values())
+
+    def save(self, path):
+        with self.lock:
+            data = {"baseline": self.baseline, "timings": self.timings}
+            with open(path, "w", encoding="utf-8") as stats_file:
+                json.dump(data, stats_file)
+
+    @classmethod
+    def load(cls, paths):
+        """
+        Merges saved stats, e.g. of every xdist worker, the fastest baseline is kept
+        :return: CommandStats
+        """
+        stats = cls()
+        for path in paths:
+            with open(path, encoding="utf-8") as stats_file:
+                data = json.load(stats_file)
+            for command, timings in data["timings"].items():
+                stats.timings.setdefault(command, []).extend(timings)
+            if data["baseline"] is not None:
+                stats.baseline = data["baseline"] if stats.baseline is None else min(stats.baseline, data["baseline"])
+        return stats
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """
+    RemoteConnection that keeps a pool of keep-alive HTTP connections to the grid
+    and records the round trip time of every command in CommandStats.
+    """
+
+    def __init__(self, remote_url, stats, pool_size=4, timeout=None):
+        """
+        :param remote_url: grid URL, e.g. http://localhost:4444
+        :param stats: CommandStats receiving the timings
+        :param pool_size: keep-alive connections kept open to the grid
+        :param timeout: socket timeout in seconds
+        """
+        client_config = ClientConfig(
+            remote_server_addr=remote_url,
+            keep_alive=True,
+            timeout=timeout,
+            init_args_for_pool_manager={
+                # block=True waits for a free connection instead of opening throw-away ones
+                "init_args_for_pool_manager": {"maxsize": pool_size, "block": True}
+            }
+        )
+        super().__init__(client_config=client_config)
+        self.stats = stats
+        self._local = threading.local()
+
+    def execute(self, command, params):
+        self._local.command = command
+        return super().execute(command, params)
+
+    def _request(self, method, url, body=None):
+        start = time.perf_counter()
+        try:
+            return super()._request(method, url, body=body)
+        finally:
+            self.stats.record(getattr(self._local, "command", method), time.perf_counter() - start)
+
+
+class RemoteGridPlugin:
+    """
+    pytest plugin of --browser remote: starts the optional standalone server, measures the network
+    baseline, hands out pooled connections and reports the command timings in the terminal summary.
+    Every worker saves its timings to <stats_dir>/<worker>.json, the controller merges them all.
+    """
+
+    def __init__(self, remote_url, stats_dir, pool_size=4, server_jar=None):
+        """
+        :param remote_url: grid URL, e.g. http://localhost:4444
+        :param stats_dir: folder of the per worker timings
+        :param pool_size: keep-alive connections per browser session
+        :param server_jar: Selenium server jar started in standalone mode on remote_url, None for a real grid
+        """
+        self.remote_url = remote_url
+        self.stats_dir = Path(stats_dir)
+        self.pool_size = pool_size
+        self.server = StandaloneServer(server_jar, remote_url) if server_jar else None
+        self.stats = CommandStats()
+
+    def start(self):
+        if worker_id() == "master":
+            # Timings of a previous run must not end up in this run summary
+            self.stats_dir.mkdir(parents=True, exist_ok=True)
+            for old_stats in self.stats_dir.glob("*.json"):
+                old_stats.unlink()
+            if self.server is not None:
+                self.server.start()
+        self.stats.measure_baseline(self.remote_url)
+
+    def new_connection(self, timeout=None):
+        return PooledRemoteConnection(self.remote_url, self.stats, pool_size=self.pool_size, timeout=timeout)
+
+    def pytest_sessionfinish(self, session):
+        if self.stats.total_commands():
+            self.stats_dir.mkdir(parents=True, exist_ok=True)
+            self.stats.save(self.stats_dir / f"{worker_id()}.json")
+
+    def pytest_unconfigure(self, config):
+        if self.server is not None and worker_id() == "master":
+            self.server.stop()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        stats = CommandStats.load(sorted(self.stats_dir.glob("*.json")))
+        if not stats.total_commands():
+            return
+        terminalreporter.section("remote command transport")
+        if stats.baseline is not None:
+            terminalreporter.write_line(
+                f"network baseline (fastest /status round trip): {stats.baseline * 1000:.1f} ms, "
+                f"estimated network overhead: {stats.baseline * stats.total_commands():.2f} s "
+                f"over {stats.total_commands()} commands"
+            )
+        for command, count, mean_ms, p95_ms, total_ms in stats.summary():
+            terminalreporter.write_line(
+                f"{command:<32} {count:>6} calls  mean {mean_ms:8.1f} ms  p95 {p95_ms:8.1f} ms  "
+                f"total {total_ms / 1000:8.2f} s"
+            )
+
+
+class StandaloneServer:
+    """
+    Local Selenium standalone server used as a stand-in for a real grid.
+    """
+
+    def __init__(self, jar_path, remote_url, startup_timeout=60):
+        self.jar_path = jar_path
+        self.remote_url = remote_url
+        self.startup_timeout = startup_timeout
+        self.process = None
+
+    def start(self):
+        port = urlparse(self.remote_url).port or 4444
+        log.info(f"Starting Selenium standalone server on port {port}")
+        self.process = subprocess.Popen(
+            ["java", "-jar", self.jar_path, "standalone", "--port", str(port)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Selenium server exited with code {self.process.returncode}")
+            if self.is_ready():
+                log.info("Selenium standalone server is ready")
+                return
+            time.sleep(0.5)
+        self.stop()
+        raise RuntimeError(f"Selenium server not ready after {self.startup_timeout}s")
+
+    def is_ready(self):
+        try:
+            with urllib.request.urlopen(f"{self.remote_url.rstrip('/')}/status", timeout=2) as response:
+                return bool(json.loads(response.read())["value"]["ready"])
+        except (urllib.error.URLError, OSError, ValueError, KeyError):
+            return False
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            log.info("Stopping Selenium standalone server")
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
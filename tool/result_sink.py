@@ -0,0 +1,408 @@
+# tool/result_sink.py
+"""
+Streaming result sink.
+
+Every finished test is appended as one JSON line (outcome, timings, failure, captured output,
+properties and artifact references) to a results file while the run is in progress. The HTML,
+JUnit and Allure reports are rendered from that file: Allure results per test as they arrive,
+HTML and JUnit after the run in two streaming passes (counts, then rows), so no report is ever
+held in memory. Records are ordered by completion time, the order the sink appends them in, and
+results files of several shards are merged on it:
+
+    python -m tool.result_sink --html output/report.html --junit output/test_results.xml shard1.jsonl shard2.jsonl
+"""
+import argparse
+import base64
+import hashlib
+import heapq
+import html
+import json
+import logging
+import mimetypes
+import os
+import platform
+import re
+import shutil
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+import pytest
+
+log = logging.getLogger(__name__)
+
+# user_properties with these names reference files, they are attached to the reports instead of listed
+ARTIFACT_PROPERTIES = ("screenshot",)
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+# Terminal colour codes and the control characters XML 1.0 cannot hold
+UNPRINTABLE_RE = re.compile(r"\x1b\[[0-9;]*m|[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# Records a file may hold out of completion order, reports reach the controller with some jitter
+REORDER_WINDOW = 256
+ALLURE_STATUS = {"passed": "passed", "failed": "failed", "error": "broken", "skipped": "skipped",
+                 "xfailed": "skipped", "xpassed": "passed"}
+
+
+def _clean(text):
+    return UNPRINTABLE_RE.sub("", text) if text else text
+
+
+def _message(report):
+    if report.skipped and isinstance(report.longrepr, tuple):
+        return report.longrepr[2]
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None:
+        return crash.message
+    return str(report.longrepr).strip().splitlines()[-1] if report.longrepr else ""
+
+
+def build_test_record(reports):
+    """
+    One results line from the setup/call/teardown reports of a test, rerun reports of earlier attempts included
+    :param reports: TestReport list in logging order
+    :return: dict
+    """
+    final = [report for report in reports if report.outcome != "rerun"]
+    outcome, failed_report = "passed", None
+    for report in final:
+        xfail = hasattr(report, "wasxfail")
+        if report.when == "call":
+            if xfail:
+                outcome = "xfailed" if report.skipped else "xpassed"
+            elif report.failed:
+                outcome, failed_report = "failed", report
+            elif report.skipped:
+                outcome, failed_report = "skipped", report
+        elif report.failed and outcome in ("passed", "xpassed"):
+            outcome, failed_report = "error", report
+        elif report.skipped and report.when == "setup":
+            outcome, failed_report = ("xfailed" if xfail else "skipped"), report
+
+    first, last = reports[0], reports[-1]
+    # Each phase report carries the captured output and properties of the phases before it
+    output = [f"----- {title} -----\n{content}" for title, content in last.sections if content.strip()]
+    properties = [prop for prop in last.user_properties if len(prop) == 2]
+    return {
+        "type": "test",
+        "nodeid": first.nodeid,
+        "location": list(first.location),
+        "outcome": outcome,
+        "when": failed_report.when if failed_report else None,
+        "message": _clean(_message(failed_report)) if failed_report else None,
+        "longrepr": _clean(str(failed_report.longrepr)) if failed_report and failed_report.longrepr else None,
+        "duration": sum(report.duration for report in final),
+        "start": getattr(first, "start", None) or time.time(),
+        "stop": getattr(last, "stop", None) or time.time(),
+        "reruns": sum(1 for report in reports if report.outcome == "rerun" and report.when == "call"),
+        "output": _clean("\n".join(output)),
+        "properties": [[name, value] for name, value in properties if name not in ARTIFACT_PROPERTIES],
+        "artifacts": [{"name": name, "path": str(value)} for name, value in properties if name in ARTIFACT_PROPERTIES],
+    }
+
+
+def collect_error_record(report):
+    return {
+        "type": "test", "nodeid": report.nodeid, "location": [report.nodeid, None, report.nodeid],
+        "outcome": "error", "when": "collect", "message": _clean(_message(report)),
+        "longrepr": _clean(str(report.longrepr)),
+        "duration": 0.0, "start": time.time(), "stop": time.time(), "reruns": 0, "output": "",
+        "properties": [], "artifacts": [],
+    }
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as results_file:
+        for line_number, line in enumerate(results_file, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A run killed mid-write leaves a partial last line
+                log.warning(f"{path}:{line_number}: skipping unreadable result line")
+
+
+def _completion_time(record):
+    # Session records only have a start
+    return record.get("stop") or record.get("start") or 0
+
+
+def _reordered(records, window=REORDER_WINDOW):
+    """
+    Sorts records on completion time within a sliding window of `window` records, memory stays bounded
+
+    >>> [record["stop"] for record in _reordered([{"stop": 2}, {"stop": 1}, {"stop": 4}, {"stop": 3}], window=1)]
+    [1, 2, 3, 4]
+    """
+    pending = []
+    for index, record in enumerate(records):
+        heapq.heappush(pending, (_completion_time(record), index, record))
+        if len(pending) > window:
+            yield heapq.heappop(pending)[2]
+    while pending:
+        yield heapq.heappop(pending)[2]
+
+
+def read_records(*paths, kind="test"):
+    """
+    Records of one type from one or more results files, merged on their completion time without loading the files.
+    A test is appended when it finishes, so every file is already in completion order up to the small reordering
+    of reports arriving from several workers; start order would need a full sort of each file.
+    :param kind: 'test', 'session' or 'session_finish'
+    """
+    streams = [_reordered(record for record in _read_lines(path) if record.get("type") == kind) for path in paths]
+    return heapq.merge(*streams, key=_completion_time)
+
+
+def _counts(paths):
+    counts = dict.fromkeys(OUTCOMES, 0)
+    start, stop, retried, tests = None, None, 0, 0
+    for record in read_records(*paths):
+        tests += 1
+        counts[record["outcome"]] += 1
+        retried += 1 if record["reruns"] else 0
+        start = record["start"] if start is None else min(start, record["start"])
+        stop = record["stop"] if stop is None else max(stop, record["stop"])
+    return {"tests": tests, "counts": counts, "start": start or time.time(), "stop": stop or time.time(),
+            "retried": retried}
+
+
+def _write_atomically(path, write):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as out:
+        write(out)
+    os.replace(temp_path, path)
+    return path
+
+
+def _split_nodeid(nodeid):
+    """pytest's JUnit classname/name split, e.g. tests/test_a.py::TestA::test_b -> ('tests.test_a.TestA', 'test_b')"""
+    parts = nodeid.split("::")
+    module = parts[0].removesuffix(".py").replace("/", ".")
+    return ".".join([module, *parts[1:-1]]), parts[-1]
+
+
+def render_junit(paths, out_path, suite_name="pytest"):
+    summary = _counts(paths)
+    counts = summary["counts"]
+    host = next((record.get("host") for record in read_records(*paths, kind="session")), platform.node())
+
+    def write(out):
+        out.write('<?xml version="1.0" encoding="utf-8"?><testsuites name="pytest tests">')
+        out.write(
+            f'<testsuite name={quoteattr(suite_name)} errors="{counts["error"]}" '
+            f'failures="{counts["failed"]}" '
+            f'skipped="{counts["skipped"] + counts["xfailed"]}" tests="{summary["tests"]}" '
+            f'time="{summary["stop"] - summary["start"]:.3f}" '
+            f'timestamp="{datetime.fromtimestamp(summary["start"]).isoformat()}" hostname={quoteattr(host or "")}>'
+        )
+        out.write(f'<properties><property name="retried_tests" value="{summary["retried"]}" /></properties>')
+        for record in read_records(*paths):
+            classname, name = _split_nodeid(record["nodeid"])
+            out.write(f'<testcase classname={quoteattr(classname)} name={quoteattr(name)} '
+                      f'time="{record["duration"]:.3f}">')
+            properties = list(record["properties"]) + [[a["name"], a["path"]] for a in record["artifacts"]]
+            if record["reruns"]:
+                properties.append(["reruns", record["reruns"]])
+            if properties:
+                out.write("<properties>" + "".join(
+                    f'<property name={quoteattr(str(key))} value={quoteattr(str(value))} />'
+                    for key, value in properties) + "</properties>")
+            message = quoteattr(record["message"] or "")
+            details = escape(record["longrepr"] or "")
+            if record["outcome"] == "failed":
+                out.write(f"<failure message={message}>{details}</failure>")
+            elif record["outcome"] == "error":
+                out.write(f"<error message={message}>{details}</error>")
+            elif record["outcome"] in ("skipped", "xfailed"):
+                out.write(f'<skipped type="pytest.{record["outcome"]}" message={message} />')
+            if record["output"]:
+                out.write(f"<system-out>{escape(record['output'])}</system-out>")
+            out.write("</testcase>")
+        out.write("</testsuite></testsuites>")
+
+    return _write_atomically(out_path, write)
+
+
+HTML_STYLE = """
+body { font-family: Helvetica, Arial, sans-serif; font-size: 13px; color: #222; margin: 20px; }
+table { border-collapse: collapse; width: 100%; } td, th { border: 1px solid #ddd; padding: 4px 8px; text-align: left; }
+.passed, .xpassed { color: #1a7f37; } .failed, .error { color: #cf222e; } .skipped, .xfailed { color: #9a6700; }
+details pre { white-space: pre-wrap; background: #f6f8fa; padding: 8px; } img { max-width: 800px; display: block; }
+"""
+
+
+def _embedded_image(path):
+    """Image as a data URI so the report stays self-contained, or None when the file is gone"""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    mime = mimetypes.guess_type(str(path))[0] or "image/png"
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def render_html(paths, out_path, title="Test report"):
+    """Self-contained HTML report, images are embedded one test at a time"""
+    summary = _counts(paths)
+
+    def write(out):
+        out.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+                  f"<style>{HTML_STYLE}</style></head><body><h1>{html.escape(title)}</h1>")
+        out.write(f"<p>{summary['tests']} tests ran in {summary['stop'] - summary['start']:.2f}s, "
+                  f"started {datetime.fromtimestamp(summary['start']):%Y-%m-%d %H:%M:%S}. "
+                  f"Results from {', '.join(html.escape(str(path)) for path in paths)}.</p><p>")
+        out.write(", ".join(f"<span class='{outcome}'>{count} {outcome}</span>"
+                            for outcome, count in summary["counts"].items()))
+        out.write(f", {summary['retried']} retried</p>")
+        out.write("<table><tr><th>Result</th><th>Test</th><th>Duration</th><th>Reruns</th></tr>")
+        for record in read_records(*paths):
+            out.write(f"<tr><td class='{record['outcome']}'>{record['outcome']}</td>"
+                      f"<td>{html.escape(record['nodeid'])}")
+            if record["longrepr"] or record["output"] or record["artifacts"]:
+                out.write("<details><summary>details</summary>")
+                if record["longrepr"]:
+                    out.write(f"<pre>{html.escape(record['longrepr'])}</pre>")
+                for artifact in record["artifacts"]:
+                    source = _embedded_image(artifact["path"])
+                    if source:
+                        out.write(f"<img src='{source}' alt='{html.escape(artifact['name'])}'>")
+                if record["output"]:
+                    out.write(f"<pre>{html.escape(record['output'])}</pre>")
+                out.write("</details>")
+            out.write(f"</td><td>{record['duration']:.2f}s</td><td>{record['reruns']}</td></tr>")
+        out.write("</table></body></html>")
+
+    return _write_atomically(out_path, write)
+
+
+class AllureWriter:
+    """Writes one Allure result (and its attachments) per test record"""
+
+    def __init__(self, results_dir, clean=False):
+        self.results_dir = Path(results_dir)
+        if clean and self.results_dir.exists():
+            shutil.rmtree(self.results_dir)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+    def _attach(self, name, source_path=None, text=None):
+        suffix = Path(source_path).suffix if source_path else ".txt"
+        source = f"{uuid.uuid4()}-attachment{suffix}"
+        if source_path:
+            try:
+                shutil.copyfile(source_path, self.results_dir / source)
+            except OSError:
+                return None
+        else:
+            (self.results_dir / source).write_text(text, encoding="utf-8")
+        return {"name": name, "source": source,
+                "type": mimetypes.guess_type(source)[0] or "application/octet-stream"}
+
+    def write(self, record):
+        nodeid = record["nodeid"]
+        classname, name = _split_nodeid(nodeid)
+        attachments = [self._attach(artifact["name"], source_path=artifact["path"]) for artifact in record["artifacts"]]
+        if record["output"]:
+            attachments.append(self._attach("output", text=record["output"]))
+        result = {
+            "uuid": str(uuid.uuid4()),
+            "historyId": hashlib.md5(nodeid.encode("utf-8")).hexdigest(),
+            "testCaseId": hashlib.md5(nodeid.split("[")[0].encode("utf-8")).hexdigest(),
+            "fullName": f"{classname}#{name}",
+            "name": name,
+            "status": ALLURE_STATUS[record["outcome"]],
+            "statusDetails": {"message": record["message"] or "", "trace": record["longrepr"] or ""},
+            "start": int(record["start"] * 1000),
+            "stop": int(record["stop"] * 1000),
+            "labels": [{"name": "suite", "value": classname}, {"name": "framework", "value": "pytest"},
+                       {"name": "language", "value": "cpython3"}],
+            "parameters": [{"name": "reruns", "value": str(record["reruns"])}] if record["reruns"] else [],
+            "attachments": [attachment for attachment in attachments if attachment],
+        }
+        with open(self.results_dir / f"{result['uuid']}-result.json", "w", encoding="utf-8") as result_file:
+            json.dump(result, result_file)
+
+
+class ResultSink:
+    """
+    pytest plugin streaming every test result to a JSONL file, in place of the HTML, JUnit and Allure
+    plugins. Runs on the controller only, xdist workers forward their reports to it.
+    """
+
+    def __init__(self, results_path, html_path=None, junit_path=None, allure_dir=None, clean_allure=False,
+                 suite_name="pytest"):
+        self.results_path = Path(results_path)
+        self.html_path = html_path
+        self.junit_path = junit_path
+        self.allure = AllureWriter(allure_dir, clean=clean_allure) if allure_dir else None
+        self.suite_name = suite_name
+        self.rendered = []
+        self._pending = {}  # nodeid -> reports of a test still running, one per worker at most
+        self._file = None
+
+    def _append(self, record):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        if self.allure is not None and record["type"] == "test":
+            self.allure.write(record)
+
+    def pytest_sessionstart(self, session):
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.results_path, "w", encoding="utf-8")
+        self._append({"type": "session", "start": time.time(), "host": platform.node(),
+                      "args": list(session.config.invocation_params.args)})
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._append(collect_error_record(report))
+
+    def pytest_runtest_logreport(self, report):
+        reports = self._pending.setdefault(report.nodeid, [])
+        reports.append(report)
+        if report.when == "teardown" and report.outcome != "rerun":
+            self._append(build_test_record(self._pending.pop(report.nodeid)))
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        self._append({"type": "session_finish", "start": time.time(), "exitstatus": int(session.exitstatus)})
+        self._file.close()
+        if self.junit_path:
+            self.rendered.append(("junit xml", render_junit([self.results_path], self.junit_path, self.suite_name)))
+        if self.html_path:
+            self.rendered.append(("html report", render_html([self.results_path], self.html_path)))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", f"Streamed results to {self.results_path}")
+        for kind, path in self.rendered:
+            terminalreporter.write_sep("-", f"Generated {kind}: {Path(path).resolve().as_uri()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render and merge streamed test results")
+    parser.add_argument("results", nargs="+", help="Results JSONL files of one run, its workers or its shards")
+    parser.add_argument("--html", default=None, help="Write a self-contained HTML report here")
+    parser.add_argument("--junit", default=None, help="Write a JUnit XML report here")
+    parser.add_argument("--allure", default=None, help="Write Allure results into this directory")
+    parser.add_argument("--suite-name", default="pytest", help="JUnit test suite name")
+    args = parser.parse_args(argv)
+    if not (args.html or args.junit or args.allure):
+        parser.error("nothing to render, give at least one of --html, --junit or --allure")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    if args.junit:
+        log.info(f"JUnit XML written to {render_junit(args.results, args.junit, args.suite_name)}")
+    if args.html:
+        log.info(f"HTML report written to {render_html(args.results, args.html)}")
+    if args.allure:
+        writer = AllureWriter(args.allure)
+        for record in read_records(*args.results):
+            writer.write(record)
+        log.info(f"Allure results written to {args.allure}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
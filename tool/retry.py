@@ -0,0 +1,204 @@
+# tool/retry.py
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from _pytest.junitxml import xml_key
+from _pytest.runner import runtestprotocol
+
+log = logging.getLogger(__name__)
+
+HISTORY_SIZE = 20
+PASSED, FAILED, FLAKY = "P", "F", "R"  # FLAKY = passed after at least one retry
+
+
+def report_retries(report):
+    """Number of retries recorded on a report by RetryPlugin, 0 if it passed or failed at once"""
+    return dict(report.user_properties).get("retries", 0)
+
+
+class FlakeStats:
+    """
+    Per test outcome history kept across runs in a JSON file, used to quarantine chronically flaky tests.
+    """
+
+    def __init__(self, path, flaky_rate=0.3, min_runs=5):
+        self.path = Path(path)
+        self.flaky_rate = flaky_rate
+        self.min_runs = min_runs
+        self.history = self._load()
+        self.outcomes = {}  # outcomes of the current run, merged into the file at the end
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as stats_file:
+                return json.load(stats_file)
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, nodeid, outcome):
+        self.outcomes[nodeid] = outcome
+
+    def is_quarantined(self, nodeid):
+        history = self.history.get(nodeid, [])
+        if len(history) < self.min_runs:
+            return False
+        return history.count(FLAKY) / len(history) >= self.flaky_rate
+
+    def save(self):
+        """
+        Merges the outcomes of this run into the file. The file is re-read first because
+        the main and quarantine lanes update it from two processes.
+        """
+        if not self.outcomes:
+            return
+        history = self._load()
+        for nodeid, outcome in self.outcomes.items():
+            history[nodeid] = (history.get(nodeid, []) + [outcome])[-HISTORY_SIZE:]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as stats_file:
+            json.dump(history, stats_file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.history = history
+
+
+class RetryPlugin:
+    """
+    Reruns failed tests up to retry_count times, retry_delay seconds apart, and selects the tests of a lane.
+
+    Every attempt is torn down up to the next test like a normal run, so what the next test shares
+    (e.g. the session browser of --isolation reuse/context) stays up for the rerun. The last test of
+    the session keeps its session fixtures until pytest tears them down at the end of the session.
+    Intermediate failures are logged with the 'rerun' outcome, which pytest-html shows as reruns and
+    Allure as retries; final reports carry a 'retries' property.
+    """
+
+    def __init__(self, retry_count, retry_delay, stats, lane="all"):
+        """
+        :param lane: 'main' leaves quarantined tests out, 'quarantine' runs only them, 'all' runs everything
+        """
+        self.retry_count = retry_count
+        self.retry_delay = retry_delay
+        self.stats = stats
+        self.lane = lane
+        self.retried = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        # trylast: runs on what -k, -m and --changed-since left
+        if self.lane == "all":
+            return
+        selected, deselected = [], []
+        for item in items:
+            in_quarantine = self.stats.is_quarantined(item.nodeid)
+            (selected if in_quarantine == (self.lane == "quarantine") else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        if self.lane == "main" and deselected:
+            log.warning(f"{len(deselected)} quarantined flaky tests left out of the main lane")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self.retry_count <= 0:
+            return None
+
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for attempt in range(self.retry_count + 1):
+            last_attempt = attempt == self.retry_count
+            # nextitem None would tear the session down before a rerun
+            reports = runtestprotocol(
+                item, log=False, nextitem=nextitem if last_attempt or nextitem is not None else item.parent
+            )
+            failed = any(report.failed for report in reports if report.when != "teardown")
+            if not failed or last_attempt:
+                for report in reports:
+                    if attempt:
+                        report.user_properties.append(("retries", attempt))
+                    item.ihook.pytest_runtest_logreport(report=report)
+                if attempt:
+                    self.retried[item.nodeid] = attempt
+                break
+
+            for report in reports:
+                if report.when == "teardown":
+                    break
+                if report.failed:
+                    report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+            log.warning(f"Test '{item.name}' failed on attempt {attempt + 1}, "
+                        f"retrying in {self.retry_delay}s")
+            time.sleep(self.retry_delay)
+
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_runtest_logreport(self, report):
+        # Runs on the controller for xdist too, so the flake history sees every worker
+        if report.outcome == "rerun":
+            return
+        if report.when == "call" or (report.when == "setup" and not report.passed):
+            if report.failed:
+                self.stats.record(report.nodeid, FAILED)
+            elif report.passed:
+                self.stats.record(report.nodeid, FLAKY if report_retries(report) else PASSED)
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        if report.when == "call" and report.passed and report_retries(report):
+            return "flaky", "f", ("FLAKY", {"yellow": True})
+        return None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        # tryfirst: the JUnit plugin writes its file in its own sessionfinish
+        if hasattr(session.config, "workerinput"):
+            # xdist worker, the controller sees all reports and keeps the history
+            return
+        xml = session.config.stash.get(xml_key, None)
+        if xml is not None:
+            xml.add_global_property("retried_tests", len(self.retried))
+            for nodeid, retries in self.retried.items():
+                xml.add_global_property(f"retries::{nodeid}", retries)
+        self.stats.save()
+
+
+class QuarantineLane:
+    """
+    Runs the quarantined tests in a second pytest process next to the main run,
+    with its own report, JUnit and Allure output.
+    """
+
+    def __init__(self, args, output_dir):
+        self.args = [arg for arg in args if arg != "--with-quarantine"]
+        self.output_dir = Path(output_dir)
+        self.process = None
+        self.console = None
+
+    def start(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        command = [
+            sys.executable, "-m", "pytest", *self.args,
+            "--lane", "quarantine",
+            f"--html={self.output_dir / 'report.html'}",
+            f"--junitxml={self.output_dir / 'test_results.xml'}",
+            "--alluredir", str(self.output_dir / "allure-results"),
+        ]
+        log.info(f"Starting quarantine lane: {' '.join(command)}")
+        self.console = open(self.output_dir / "console.log", "w", encoding="utf-8")
+        self.process = subprocess.Popen(command, stdout=self.console, stderr=subprocess.STDOUT)
+
+    def wait(self):
+        """:return: exit code of the quarantine lane"""
+        if self.process is None:
+            return None
+        exit_code = self.process.wait()
+        self.console.close()
+        return exit_code
@@ -0,0 +1,122 @@
+# tool/scenarios.py
+"""
+Combinatorial scenario reduction for data-driven tests.
+
+Builds an n-wise covering array over catalogs such as tests.data.User, Products and CheckoutInfo:
+every combination of values of any `strength` parameters appears in at least one scenario,
+with far fewer scenarios than the full cross product. Generation is greedy and fully
+deterministic, so every worker or shard of a run collects the same scenarios.
+"""
+from itertools import combinations, product
+
+import pytest
+
+
+def catalog(cls, include=None, exclude=()):
+    """
+    Upper-case attributes of a data class in declaration order, e.g. catalog(User)
+
+    >>> class Colors:
+    ...     RED = "r"
+    ...     GREEN = "g"
+    ...     BLUE = "b"
+    >>> catalog(Colors, exclude=("GREEN",))
+    {'RED': 'r', 'BLUE': 'b'}
+    """
+    return {
+        name: value for name, value in vars(cls).items()
+        if name.isupper() and name not in exclude and (include is None or name in include)
+    }
+
+
+def _interactions(sizes, strength):
+    """All value combinations of every group of `strength` parameters, as ((param, value), ...) tuples"""
+    needed = set()
+    for params in combinations(range(len(sizes)), strength):
+        for values in product(*(range(sizes[param]) for param in params)):
+            needed.add(tuple(zip(params, values)))
+    return needed
+
+
+def _covered_by(row, strength):
+    return {tuple((param, row[param]) for param in params)
+            for params in combinations(range(len(row)), strength)}
+
+
+def covering_array(parameters, strength=2, pinned=()):
+    """
+    Builds the scenario rows of an n-wise covering array.
+    :param parameters: {parameter name: list of value names}, in a fixed order
+    :param strength: 2 for pairwise, 3 for 3-wise, ... (capped at the number of parameters)
+    :param pinned: must-run scenarios as {parameter name: value name} dicts, always included first
+    :return: list of {parameter name: value name} dicts
+
+    >>> rows = covering_array({"a": ["a1", "a2"], "b": ["b1", "b2"], "c": ["c1", "c2"]})
+    >>> len(rows)
+    4
+    >>> rows[0]
+    {'a': 'a1', 'b': 'b1', 'c': 'c1'}
+    """
+    names = list(parameters)
+    values = [list(parameters[name]) for name in names]
+    sizes = [len(options) for options in values]
+    strength = max(1, min(strength, len(names)))
+    uncovered = _interactions(sizes, strength)
+    rows = []
+
+    for pin in pinned:
+        unknown = set(pin) - set(names)
+        if unknown:
+            raise ValueError(f"Pinned scenario {pin} uses unknown parameters {sorted(unknown)}")
+        missing = set(names) - set(pin)
+        if missing:
+            raise ValueError(f"Pinned scenario {pin} must give a value for {sorted(missing)}")
+        for param, name in enumerate(names):
+            if pin[name] not in values[param]:
+                raise ValueError(f"Pinned scenario {pin} uses unknown value {pin[name]!r} for '{name}', "
+                                 f"available: {', '.join(map(str, values[param]))}")
+        row = tuple(values[param].index(pin[name]) for param, name in enumerate(names))
+        rows.append(row)
+        uncovered -= _covered_by(row, strength)
+
+    while uncovered:
+        # Seed the row with the first uncovered interaction so every pass makes progress
+        seed = min(uncovered)
+        row = [None] * len(names)
+        for param, value in seed:
+            row[param] = value
+        for param in range(len(names)):
+            if row[param] is not None:
+                continue
+            best_value, best_gain = 0, -1
+            for value in range(sizes[param]):
+                row[param] = value
+                assigned = [index for index, item in enumerate(row) if item is not None]
+                gain = sum(
+                    1 for params in combinations(assigned, strength) if param in params
+                    and tuple((index, row[index]) for index in params) in uncovered
+                )
+                if gain > best_gain:
+                    best_value, best_gain = value, gain
+            row[param] = best_value
+        row = tuple(row)
+        rows.append(row)
+        uncovered -= _covered_by(row, strength)
+
+    return [{name: values[param][value] for param, (name, value) in enumerate(zip(names, row))} for row in rows]
+
+
+def scenario_params(catalogs, strength=2, pinned=()):
+    """
+    pytest.param list for @pytest.mark.parametrize, one per covering-array scenario.
+    :param catalogs: {argument name: catalog dict}, e.g. {"user": catalog(User), "product": catalog(Products)}
+    :param strength: interaction strength, 2 for pairwise
+    :param pinned: must-run scenarios as {argument name: catalog key} dicts
+    :return: list of pytest.param with the catalog values in the order of `catalogs` and the keys as id
+    """
+    rows = covering_array({name: list(entries) for name, entries in catalogs.items()}, strength, pinned)
+    return [
+        pytest.param(*(catalogs[name][row[name]] for name in catalogs),
+                     id="-".join(row[name].lower() for name in catalogs))
+        for row in rows
+    ]
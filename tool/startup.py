@@ -0,0 +1,119 @@
+# tool/startup.py
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+DOCTEST_RE = re.compile(rb"^\s*>>>", re.MULTILINE)
+
+
+def process_age():
+    """
+    Seconds since this process started, i.e. interpreter and pytest plugin start up before the call (Linux only)
+    :return: float, or None when /proc is not available
+    """
+    try:
+        with open("/proc/self/stat", encoding="utf-8") as stat_file:
+            # Fields after the parenthesised command name, starttime is field 22 of the whole line
+            start_ticks = int(stat_file.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", encoding="utf-8") as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+
+
+class DoctestScope:
+    """
+    Decides which modules --doctest-modules has to import and search: only files with a '>>>' prompt
+    line can hold doctests. Answers are cached per file (mtime and size) between runs.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = Path(cache_path)
+        self.scanned = 0
+        self.cached = 0
+        self.skipped = 0
+        self._changed = False
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                self._cache = json.load(cache_file)
+        except (OSError, ValueError):
+            self._cache = {}
+
+    def has_doctests(self, path):
+        path = Path(path)
+        stat = path.stat()
+        key = str(path.resolve())
+        entry = self._cache.get(key)
+        if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+            self.cached += 1
+            found = entry[2]
+        else:
+            self.scanned += 1
+            found = bool(DOCTEST_RE.search(path.read_bytes()))
+            self._cache[key] = [stat.st_mtime_ns, stat.st_size, found]
+            self._changed = True
+        if not found:
+            self.skipped += 1
+        return found
+
+    def save(self):
+        if not self._changed:
+            return
+        # Files removed since they were cached are dropped
+        self._cache = {key: entry for key, entry in self._cache.items() if Path(key).exists()}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(self._cache, cache_file)
+        os.replace(temp_path, self.cache_path)
+        self._changed = False
+
+
+class StartupProfile:
+    """
+    Wall clock time of the start up phases of a run, in seconds:
+    'interpreter' (process start until conftest.py is imported), 'conftest_import', 'configure',
+    'collection' and 'first_test' (end of collection until the first test starts)
+    """
+
+    PHASES = ("interpreter", "conftest_import", "configure", "collection", "first_test")
+
+    def __init__(self, interpreter, conftest_import, modules_imported):
+        self.phases = {"interpreter": interpreter, "conftest_import": conftest_import}
+        self.modules_imported = modules_imported
+        self.collected = 0
+        self._started = {}
+
+    def start(self, phase):
+        self._started[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        started = self._started.pop(phase, None)
+        if started is not None and phase not in self.phases:
+            self.phases[phase] = time.perf_counter() - started
+
+    def total(self):
+        return sum(seconds for seconds in self.phases.values() if seconds is not None)
+
+    def to_dict(self):
+        return {"phases": self.phases, "total": self.total(), "modules_imported": self.modules_imported,
+                "collected": self.collected}
+
+    def write(self, path):
+        """
+        Writes this profile and returns the one of the previous run, to show regressions
+        :return: previous profile dict, or None
+        """
+        path = Path(path)
+        try:
+            with open(path, encoding="utf-8") as profile_file:
+                previous = json.load(profile_file)
+        except (OSError, ValueError):
+            previous = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2)
+        return previous
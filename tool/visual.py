@@ -0,0 +1,129 @@
+# tool/visual.py
+import hashlib
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class VisualResult:
+    name: str
+    passed: bool
+    diff_ratio: float = 0.0
+    compared: str = "pixels"  # 'new baseline', 'digest' or 'pixels'
+    diff_path: Path = None
+
+
+class _Baseline:
+    """Decoded baseline kept in memory for the rest of the session"""
+
+    def __init__(self, png, pixels):
+        self.digest = hashlib.blake2b(png, digest_size=16).digest()
+        self.pixels = pixels
+
+
+def _decode(png):
+    import numpy as np
+    from PIL import Image
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGB"))
+
+
+class VisualChecker:
+    """
+    Compares page or element screenshots against stored baselines.
+
+    Identical PNG bytes (the usual case for an unchanged screen, the browser encodes
+    deterministically) pass on their digest without decoding. Anything else goes through a
+    vectorized per-pixel diff with a colour tolerance and masked regions. Missing baselines are recorded from the current screenshot. Only diff images of failed
+    checkpoints are written.
+    """
+
+    def __init__(self, baseline_dir="baselines/visual", diff_dir="output/visual_diffs", enabled=False,
+                 update_baselines=False, pixel_tolerance=16, max_diff_ratio=0.001):
+        self.baseline_dir = Path(baseline_dir)
+        self.diff_dir = Path(diff_dir)
+        self.enabled = enabled
+        self.update_baselines = update_baselines
+        self.pixel_tolerance = pixel_tolerance
+        self.max_diff_ratio = max_diff_ratio
+        self._baselines = {}
+
+    def configure(self, **settings):
+        for key, value in settings.items():
+            if not hasattr(self, key):
+                raise AttributeError(f"Unknown visual setting '{key}'")
+            setattr(self, key, value)
+        self._baselines.clear()
+
+    def _baseline_path(self, name):
+        return self.baseline_dir / f"{name}.png"
+
+    def _load_baseline(self, name):
+        if name not in self._baselines:
+            path = self._baseline_path(name)
+            if self.update_baselines or not path.exists():
+                return None
+            png = path.read_bytes()
+            pixels = _decode(png)
+            self._baselines[name] = _Baseline(png, pixels)
+        return self._baselines[name]
+
+    def _save_baseline(self, name, png, pixels):
+        path = self._baseline_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(png)
+        self._baselines[name] = _Baseline(png, pixels)
+        log.info(f"Visual baseline '{name}' saved at {path}")
+
+    def check(self, png, name, masks=()):
+        """
+        Compares one screenshot with the baseline of the same name
+        :param png: screenshot bytes
+        :param name: checkpoint name, also the baseline file name
+        :param masks: (x, y, width, height) regions in screenshot pixels ignored by the pixel diff
+        :return: VisualResult
+        """
+        import numpy as np
+
+        baseline = self._load_baseline(name)
+        if baseline is not None and hashlib.blake2b(png, digest_size=16).digest() == baseline.digest:
+            return VisualResult(name, True, compared="digest")
+
+        pixels = _decode(png)
+        if baseline is None:
+            self._save_baseline(name, png, pixels)
+            return VisualResult(name, True, compared="new baseline")
+
+        if baseline.pixels.shape != pixels.shape:
+            log.error(f"Visual checkpoint '{name}': size {pixels.shape[1]}x{pixels.shape[0]} differs from "
+                      f"baseline {baseline.pixels.shape[1]}x{baseline.pixels.shape[0]}")
+            return VisualResult(name, False, 1.0, diff_path=self._write_diff(name, pixels, None))
+
+        changed = (np.abs(pixels.astype(np.int16) - baseline.pixels.astype(np.int16)).max(axis=2)
+                   > self.pixel_tolerance)
+        for x, y, width, height in masks:
+            changed[max(0, int(y)):int(y + height), max(0, int(x)):int(x + width)] = False
+        diff_ratio = float(changed.mean())
+        if diff_ratio <= self.max_diff_ratio:
+            return VisualResult(name, True, diff_ratio)
+        log.error(f"Visual checkpoint '{name}': {diff_ratio:.2%} of the pixels differ from the baseline")
+        return VisualResult(name, False, diff_ratio, diff_path=self._write_diff(name, pixels, changed))
+
+    def _write_diff(self, name, pixels, changed):
+        """Writes the screenshot with changed pixels in red, or the plain screenshot when sizes differ"""
+        from PIL import Image
+
+        diff = pixels.copy()
+        if changed is not None:
+            diff[changed] = (255, 0, 0)
+        self.diff_dir.mkdir(parents=True, exist_ok=True)
+        diff_path = self.diff_dir / f"{name}_diff.png"
+        Image.fromarray(diff).save(diff_path)
+        return diff_path
+
+
+# Shared by all page objects, configured from the command line in conftest.py
+visual_checker = VisualChecker()